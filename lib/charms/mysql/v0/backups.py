@@ -107,7 +107,7 @@ S3_INTEGRATOR_RELATION_NAME = "s3-parameters"
 # The unique Charmhub library identifier, never change it
 LIBID = "183844304be247129572309a5fb1e47c"
 LIBAPI = 0
-LIBPATCH = 19
+LIBPATCH = 20
 
 PYDEPS = ["mysql_shell_client ~= 0.6"]
 
@@ -268,7 +268,7 @@ class MySQLBackups(Object):
             event.fail("S3 relation is blocked for write")
             return False
 
-        if not self.charm._mysql.is_mysqld_running():
+        if not self.charm.is_mysqld_alive():
             logger.error(f"Backup failed: process mysqld is not running on {self.charm.unit.name}")
             event.fail("Process mysqld not running")
             return False
@@ -395,11 +395,12 @@ class MySQLBackups(Object):
         logger.info("Checking state and role of unit")
 
         try:
-            role = self.charm._mysql.get_member_role()
-            state = self.charm._mysql.get_member_state()
+            health = self.charm.get_member_health()
         except MySQLUnableToGetMemberStateError:
             return False, "Error obtaining member state"
 
+        role, state = health.role, health.state
+
         if role == InstanceRole.PRIMARY and self.charm.app.planned_units() > 1:
             return False, "Unit cannot perform backups as it is the cluster primary"
 
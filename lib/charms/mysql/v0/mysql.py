@@ -57,23 +57,29 @@ error handling on the subclass and in the charm code.
 """
 
 import configparser
+import copy
 import hashlib
 import io
 import json
 import logging
 import os
+import queue
 import re
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from contextlib import contextmanager, suppress
+from contextlib import contextmanager, nullcontext, suppress
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Generator,
     Literal,
+    NamedTuple,
     Type,
+    TypeVar,
     get_args,
 )
 
@@ -118,14 +124,19 @@ from mysql_shell.models.statement import VariableScope as Scope
 from ops.charm import ActionEvent, CharmBase, RelationBrokenEvent
 from ops.model import Unit
 from tenacity import (
+    RetryCallState,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_fixed,
-    wait_random,
 )
 from utils import generate_random_password
 
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -136,7 +147,7 @@ LIBID = "8c1428f06b1b4ec8bf98b7d980a38a8c"
 
 # Increment this major API version when introducing breaking changes
 LIBAPI = 0
-LIBPATCH = 100
+LIBPATCH = 132
 
 PYDEPS = ["mysql_shell_client ~= 0.6"]
 
@@ -147,10 +158,45 @@ BYTES_1GiB = 1073741824  # 1 gibibyte
 BYTES_1GB = 1000000000  # 1 gigabyte
 BYTES_1MB = 1000000  # 1 megabyte
 BYTES_1MiB = 1048576  # 1 mebibyte
-RECOVERY_CHECK_TIME = 10  # seconds
+INNODB_PAGE_SIZE = 16384  # default innodb_page_size
+BUFFER_POOL_CHUNK_SIZE_MIN = 16 * BYTES_1MiB
+BUFFER_POOL_MAX_CHUNKS = 1000
+BUFFER_POOL_RESIZE_CHECK_TIME = 5  # seconds
+BUFFER_POOL_RESIZE_TIMEOUT = 10 * 60  # seconds
+REDO_LOG_CAPACITY_MIN = 100 * BYTES_1MiB  # MySQL default
+REDO_LOG_CAPACITY_MAX = 32 * BYTES_1GiB
+REDO_LOG_WRITE_WINDOW = 30 * 60  # seconds of writes held by the redo log
+RECOVERY_CHECK_TIME = 2  # seconds
 GET_MEMBER_ROLE_TIME = 10  # seconds
 GET_MEMBER_STATE_TIME = 10  # seconds
+# Upper bounds of the executor call duration histogram buckets
+EXECUTOR_CALL_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)  # seconds
+# MySQLBase helpers issuing executor calls on behalf of their callers
+EXECUTOR_CALL_HELPERS = frozenset({"_sql_batch", "_fetch_cluster_status"})
+CLUSTER_STATUS_SNAPSHOT_TTL = 5  # seconds
+PEER_PROBE_MAX_WORKERS = 8
+MAX_CONCURRENT_JOINS = 4
+LOCK_LEASE_DURATION = 5 * 60  # seconds
+LOCK_LEASE_RENEWAL_INTERVAL = 60  # seconds
+# Waiting units refresh their ticket when retrying on update-status, every 5 minutes by
+# default, and tickets missing a few of these retries no longer hold their place
+UPDATE_STATUS_INTERVAL = 5 * 60  # seconds
+LOCK_QUEUE_TICKET_TIMEOUT = 3 * UPDATE_STATUS_INTERVAL
+LOCK_QUEUE_TICKET_RETENTION = 30 * 60  # seconds
+CLONE_MAX_CONCURRENCY = 16
+CLONE_VARIABLES = (
+    "clone_max_concurrency",
+    "clone_buffer_size",
+    "clone_max_data_bandwidth",
+    "clone_max_network_bandwidth",
+    "clone_enable_compression",
+)
+# Errors of failed connection attempts, reported by both MySQL Shell and connector
+CONNECT_FAILURE_PATTERN = re.compile(r"Can't connect to MySQL server on|Unknown MySQL server host")
+MISSING_TABLE_PATTERN = re.compile(r"Table '[^']+' doesn't exist")
 MAX_CONNECTIONS_FLOOR = 10
+# Up to 3 connections for the metrics exporter and 1 for the health snapshot writer
+MONITORING_USER_MAX_CONNECTIONS = 4
 MIM_MEM_BUFFERS = 200 * BYTES_1MiB
 ADMIN_PORT = 33062
 
@@ -186,6 +232,8 @@ APP_SCOPE = "app"
 UNIT_SCOPE = "unit"
 Scopes = Literal["app", "unit"]
 
+T = TypeVar("T")
+
 
 class Error(Exception):
     """Base class for exceptions in this module."""
@@ -436,6 +484,640 @@ class MySQLClusterMetadataExistsError(Error):
     """Exception raised when there is an issue checking if cluster metadata exists."""
 
 
+class MySQLGetLockHoldersError(Error):
+    """Exception raised when there is an issue getting the topology lock holders."""
+
+
+class MySQLUpdateUserMaxConnectionsError(Error):
+    """Exception raised when there is an issue updating the connections limit of a user."""
+
+
+class MemberHealth(NamedTuple):
+    """Health of the local group replication member, as seen by itself."""
+
+    role: str
+    state: str
+    primary_address: str | None
+    member_count: int
+    online_member_count: int
+
+
+class RecoveryProgress(NamedTuple):
+    """Progress of the local member recovery, in cloned bytes or applied transactions."""
+
+    stage: str
+    done: int
+    total: int
+    speed: float | None = None  # per second
+
+    @property
+    def eta(self) -> float | None:
+        """Seconds left at the current speed, None when unknown."""
+        if not self.speed or self.speed < 0:
+            return None
+
+        return max(self.total - self.done, 0) / self.speed
+
+
+class RedoLogStatus(NamedTuple):
+    """Redo log usage of the instance, from its Innodb_redo_log_% status variables."""
+
+    capacity: int
+    buffer_pool_size: int
+    current_lsn: int
+    checkpoint_lsn: int
+    resize_status: str
+
+    @property
+    def checkpoint_age(self) -> int:
+        """Bytes of redo written since the last checkpoint."""
+        return max(self.current_lsn - self.checkpoint_lsn, 0)
+
+
+class StorageProbe(NamedTuple):
+    """Write performance of the data volume, measured before the first start."""
+
+    random_write_iops: int
+    fsync_latency: float  # seconds
+    sequential_throughput: int  # bytes per second
+
+
+class ClusterStatusSnapshot:
+    """Short-lived cache of cluster status documents.
+
+    Entries are keyed by (cluster name, source instance, extended flag), expire after
+    a few seconds, and must be invalidated by any operation changing the topology.
+    """
+
+    def __init__(self, ttl: float = CLUSTER_STATUS_SNAPSHOT_TTL):
+        self._ttl = ttl
+        self._entries: dict[tuple, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> dict | None:
+        """Get a copy of the cached status, if not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+
+            timestamp, status = entry
+            if time.monotonic() - timestamp > self._ttl:
+                del self._entries[key]
+                return None
+
+        return copy.deepcopy(status)
+
+    def put(self, key: tuple, status: dict) -> None:
+        """Cache a copy of the status."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(status))
+
+    def invalidate(self) -> None:
+        """Discard all the cached statuses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class QueuedLockingQueryBuilder(CharmLockingQueryBuilder):
+    """Locking query builder, granting leased locks in arrival order through a ticket queue.
+
+    Locks may have several slots, acting as a counting semaphore. Each slot is a row
+    of the locking table, the first one being the task lock itself, for units only
+    aware of it to keep being accounted for.
+
+    Units take a ticket in the queue table once, refreshing it on every attempt and
+    lease renewal, and only the units with one of the first tickets may take a slot.
+    Tickets not refreshed in time, e.g. of departed units, are skipped by the units
+    behind them. Tickets are removed on release, or once not refreshed for a long while.
+
+    Acquired slots come with a lease in the lease table, renewed by the holder. Slots
+    whose lease was not renewed in time are taken over, and their holder ticket dropped.
+    So are held slots without lease, left by units that failed while acquiring them.
+    """
+
+    def __init__(
+        self,
+        table_schema: str,
+        table_name: str,
+        queue_table_name: str,
+        lease_table_name: str,
+        ticket_timeout: int,
+        ticket_retention: int,
+        lease_duration: int,
+    ):
+        """Initialize the query builder."""
+        super().__init__(table_schema, table_name)
+        schema = self._quoter.quote_identifier(table_schema)
+        self._queue_table = f"{schema}.{self._quoter.quote_identifier(queue_table_name)}"
+        self._lease_table = f"{schema}.{self._quoter.quote_identifier(lease_table_name)}"
+        self._ticket_timeout = int(ticket_timeout)
+        self._ticket_retention = int(ticket_retention)
+        self._lease_duration = int(lease_duration)
+
+    @staticmethod
+    def slot_tasks(task: str, slots: int) -> list[str]:
+        """Task names of the slots, e.g. unit-add, unit-add-2 and unit-add-3 for 3 slots."""
+        return [task, *(f"{task}-{slot}" for slot in range(2, slots + 1))]
+
+    def _slots_condition(self, task: str, slots: int) -> str:
+        tasks = ", ".join(self._quoter.quote_value(slot) for slot in self.slot_tasks(task, slots))
+        return f"task IN ({tasks})"
+
+    def _expired_leases_query(self, column: str) -> str:
+        query = (
+            "SELECT {column} FROM {table} "
+            "WHERE renewed_at < CURRENT_TIMESTAMP - INTERVAL {duration} SECOND"
+        )
+
+        return query.format(column=column, table=self._lease_table, duration=self._lease_duration)
+
+    def build_support_tables_creation_queries(self) -> list[str]:
+        """Builds the queue and lease tables creation queries."""
+        queue_query = (
+            "CREATE TABLE IF NOT EXISTS {table} ( "
+            "    ticket BIGINT UNSIGNED AUTO_INCREMENT, "
+            "    task VARCHAR(20), "
+            "    executor VARCHAR(20), "
+            "    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "    PRIMARY KEY(ticket), "
+            "    UNIQUE KEY(task, executor) "
+            ")"
+        )
+        lease_query = (
+            "CREATE TABLE IF NOT EXISTS {table} ( "
+            "    task VARCHAR(20), "
+            "    executor VARCHAR(20), "
+            "    acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "    renewed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "    PRIMARY KEY(task) "
+            ")"
+        )
+
+        return [
+            queue_query.format(table=self._queue_table),
+            lease_query.format(table=self._lease_table),
+        ]
+
+    def build_expire_tickets_query(self) -> str:
+        """Builds the query removing the abandoned tickets, and those of expired lease holders."""
+        query = (
+            "DELETE FROM {table} "
+            "WHERE updated_at < CURRENT_TIMESTAMP - INTERVAL {retention} SECOND "
+            "OR executor IN ({expired})"
+        )
+
+        return query.format(
+            table=self._queue_table,
+            retention=self._ticket_retention,
+            expired=self._expired_leases_query("executor"),
+        )
+
+    def build_enqueue_queries(self, task: str, instance: str) -> list[str]:
+        """Builds the queries taking or refreshing a ticket, and storing its queue position.
+
+        The position, i.e. the number of refreshed tickets ahead, is stored in
+        @juju_queue_position.
+        """
+        enqueue_query = (
+            "INSERT INTO {table} (task, executor) VALUES ({task}, {instance}) "
+            "ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP"
+        )
+        position_query = (
+            "SELECT COUNT(*) INTO @juju_queue_position FROM {table} "
+            "WHERE task = {task} "
+            "AND updated_at >= CURRENT_TIMESTAMP - INTERVAL {timeout} SECOND AND ticket < "
+            "(SELECT ticket FROM {table} WHERE task = {task} AND executor = {instance})"
+        )
+
+        return [
+            query.format(
+                table=self._queue_table,
+                task=self._quoter.quote_value(task),
+                instance=self._quoter.quote_value(instance),
+                timeout=self._ticket_timeout,
+            )
+            for query in (enqueue_query, position_query)
+        ]
+
+    def build_dequeue_query(self, task: str, instance: str) -> str:
+        """Builds the query removing a ticket."""
+        query = "DELETE FROM {table} WHERE task = {task} AND executor = {instance}"
+
+        return query.format(
+            table=self._queue_table,
+            task=self._quoter.quote_value(task),
+            instance=self._quoter.quote_value(instance),
+        )
+
+    def build_slots_creation_query(self, task: str, slots: int) -> str:
+        """Builds the query creating the missing slot rows, keeping the existing ones."""
+        values = ", ".join(
+            f"({self._quoter.quote_value(slot)}, '', 'not-started')"
+            for slot in self.slot_tasks(task, slots)
+        )
+        query = "INSERT IGNORE INTO {table} (task, executor, status) VALUES {values}"
+
+        return query.format(table=self._table, values=values)
+
+    def build_acquire_slot_queries(self, task: str, instance: str, slots: int) -> list[str]:
+        """Builds the transaction acquiring the first free or expired slot, and leasing it.
+
+        The slot is only acquired if the instance ticket is one of the first `slots`,
+        and if the instance does not already hold one.
+        """
+        held_query = (
+            "SELECT COUNT(*) INTO @juju_held_slots FROM {table} "
+            "WHERE {condition} AND executor = {instance}"
+        )
+        acquire_query = (
+            "UPDATE {table} "
+            "SET status = {status}, executor = {instance} "
+            "WHERE {condition} "
+            "AND (executor = '' OR task IN ({expired}) "
+            "OR task NOT IN (SELECT task FROM {lease_table})) "
+            "AND @juju_held_slots = 0 AND @juju_queue_position < {slots} "
+            "ORDER BY task LIMIT 1"
+        )
+        # Leases of re-acquired slots keep their acquisition time. Columns are qualified,
+        # both tables having an executor column
+        lease_query = (
+            "INSERT INTO {lease_table} (task, executor) "
+            "SELECT slots.task, slots.executor FROM {table} AS slots "
+            "WHERE {condition} AND slots.executor = {instance} "
+            "ON DUPLICATE KEY UPDATE "
+            "    acquired_at = IF({lease_table}.executor = slots.executor, "
+            "{lease_table}.acquired_at, CURRENT_TIMESTAMP), "
+            "    {lease_table}.executor = slots.executor, "
+            "    renewed_at = CURRENT_TIMESTAMP"
+        )
+
+        queries = [
+            query.format(
+                table=self._table,
+                lease_table=self._lease_table,
+                condition=self._slots_condition(task, slots),
+                instance=self._quoter.quote_value(instance),
+                status=self._quoter.quote_value("in-progress"),
+                expired=self._expired_leases_query("task"),
+                slots=int(slots),
+            )
+            for query in (held_query, acquire_query, lease_query)
+        ]
+        # Slots are never left held without lease
+        return ["START TRANSACTION", *queries, "COMMIT"]
+
+    def build_renew_lease_queries(self, task: str, instance: str, slots: int) -> list[str]:
+        """Builds the queries renewing the holder lease, and refreshing its ticket."""
+        lease_query = (
+            "UPDATE {lease_table} SET renewed_at = CURRENT_TIMESTAMP "
+            "WHERE {condition} AND executor = {instance}"
+        )
+        ticket_query = (
+            "UPDATE {queue_table} SET updated_at = CURRENT_TIMESTAMP "
+            "WHERE task = {task} AND executor = {instance}"
+        )
+
+        return [
+            query.format(
+                lease_table=self._lease_table,
+                queue_table=self._queue_table,
+                condition=self._slots_condition(task, slots),
+                task=self._quoter.quote_value(task),
+                instance=self._quoter.quote_value(instance),
+            )
+            for query in (lease_query, ticket_query)
+        ]
+
+    def build_fetch_acquired_slots_query(self, task: str, slots: int) -> str:
+        """Builds the acquired slots fetch query."""
+        query = "SELECT task, executor FROM {table} WHERE {condition} AND status = {status}"
+
+        return query.format(
+            table=self._table,
+            condition=self._slots_condition(task, slots),
+            status=self._quoter.quote_value("in-progress"),
+        )
+
+    def build_fetch_holders_query(self) -> str:
+        """Builds the query fetching the holders of all locks, with their lease age."""
+        query = (
+            "SELECT locks.task, locks.executor, "
+            "TIMESTAMPDIFF(SECOND, leases.acquired_at, CURRENT_TIMESTAMP) AS lease_age, "
+            "TIMESTAMPDIFF(SECOND, CURRENT_TIMESTAMP, "
+            "leases.renewed_at + INTERVAL {duration} SECOND) AS lease_expires_in "
+            "FROM {table} AS locks "
+            "LEFT JOIN {lease_table} AS leases "
+            "ON leases.task = locks.task AND leases.executor = locks.executor "
+            "WHERE locks.status = {status} "
+            "ORDER BY locks.task"
+        )
+
+        return query.format(
+            table=self._table,
+            lease_table=self._lease_table,
+            duration=self._lease_duration,
+            status=self._quoter.quote_value("in-progress"),
+        )
+
+    def build_release_slot_queries(self, task: str, instance: str, slots: int) -> list[str]:
+        """Builds the queries releasing the slot, its lease and the holder ticket."""
+        release_query = (
+            "UPDATE {table} "
+            "SET status = {status}, executor = '' "
+            "WHERE {condition} AND executor = {instance}"
+        )
+        lease_query = "DELETE FROM {lease_table} WHERE {condition} AND executor = {instance}"
+
+        queries = [
+            query.format(
+                table=self._table,
+                lease_table=self._lease_table,
+                condition=self._slots_condition(task, slots),
+                instance=self._quoter.quote_value(instance),
+                status=self._quoter.quote_value("not-started"),
+            )
+            for query in (release_query, lease_query)
+        ]
+        return [*queries, self.build_dequeue_query(task, instance)]
+
+
+class MySQLUnreachableHostError(ExecutionError):
+    """Exception raised when calling a host known to be unreachable."""
+
+
+class HostCircuitBreaker:
+    """Record of the hosts that could not be connected to within the running process.
+
+    Once tripped for a host, later calls to it fail right away instead of waiting
+    for the connection timeout again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tripped: dict[str, str] = {}
+
+    def trip(self, host: str, reason: str) -> None:
+        """Open the circuit of a host."""
+        with self._lock:
+            if host not in self._tripped:
+                logger.warning(f"Failing further calls to unreachable host {host}: {reason}")
+                self._tripped[host] = reason
+
+    def check(self, host: str) -> None:
+        """Check the circuit of a host is closed.
+
+        Raises:
+            MySQLUnreachableHostError: if the host circuit is open
+        """
+        with self._lock:
+            reason = self._tripped.get(host)
+
+        if reason is not None:
+            raise MySQLUnreachableHostError(f"Host {host} is unreachable: {reason}")
+
+    @property
+    def tripped_hosts(self) -> dict[str, str]:
+        """Return the hosts with an open circuit, with the failure that opened it."""
+        with self._lock:
+            return dict(self._tripped)
+
+    def reset(self) -> None:
+        """Close all the circuits."""
+        with self._lock:
+            self._tripped.clear()
+
+
+class ExecutorCallStats:
+    """Record of the executor calls made by MySQLBase within the running process.
+
+    Calls are grouped by operation, the name of the MySQLBase method issuing them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: dict[str, dict] = {}
+
+    def _operation(self, operation: str) -> dict:
+        """Get the stats of an operation, creating them if needed."""
+        if operation not in self._operations:
+            self._operations[operation] = {
+                "calls": 0,
+                "errors": 0,
+                "retries": 0,
+                "hosts": set(),
+                "durations": [],
+            }
+
+        return self._operations[operation]
+
+    def record_call(self, operation: str, host: str, duration: float, failed: bool) -> None:
+        """Record an executor call."""
+        with self._lock:
+            stats = self._operation(operation)
+            stats["calls"] += 1
+            stats["errors"] += int(failed)
+            stats["hosts"].add(host)
+            stats["durations"].append(duration)
+
+    def record_retry(self, operation: str) -> None:
+        """Record the retry of an operation."""
+        with self._lock:
+            self._operation(operation)["retries"] += 1
+
+    def reset(self) -> None:
+        """Discard all the recorded calls."""
+        with self._lock:
+            self._operations.clear()
+
+    def summary(self) -> dict:
+        """Summarize the recorded calls, with a duration histogram per operation."""
+        operations = {}
+
+        with self._lock:
+            for operation, stats in self._operations.items():
+                durations = sorted(stats["durations"])
+                histogram = dict.fromkeys([*map(str, EXECUTOR_CALL_BUCKETS), "+Inf"], 0)
+                for duration in durations:
+                    bucket = next(
+                        (str(bound) for bound in EXECUTOR_CALL_BUCKETS if duration <= bound),
+                        "+Inf",
+                    )
+                    histogram[bucket] += 1
+
+                operations[operation] = {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "hosts": sorted(stats["hosts"]),
+                    "total_time": round(sum(durations), 3),
+                    "max_time": round(durations[-1], 3) if durations else 0,
+                    "histogram": histogram,
+                }
+
+        return {
+            "calls": sum(stats["calls"] for stats in operations.values()),
+            "errors": sum(stats["errors"] for stats in operations.values()),
+            "retries": sum(stats["retries"] for stats in operations.values()),
+            "total_time": round(sum(stats["total_time"] for stats in operations.values()), 3),
+            "operations": operations,
+        }
+
+
+EXECUTOR_CALLS = ExecutorCallStats()
+HOST_CIRCUIT_BREAKER = HostCircuitBreaker()
+
+
+def _probe_worker(
+    probe: Callable[[str], Any],
+    pending: queue.SimpleQueue,
+    completed: queue.SimpleQueue,
+    stopped: threading.Event,
+) -> None:
+    """Probe the pending instances until none is left or the probing is stopped."""
+    while not stopped.is_set():
+        try:
+            instance = pending.get_nowait()
+        except queue.Empty:
+            return
+
+        try:
+            completed.put((instance, probe(instance), None))
+        except Exception as e:
+            completed.put((instance, None, e))
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    """Record a retried MySQLBase operation, to be used as tenacity before_sleep hook."""
+    EXECUTOR_CALLS.record_retry(retry_state.fn.__name__)
+
+
+def _count_gtids(gtid_set: str) -> int:
+    """Count the transactions of a GTID set, such as `uuid:1-5:7,uuid:tag:1-3`."""
+    count = 0
+    for interval in re.findall(r":(\d+)(?:-(\d+))?(?=[:,]|$)", re.sub(r"\s", "", gtid_set)):
+        start, end = interval
+        count += int(end or start) - int(start) + 1
+
+    return count
+
+
+def _stop_on_unreachable_host(retry_state: RetryCallState) -> bool:
+    """Stop retrying operations failed on an unreachable host, to be used as tenacity stop."""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    while error:
+        if isinstance(error, MySQLUnreachableHostError):
+            return True
+        error = error.__cause__ or error.__context__
+
+    return False
+
+
+class InstrumentedExecutor(BaseExecutor):
+    """Executor proxy recording the calls made through the wrapped executor.
+
+    Every call is recorded in EXECUTOR_CALLS, and traced as a span when tracing is enabled.
+    When given a circuit breaker, calls to hosts that could not be connected to fail fast.
+    """
+
+    def __init__(self, executor: BaseExecutor, circuit_breaker: HostCircuitBreaker | None = None):
+        self._executor = executor
+        self._circuit_breaker = circuit_breaker
+
+    def __getattr__(self, name: str) -> Any:
+        """Proxy the attributes not defined by the base executor, such as batch support."""
+        attribute = getattr(self._executor, name)
+        if name == "execute_sql_batch":
+            return lambda *args, **kwargs: self._call(name, *args, **kwargs)
+
+        return attribute
+
+    @property
+    def connection_details(self) -> ConnectionDetails:
+        """Return the connection details."""
+        return self._executor.connection_details
+
+    @staticmethod
+    def _caller_operation() -> str:
+        """Get the name of the MySQLBase method issuing the current call."""
+        frame = sys._getframe(2)
+        while frame:
+            if (
+                isinstance(frame.f_locals.get("self"), MySQLBase)
+                and frame.f_code.co_name not in EXECUTOR_CALL_HELPERS
+            ):
+                return frame.f_code.co_name
+            frame = frame.f_back
+
+        return "unknown"
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """Call a method of the wrapped executor, recording it."""
+        operation = self._caller_operation()
+        details = self._executor.connection_details
+        host = details.socket or f"{details.host}:{details.port}"
+
+        span = nullcontext()
+        if otel_trace:
+            span = otel_trace.get_tracer(__name__).start_as_current_span(
+                f"mysql.{operation}",
+                attributes={
+                    "db.system": "mysql",
+                    "db.operation": operation,
+                    "db.user": details.username,
+                    "server.address": host,
+                    "mysql.executor.method": method,
+                },
+            )
+
+        start = time.monotonic()
+        failed = False
+        try:
+            with span:
+                if self._circuit_breaker:
+                    self._circuit_breaker.check(details.host)
+                return getattr(self._executor, method)(*args, **kwargs)
+        except ExecutionError as e:
+            failed = True
+            if self._circuit_breaker and CONNECT_FAILURE_PATTERN.search(str(e)):
+                self._circuit_breaker.trip(details.host, str(e))
+            raise
+        except Exception:
+            failed = True
+            raise
+        finally:
+            EXECUTOR_CALLS.record_call(operation, host, time.monotonic() - start, failed)
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        return self._call("check_connection")
+
+    def execute_py(self, script: str, **kwargs) -> str:
+        """Execute a Python script."""
+        return self._call("execute_py", script, **kwargs)
+
+    def execute_sql(self, script: str, **kwargs) -> list[dict]:
+        """Execute a SQL script."""
+        return self._call("execute_sql", script, **kwargs)
+
+
+class SQLBatch:
+    """SQL statements collected to be run in a single executor call."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.results: list[list[dict]] = []
+
+    def add(self, statement: str) -> int:
+        """Add a single statement to the batch, returning the index of its result."""
+        self.statements.append(statement)
+        return len(self.statements) - 1
+
+    def result(self, index: int) -> list[dict]:
+        """Get the rows returned by a statement, once the batch has run."""
+        return self.results[index]
+
+
 class MySQLCharmBase(CharmBase, ABC):
     """Base class to encapsulate charm related functionality.
 
@@ -472,6 +1154,7 @@ class MySQLCharmBase(CharmBase, ABC):
         )
 
         self.framework.observe(self.on.get_cluster_status_action, self._get_cluster_status)
+        self.framework.observe(self.on.get_lock_holders_action, self._on_get_lock_holders)
         self.framework.observe(self.on.get_password_action, self._on_get_password)
         self.framework.observe(self.on.set_password_action, self._on_set_password)
         self.framework.observe(self.on.promote_to_primary_action, self._on_promote_to_primary)
@@ -506,6 +1189,20 @@ class MySQLCharmBase(CharmBase, ABC):
         """Returns whether the unit is busy."""
         raise NotImplementedError
 
+    def get_member_health(self) -> MemberHealth:
+        """Get the health of the unit member.
+
+        Platforms keeping a local health cache may serve it from there.
+        """
+        return self._mysql.get_member_health()
+
+    def is_mysqld_alive(self) -> bool:
+        """Returns whether mysqld is running and answering.
+
+        Platforms keeping a local health cache may serve it from there.
+        """
+        return self._mysql.is_mysqld_running()
+
     @staticmethod
     def get_unit_label(unit: Unit) -> str:
         """Return unit label."""
@@ -598,6 +1295,25 @@ class MySQLCharmBase(CharmBase, ABC):
             logger.exception("Error while reading cluster status")
             event.fail("Error while reading cluster status. See logs for more information.")
 
+    def _on_get_lock_holders(self, event: ActionEvent) -> None:
+        """Action used to show the topology lock holders, and the age of their lease."""
+        try:
+            holders = self._mysql.get_lock_holders()
+        except MySQLGetLockHoldersError:
+            logger.exception("Error while reading lock holders")
+            event.fail("Error while reading lock holders. See logs for more information.")
+            return
+
+        locks = {}
+        for holder in holders:
+            locks[holder["task"]] = {"holder": holder["executor"]}
+            # Locks taken by units unaware of leases have none
+            if holder["lease_age"] is not None:
+                locks[holder["task"]]["lease-age"] = holder["lease_age"]
+                locks[holder["task"]]["lease-expires-in"] = holder["lease_expires_in"]
+
+        event.set_results({"locks": locks})
+
     def _on_promote_to_primary(self, event: ActionEvent) -> None:
         """Action for setting this unit as the cluster primary."""
         if event.params.get("scope") != "unit":
@@ -730,16 +1446,17 @@ class MySQLCharmBase(CharmBase, ABC):
         if self.unit_initialized():
             return True
 
-        for unit in self.app_units:
-            if unit == self.unit:
-                continue
-            try:
-                if self._mysql.cluster_metadata_exists(self.get_unit_address(unit, PEER)):
-                    return True
-            except MySQLClusterMetadataExistsError:
-                pass
+        peer_addresses = [
+            self.get_unit_address(unit, PEER) for unit in self.app_units if unit != self.unit
+        ]
+        results = self._mysql.probe_instances(
+            self._mysql.cluster_metadata_exists,
+            peer_addresses,
+            stop_when=bool,
+            ignore=(MySQLClusterMetadataExistsError,),
+        )
 
-        return False
+        return any(results.values())
 
     @property
     def only_one_cluster_node_thats_uninitialized(self) -> bool | None:
@@ -747,19 +1464,29 @@ class MySQLCharmBase(CharmBase, ABC):
         if not self.app_peer_data.get("cluster-name"):
             return None
 
-        total_cluster_nodes = 0
-        for unit in self.app_units:
-            total_cluster_nodes += self._mysql.get_cluster_node_count(
-                from_instance=self.get_unit_address(unit, PEER)
+        def count_nodes(address: str) -> tuple[int, int]:
+            return (
+                self._mysql.get_cluster_node_count(from_instance=address),
+                self._mysql.get_cluster_node_count(
+                    from_instance=address, node_status=InstanceState.ONLINE
+                ),
             )
 
-        total_online_cluster_nodes = 0
-        for unit in self.app_units:
-            total_online_cluster_nodes += self._mysql.get_cluster_node_count(
-                from_instance=self.get_unit_address(unit, PEER),
-                node_status=InstanceState.ONLINE,
-            )
+        totals = [0, 0]
+
+        def exceeded(counts: tuple[int, int]) -> bool:
+            # The answer is negative as soon as there is a second node or an online one
+            totals[0] += counts[0]
+            totals[1] += counts[1]
+            return totals[0] > 1 or totals[1] > 0
+
+        self._mysql.probe_instances(
+            count_nodes,
+            [self.get_unit_address(unit, PEER) for unit in self.app_units],
+            stop_when=exceeded,
+        )
 
+        total_cluster_nodes, total_online_cluster_nodes = totals
         return total_cluster_nodes == 1 and total_online_cluster_nodes == 0
 
     @property
@@ -1044,9 +1771,14 @@ class MySQLBase(ABC):
             role_reader=ROLE_READ,
             role_writer=ROLE_DML,
         )
-        self._lock_query_builder = CharmLockingQueryBuilder(
+        self._lock_query_builder = QueuedLockingQueryBuilder(
             table_schema="mysql",
             table_name="juju_units_operations",
+            queue_table_name="juju_units_operations_queue",
+            lease_table_name="juju_units_operations_leases",
+            ticket_timeout=LOCK_QUEUE_TICKET_TIMEOUT,
+            ticket_retention=LOCK_QUEUE_TICKET_RETENTION,
+            lease_duration=LOCK_LEASE_DURATION,
         )
         self._log_query_builder = CharmLoggingQueryBuilder()
 
@@ -1062,10 +1794,131 @@ class MySQLBase(ABC):
             self._build_instance_sock_executor(),
             self._quoter,
         )
+        self._cluster_status_snapshot = ClusterStatusSnapshot()
+
+    def _fetch_cluster_status(
+        self, from_instance: str | None = None, extended: bool | None = False
+    ) -> dict:
+        """Fetch the cluster status, reusing the recent snapshot if any.
+
+        Raises:
+            ExecutionError: if the status cannot be fetched
+        """
+        if not from_instance:
+            from_instance = self.instance_address
+
+        key = (self.cluster_name, from_instance, extended)
+        if (status := self._cluster_status_snapshot.get(key)) is not None:
+            return status
+
+        client = MySQLClusterClient(
+            executor=self._build_cluster_tcp_executor(from_instance),
+        )
+        status = client.fetch_cluster_status(self.cluster_name, extended)
+        self._cluster_status_snapshot.put(key, status)
+        return status
+
+    @contextmanager
+    def _sql_batch(self, executor: BaseExecutor) -> Generator[SQLBatch, None, None]:
+        """Collect SQL statements to run them in a single executor call.
+
+        The statement results are available once the context exits.
+
+        Raises:
+            ExecutionError: if any of the statements fails
+        """
+        batch = SQLBatch()
+        yield batch
+
+        if not batch.statements:
+            return
+
+        # Executors may natively support batches, otherwise they are run from MySQL Shell
+        if hasattr(executor, "execute_sql_batch"):
+            batch.results = executor.execute_sql_batch(batch.statements)
+            return
+
+        script = "\n".join((
+            "import json",
+            "results = []",
+            f"for statement in {batch.statements!r}:",
+            "    result = shell.get_session().run_sql(statement)",
+            "    columns = [c.column_label for c in result.get_columns()] if result.has_data() else []",
+            "    rows = result.fetch_all() if result.has_data() else []",
+            "    results.append([{c: row[i] for i, c in enumerate(columns)} for row in rows])",
+            "print(json.dumps(results, default=str))",
+        ))
+        batch.results = json.loads(executor.execute_py(script))
+
+    def probe_instances(
+        self,
+        probe: Callable[[str], T],
+        instances: list[str],
+        *,
+        stop_when: Callable[[T], bool] | None = None,
+        ignore: tuple[type[Exception], ...] = (),
+    ) -> dict[str, T]:
+        """Run a probe against several instances concurrently.
+
+        Args:
+            probe: function called with each instance address
+            instances: addresses of the instances to probe
+            stop_when: predicate on the probe results, returning early once it holds
+            ignore: exception types of failed probes to leave out of the results
+
+        Returns:
+            the results of the completed probes, keyed by instance address
+        """
+        results = {}
+        if not instances:
+            return results
+
+        # Probes run on daemon threads, for the ones left running against unreachable
+        # instances not to hold the hook process once the answer is known
+        pending = queue.SimpleQueue()
+        completed = queue.SimpleQueue()
+        stopped = threading.Event()
+        for instance in instances:
+            pending.put(instance)
+
+        for _ in range(min(len(instances), PEER_PROBE_MAX_WORKERS)):
+            threading.Thread(
+                target=_probe_worker,
+                args=(probe, pending, completed, stopped),
+                name="mysql-probe",
+                daemon=True,
+            ).start()
+
+        try:
+            for _ in instances:
+                instance, result, error = completed.get()
+                if isinstance(error, ignore):
+                    logger.debug(f"Failed to probe instance {instance}: {error!r}")
+                    continue
+                if error:
+                    raise error
+
+                results[instance] = result
+                if stop_when and stop_when(result):
+                    break
+        finally:
+            stopped.set()
+
+        return results
+
+    def _host_circuit_breaker(self, host: str) -> HostCircuitBreaker | None:
+        """Get the circuit breaker guarding the calls to a host.
+
+        The local instance is left out, as it may be restarted and waited for within a hook.
+        """
+        if host == self.instance_address:
+            return None
+
+        return HOST_CIRCUIT_BREAKER
 
     def _build_cluster_tcp_executor(self, host: str, port: int = 3306):
         """Build a TCP executor for the cluster operations."""
-        return self.executor_class(
+        executor = self.executor_class(
             conn_details=ConnectionDetails(
                 username=self.cluster_admin_user,
                 password=self.cluster_admin_password,
@@ -1074,10 +1927,11 @@ class MySQLBase(ABC):
             ),
             shell_path=self.mysqlsh_path,
         )
+        return InstrumentedExecutor(executor, self._host_circuit_breaker(host))
 
     def _build_instance_tcp_executor(self, host: str, port: int = ADMIN_PORT):
         """Build a TCP executor for the instance operations."""
-        return self.executor_class(
+        executor = self.executor_class(
             conn_details=ConnectionDetails(
                 username=self.server_config_user,
                 password=self.server_config_password,
@@ -1086,10 +1940,11 @@ class MySQLBase(ABC):
             ),
             shell_path=self.mysqlsh_path,
         )
+        return InstrumentedExecutor(executor, self._host_circuit_breaker(host))
 
     def _build_instance_sock_executor(self):
         """Build a socket executor for the instance operations."""
-        return self.executor_class(
+        executor = self.executor_class(
             conn_details=ConnectionDetails(
                 username=self.root_user,
                 password=self.root_password,
@@ -1097,6 +1952,7 @@ class MySQLBase(ABC):
             ),
             shell_path=self.mysqlsh_path,
         )
+        return InstrumentedExecutor(executor)
 
     def render_mysqld_configuration(  # noqa: C901
         self,
@@ -1109,10 +1965,18 @@ class MySQLBase(ABC):
         experimental_max_connections: int | None = None,
         binlog_retention_days: int,
         snap_common: str = "",
+        clone_max_concurrency: int | None = None,
+        clone_max_bandwidth: int | None = None,
+        clone_compression: str = "auto",
+        redo_log_write_rate: float | None = None,
     ) -> tuple[str, dict]:
         """Render mysqld ini configuration file."""
         max_connections = None
+        innodb_redo_log_capacity = None
         performance_schema_instrument = ""
+        clone_parameters = {}
+        thread_parameters = {}
+        io_parameters = {}
         if profile == "testing":
             innodb_buffer_pool_size = 20 * BYTES_1MiB
             innodb_buffer_pool_chunk_size = 1 * BYTES_1MiB
@@ -1142,6 +2006,9 @@ class MySQLBase(ABC):
                 innodb_buffer_pool_chunk_size,
                 group_replication_message_cache_size,
             ) = self.get_innodb_buffer_pool_parameters(available_memory)
+            innodb_redo_log_capacity = self.get_redo_log_capacity(
+                innodb_buffer_pool_size, redo_log_write_rate
+            )
 
             # constrain max_connections based on the available memory
             # after innodb_buffer_pool_size calculation
@@ -1157,6 +2024,17 @@ class MySQLBase(ABC):
                 # disable memory instruments if we have less than 2GiB of RAM
                 performance_schema_instrument = "'memory/%=OFF'"
 
+            clone_parameters = self.get_clone_parameters(
+                buffers_memory=available_memory,
+                max_concurrency=clone_max_concurrency,
+                max_bandwidth=clone_max_bandwidth,
+                compression=clone_compression,
+            )
+            cpus = self.get_available_cpus()
+            thread_parameters = self.get_thread_parameters(cpus)
+            if storage_probe := self.get_storage_probe():
+                io_parameters = self.get_io_parameters(storage_probe, cpus)
+
         binlog_retention_seconds = binlog_retention_days * 24 * 60 * 60
         config = configparser.ConfigParser(interpolation=None)
 
@@ -1194,6 +2072,8 @@ class MySQLBase(ABC):
         else:
             config["mysqld"]["loose-audit_log_strategy"] = "SEMISYNCHRONOUS"
 
+        if innodb_redo_log_capacity:
+            config["mysqld"]["innodb_redo_log_capacity"] = str(innodb_redo_log_capacity)
         if innodb_buffer_pool_chunk_size:
             config["mysqld"]["innodb_buffer_pool_chunk_size"] = str(innodb_buffer_pool_chunk_size)
         if performance_schema_instrument:
@@ -1203,6 +2083,16 @@ class MySQLBase(ABC):
                 group_replication_message_cache_size
             )
 
+        for name, value in thread_parameters.items():
+            config["mysqld"][name] = str(value)
+
+        for name, value in io_parameters.items():
+            config["mysqld"][name] = str(value)
+
+        for name, value in clone_parameters.items():
+            # The clone plugin is installed along with the cluster
+            config["mysqld"][f"loose-{name}"] = str(value)
+
         with io.StringIO() as string_io:
             config.write(string_io)
             return string_io.getvalue(), dict(config["mysqld"])
@@ -1224,18 +2114,18 @@ class MySQLBase(ABC):
             str(len(role_name_collisions)).zfill(len(role_suffix)),
         ))
 
-    def _plugin_file_exists(self, file_name: str) -> bool:
-        """Check if the plugin file exists."""
-        path = self._instance_client_tcp.get_instance_variable(Scope.GLOBAL, "plugin_dir")
-        return self._file_exists(f"{path}/{file_name}")
-
     @contextmanager
     def _read_only_disabled(self) -> Generator:
         """Temporarily disables the super-read-only mode."""
-        value = self._instance_client_tcp.get_instance_variable(Scope.GLOBAL, "super_read_only")
+        executor = self._build_instance_tcp_executor(self.instance_address)
+
+        with self._sql_batch(executor) as batch:
+            index = batch.add("SELECT @@GLOBAL.`super_read_only` AS `super_read_only`")
+            batch.add("SET @@GLOBAL.`super_read_only` = 'OFF'")
+
+        value = batch.result(index)[0]["super_read_only"]
 
         try:
-            self._instance_client_tcp.set_instance_variable(Scope.GLOBAL, "super_read_only", "OFF")
             yield
         finally:
             self._instance_client_tcp.set_instance_variable(Scope.GLOBAL, "super_read_only", value)
@@ -1310,7 +2200,7 @@ class MySQLBase(ABC):
             f"UPDATE mysql.user SET authentication_string=null WHERE User='{self.root_user}' and Host='localhost'",  # noqa: S608
             f"ALTER USER '{self.root_user}'@'localhost' IDENTIFIED BY '{self.root_password}'",
             f"CREATE USER '{self.server_config_user}'@'%' IDENTIFIED BY '{self.server_config_password}'",
-            f"CREATE USER '{self.monitoring_user}'@'%' IDENTIFIED BY '{self.monitoring_password}' WITH MAX_USER_CONNECTIONS 3",
+            f"CREATE USER '{self.monitoring_user}'@'%' IDENTIFIED BY '{self.monitoring_password}' WITH MAX_USER_CONNECTIONS {MONITORING_USER_MAX_CONNECTIONS}",
             f"CREATE USER '{self.backups_user}'@'%' IDENTIFIED BY '{self.backups_password}'",
         ]
 
@@ -1343,12 +2233,23 @@ class MySQLBase(ABC):
         # TODO:
         #   Remove this context-manager when migrating to MySQL 8.4
         #   (when breaking changes are allowed)
+        executor = self._build_instance_tcp_executor(self.instance_address)
+
         with self._read_only_disabled():
-            installed_plugins = self._instance_client_tcp.search_instance_plugins("%")
+            try:
+                with self._sql_batch(executor) as batch:
+                    plugin_dir_index = batch.add("SELECT @@GLOBAL.`plugin_dir` AS `plugin_dir`")
+                    plugins_index = batch.add("SELECT name FROM mysql.plugin")
+            except ExecutionError as e:
+                raise MySQLPluginInstallError() from e
+
+            plugin_dir = batch.result(plugin_dir_index)[0]["plugin_dir"]
+            installed_plugins = [row["name"] for row in batch.result(plugins_index)]
 
+            install_queries = []
             for plugin in plugins:
                 plugin_path = ALLOWED_PLUGINS.get(plugin)
-                if not self._plugin_file_exists(plugin_path):
+                if not self._file_exists(f"{plugin_dir}/{plugin_path}"):
                     logger.warning(f"{plugin=} file not found. Skip installation")
                     continue
 
@@ -1359,10 +2260,17 @@ class MySQLBase(ABC):
                     logger.warning(f"{plugin=} is not supported")
                     continue
 
-                try:
-                    self._instance_client_tcp.install_instance_plugin(plugin, plugin_path)
-                except ExecutionError as e:
-                    raise MySQLPluginInstallError() from e
+                install_queries.append(
+                    f"INSTALL PLUGIN {self._quoter.quote_identifier(plugin)} "
+                    f"SONAME {self._quoter.quote_value(plugin_path)}"
+                )
+
+            try:
+                with self._sql_batch(executor) as batch:
+                    for query in install_queries:
+                        batch.add(query)
+            except ExecutionError as e:
+                raise MySQLPluginInstallError() from e
 
     def uninstall_plugins(self, plugins: list[str]) -> None:
         """Uninstall plugins."""
@@ -1425,8 +2333,9 @@ class MySQLBase(ABC):
             raise MySQLConfigureRouterUserError() from e
 
     @retry(
+        before_sleep=_record_retry,
         reraise=True,
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | _stop_on_unreachable_host,
         retry=retry_if_exception_type(MySQLCreateApplicationDatabaseError),
     )
     def create_database(self, database: str) -> None:
@@ -1588,14 +2497,56 @@ class MySQLBase(ABC):
         except ExecutionError as e:
             raise MySQLSetVariableError() from e
 
-    def configure_instance(self, create_cluster_admin: bool = True) -> None:
-        """Configure the instance to be used in an InnoDB cluster.
+    def resize_buffer_pool(self, size: int, timeout: float = BUFFER_POOL_RESIZE_TIMEOUT) -> None:
+        """Resize the buffer pool online, waiting for the resize to complete.
 
-        Args:
-            create_cluster_admin: Whether to create the cluster admin user.
+        InnoDB resizes the buffer pool in the background, one chunk at a time, and
+        reports its progress in the Innodb_buffer_pool_resize_status% status variables.
+
+        Raises:
+            MySQLSetVariableError: if the resize fails or does not complete in time
         """
-        options = {
-            "restart": "true",
+        logger.info(f"Resizing the buffer pool to {size} bytes")
+        self.set_dynamic_variable("innodb_buffer_pool_size", size)
+
+        query = (
+            "SELECT LOWER(variable_name) AS name, variable_value AS value "
+            "FROM performance_schema.global_status "
+            "WHERE variable_name LIKE 'Innodb_buffer_pool_resize_status%'"
+        )
+        executor = self._build_instance_tcp_executor(self.instance_address)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                status = {row["name"]: row["value"] for row in executor.execute_sql(query)}
+            except ExecutionError as e:
+                raise MySQLSetVariableError("Failed to query the buffer pool resize") from e
+
+            message = status.get("innodb_buffer_pool_resize_status", "")
+            # The status code is only reported from MySQL 8.0.31
+            in_progress = int(status.get("innodb_buffer_pool_resize_status_code") or 0) != 0
+            if not in_progress and not message.startswith("Requested"):
+                break
+
+            progress = status.get("innodb_buffer_pool_resize_status_progress")
+            logger.debug(f"Resizing the buffer pool: {message} ({progress or 0}%)")
+            if time.monotonic() > deadline:
+                raise MySQLSetVariableError("Timed out resizing the buffer pool")
+            time.sleep(BUFFER_POOL_RESIZE_CHECK_TIME)
+
+        if "fail" in message.lower():
+            raise MySQLSetVariableError(message)
+
+        logger.info(f"Resized the buffer pool: {message}")
+
+    def configure_instance(self, create_cluster_admin: bool = True) -> None:
+        """Configure the instance to be used in an InnoDB cluster.
+
+        Args:
+            create_cluster_admin: Whether to create the cluster admin user.
+        """
+        options = {
+            "restart": "true",
         }
 
         if create_cluster_admin:
@@ -1634,6 +2585,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLCreateClusterError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def create_cluster_set(self) -> None:
         """Create a cluster set for the cluster on cluster primary."""
@@ -1644,6 +2597,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLCreateClusterSetError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def create_replica_cluster(
         self,
@@ -1692,6 +2647,8 @@ class MySQLBase(ABC):
                 donor=donor,
                 method="clone",
             )
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def promote_cluster_to_primary(self, cluster_name: str, force: bool = False) -> None:
         """Promote a cluster to become the primary cluster on the cluster set."""
@@ -1702,6 +2659,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLPromoteClusterToPrimaryError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def is_cluster_in_cluster_set(self, cluster_name: str) -> bool | None:
         """Check if a cluster is in the cluster set."""
@@ -1743,6 +2702,8 @@ class MySQLBase(ABC):
             self._cluster_client_tcp.rejoin_cluster_set_cluster(cluster_name)
         except ExecutionError as e:
             raise MySQLRejoinClusterError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def remove_replica_cluster(self, replica_cluster_name: str, force: bool = False) -> None:
         """Remove a replica cluster from the cluster-set."""
@@ -1755,10 +2716,15 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLRemoveReplicaClusterError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def initialize_juju_units_operations_table(self) -> None:
         """Initialize the mysql.juju_units_operations table using the serverconfig user."""
-        query = self._lock_query_builder.build_table_creation_query()
+        query = ";".join((
+            self._lock_query_builder.build_table_creation_query(),
+            *self._lock_query_builder.build_support_tables_creation_queries(),
+        ))
         executor = self._build_instance_tcp_executor(self.instance_address)
 
         try:
@@ -1776,8 +2742,17 @@ class MySQLBase(ABC):
         from_instance: str | None = None,
         lock_instance: str | None = None,
         method: str = "auto",
+        join_slots: int = 1,
+        on_clone_donor: Callable[[str], None] | None = None,
+        clone_variables: dict[str, dict] | None = None,
     ) -> None:
-        """Add an instance to the InnoDB cluster."""
+        """Add an instance to the InnoDB cluster.
+
+        Up to `join_slots` instances are added concurrently, each one cloning from a
+        different secondary, the least loaded first. The `from_instance` is only used
+        for the metadata operations, and `on_clone_donor` is called with the chosen donor.
+        `clone_variables` holds the clone variables rendered for each unit, by label.
+        """
         if not from_instance:
             from_instance = self.instance_address
         if not lock_instance:
@@ -1792,20 +2767,41 @@ class MySQLBase(ABC):
         connect_executor = self._build_cluster_tcp_executor(from_instance)
         client = MySQLClusterClient(connect_executor)
 
-        if not self._acquire_lock(
-            executor=locking_executor,
-            unit_label=instance_unit_label,
-            unit_task=CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK,
-        ):
+        slot = self._acquire_join_slot(locking_executor, instance_unit_label, join_slots)
+        if slot is None:
             raise MySQLLockAcquisitionError("Lock not acquired")
 
-        try:
-            client.attach_instance_into_cluster(
-                cluster_name=self.cluster_name,
-                instance_host=instance_address,
-                instance_port=str(3306),
-                options=options,
+        if method == "auto":
+            method = self._get_recovery_method(instance_address, from_instance)
+            options["recoveryMethod"] = method
+
+        if method == "clone" and (donor := self._get_clone_donor(from_instance, slot)):
+            options["cloneDonor"] = donor
+            if on_clone_donor:
+                on_clone_donor(donor)
+
+        lease = self._renewing_lease(
+            lock_instance, instance_unit_label, UNIT_ADD_LOCKNAME, join_slots
+        )
+        tuned_clone = (
+            self._tuned_clone(
+                options.get("cloneDonor", from_instance),
+                instance_address,
+                instance_unit_label,
+                clone_variables or {},
             )
+            if method == "clone"
+            else nullcontext()
+        )
+
+        try:
+            with lease, tuned_clone:
+                client.attach_instance_into_cluster(
+                    cluster_name=self.cluster_name,
+                    instance_host=instance_address,
+                    instance_port=str(3306),
+                    options=options,
+                )
         except ExecutionError as e:
             if method == "clone":
                 raise MySQLAddInstanceToClusterError() from e
@@ -1817,13 +2813,13 @@ class MySQLBase(ABC):
                 from_instance=from_instance,
                 lock_instance=lock_instance,
                 method="clone",
+                join_slots=join_slots,
+                on_clone_donor=on_clone_donor,
+                clone_variables=clone_variables,
             )
         finally:
-            self._release_lock(
-                executor=locking_executor,
-                unit_label=instance_unit_label,
-                unit_task=CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK,
-            )
+            self._cluster_status_snapshot.invalidate()
+            self._release_join_slot(locking_executor, instance_unit_label, join_slots)
 
     def rejoin_instance_to_cluster(
         self,
@@ -1853,14 +2849,16 @@ class MySQLBase(ABC):
             raise MySQLLockAcquisitionError("Lock not acquired")
 
         try:
-            client.rejoin_instance_into_cluster(
-                cluster_name=self.cluster_name,
-                instance_host=unit_address,
-                instance_port=str(3306),
-            )
+            with self._renewing_lease(from_instance, unit_label, UNIT_ADD_LOCKNAME):
+                client.rejoin_instance_into_cluster(
+                    cluster_name=self.cluster_name,
+                    instance_host=unit_address,
+                    instance_port=str(3306),
+                )
         except ExecutionError as e:
             raise MySQLRejoinInstanceToClusterError() from e
         finally:
+            self._cluster_status_snapshot.invalidate()
             self._release_lock(
                 executor=executor,
                 unit_label=unit_label,
@@ -1880,9 +2878,16 @@ class MySQLBase(ABC):
         else:
             return result["status"] == "ok"
 
-    def are_locks_acquired(self, from_instance: str, task_name: str) -> bool:
-        """Report if any topology change is being executed."""
-        query = self._lock_query_builder.build_fetch_acquired_query(task_name)
+    def are_locks_acquired(self, from_instance: str, task_name: str, slots: int = 1) -> bool:
+        """Report if any topology change is being executed.
+
+        For instance additions spread over several slots, report if all of them are taken.
+        """
+        if task_name == UNIT_ADD_LOCKNAME and slots > 1:
+            query = self._lock_query_builder.build_fetch_acquired_slots_query(task_name, slots)
+        else:
+            query = self._lock_query_builder.build_fetch_acquired_query(task_name)
+            slots = 1
         executor = self._build_instance_tcp_executor(from_instance)
 
         try:
@@ -1892,7 +2897,7 @@ class MySQLBase(ABC):
             logger.error(f"Failed to fetch acquired lock {task_name}")
             return True
         else:
-            return len(locks) == 1
+            return len(locks) >= slots
 
     def rescan_cluster(
         self,
@@ -1918,6 +2923,8 @@ class MySQLBase(ABC):
             client.rescan_cluster(cluster_name=self.cluster_name, options=options)
         except ExecutionError as e:
             raise MySQLRescanClusterError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def is_instance_in_cluster(self, unit_label: str) -> bool:
         """Confirm if instance is in the cluster."""
@@ -1928,10 +2935,7 @@ class MySQLBase(ABC):
             return False
 
         try:
-            cluster_status = self._cluster_client_tcp.fetch_cluster_status(
-                cluster_name=self.cluster_name,
-                extended=False,
-            )
+            cluster_status = self._fetch_cluster_status()
         except ExecutionError:
             return False
         else:
@@ -1953,23 +2957,17 @@ class MySQLBase(ABC):
             return unit_label in labels
 
     @retry(
+        before_sleep=_record_retry,
         wait=wait_fixed(2),
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | _stop_on_unreachable_host,
         retry=retry_if_exception_type(ExecutionError),
     )
     def get_cluster_status(
         self, from_instance: str | None = None, extended: bool | None = False
     ) -> dict | None:
         """Get the cluster status dictionary."""
-        if not from_instance:
-            from_instance = self.instance_address
-
-        client = MySQLClusterClient(
-            executor=self._build_cluster_tcp_executor(from_instance),
-        )
-
         try:
-            status = client.fetch_cluster_status(self.cluster_name, extended)
+            status = self._fetch_cluster_status(from_instance, extended)
         except ExecutionError:
             return None
         else:
@@ -2039,10 +3037,11 @@ class MySQLBase(ABC):
             return len(status)
 
     @retry(
+        before_sleep=_record_retry,
         retry=retry_if_exception_type(MySQLLockAcquisitionError),
-        stop=stop_after_attempt(15),
+        stop=stop_after_attempt(60) | _stop_on_unreachable_host,
         reraise=True,
-        wait=wait_random(min=4, max=30),
+        wait=wait_fixed(5),
     )
     def remove_instance(
         self,
@@ -2095,15 +3094,18 @@ class MySQLBase(ABC):
         )
 
         try:
-            client.detach_instance_from_cluster(
-                cluster_name=self.cluster_name,
-                instance_host=self.instance_address,
-                instance_port=str(3306),
-                options=options,
-            )
+            with self._renewing_lease(lock_instance, unit_label, UNIT_TEARDOWN_LOCKNAME):
+                client.detach_instance_from_cluster(
+                    cluster_name=self.cluster_name,
+                    instance_host=self.instance_address,
+                    instance_port=str(3306),
+                    options=options,
+                )
         except ExecutionError as e:
             raise MySQLRemoveInstanceError() from e
         finally:
+            self._cluster_status_snapshot.invalidate()
+
             # Retrieve the cluster primary's address again (in case the old primary is scaled down)
             if member_addresses:
                 primary_address = self.get_cluster_primary_address(member_addresses[0])
@@ -2115,6 +3117,160 @@ class MySQLBase(ABC):
                 unit_task=CharmLockingQueryBuilder.INSTANCE_REMOVAL_TASK,
             )
 
+    @staticmethod
+    def _plan_instances_removal(
+        topology: dict, unit_labels: list[str]
+    ) -> tuple[list[str], str | None]:
+        """Plan a quorum-safe removal of the given cluster members.
+
+        Unreachable members go first, for the group to regain a healthy majority, and
+        removals stop before one would be run without a majority of ONLINE members.
+        The primary is never removed, a staying member is rather proposed to replace it.
+
+        Returns:
+            The labels of the members to remove, in order, and the label of the
+            member to switch the primary to, if needed.
+        """
+        online = {
+            label for label, member in topology.items() if member["status"] == InstanceState.ONLINE
+        }
+        primary = next(
+            (
+                label
+                for label, member in topology.items()
+                if member["memberRole"] == InstanceRole.PRIMARY and label in online
+            ),
+            None,
+        )
+        staying_online = sorted(online - set(unit_labels))
+        if not staying_online:
+            raise MySQLRemoveInstanceError("No ONLINE member left to run the removals from")
+
+        new_primary = staying_online[0] if primary in unit_labels else None
+
+        remaining = set(topology)
+        order = []
+        for label in sorted(
+            (label for label in topology if label in unit_labels),
+            key=lambda label: (label in online, label),
+        ):
+            # The group must keep a majority of ONLINE members both to run the removal
+            # and once it is done
+            left = remaining - {label}
+            if (
+                len(remaining & online) <= len(remaining) / 2
+                or len(left & online) <= len(left) / 2
+            ):
+                break
+            order.append(label)
+            remaining = left
+
+        return order, new_primary
+
+    def remove_instances(
+        self,
+        unit_label: str,
+        unit_labels: list[str],
+        lock_instance: str | None = None,
+    ) -> None:
+        """Remove several instances from the cluster in a single pass.
+
+        Called from each departing unit. The first one to take the removal lock removes
+        all the departing instances still in the cluster, switching the primary once if
+        needed, and the others find they have nothing left to do. If no member stays,
+        the unit removes itself as in :meth:`remove_instance`. A unit held back by the
+        quorum guard releases the lock and retries, for a majority to be regained.
+
+        Args:
+            unit_label: The label of the unit coordinating the removal.
+            unit_labels: The labels of all the departing units.
+            lock_instance: (optional) The instance address to acquire the lock on.
+        """
+        if not self.is_instance_in_cluster(unit_label):
+            logger.info(f"Instance {unit_label} already removed from the cluster")
+            return
+
+        topology = self.get_cluster_topology() or {}
+        if not set(topology) - set(unit_labels):
+            # Retried on its own, not to multiply the attempts
+            self.remove_instance(unit_label, lock_instance=lock_instance)
+            return
+
+        self._remove_departing_instances(unit_label, unit_labels, lock_instance)
+
+    @retry(
+        before_sleep=_record_retry,
+        retry=retry_if_exception_type(MySQLLockAcquisitionError),
+        stop=stop_after_attempt(60) | _stop_on_unreachable_host,
+        reraise=True,
+        wait=wait_fixed(5),
+    )
+    def _remove_departing_instances(
+        self,
+        unit_label: str,
+        unit_labels: list[str],
+        lock_instance: str | None,
+    ) -> None:
+        """Remove the departing instances under the removal lock, see :meth:`remove_instances`."""
+        # Checked on every attempt, the unit being possibly removed by another one meanwhile
+        if not self.is_instance_in_cluster(unit_label):
+            logger.info(f"Instance {unit_label} already removed from the cluster")
+            return
+
+        primary_address = self.get_cluster_primary_address()
+        locks_on_primary = not lock_instance
+        if locks_on_primary:
+            lock_instance = primary_address
+        locking_executor = self._build_instance_tcp_executor(lock_instance)
+
+        if not self._acquire_lock(
+            executor=locking_executor,
+            unit_label=unit_label,
+            unit_task=CharmLockingQueryBuilder.INSTANCE_REMOVAL_TASK,
+        ):
+            raise MySQLLockAcquisitionError("Lock not acquired")
+
+        try:
+            # Fetched again once the lock is held, for removals by other units to be seen
+            self._cluster_status_snapshot.invalidate()
+            topology = self._fetch_cluster_status()["defaultReplicaSet"]["topology"]
+
+            order, new_primary = self._plan_instances_removal(topology, unit_labels)
+            if new_primary:
+                logger.info(f"Switching primary to {new_primary} before removing instances")
+                primary_address = topology[new_primary]["address"].split(":")[0]
+                self.set_cluster_primary(primary_address)
+                # The former primary may be removed, the new one holds the same locking table
+                if locks_on_primary:
+                    lock_instance = primary_address
+                    locking_executor = self._build_instance_tcp_executor(lock_instance)
+
+            if order:
+                logger.info(f"Removing instances {', '.join(order)} from the cluster")
+                script = "\n".join((
+                    f"cluster = dba.get_cluster('{self.cluster_name}')",
+                    *(
+                        f"cluster.remove_instance('{topology[label]['address']}', {{'force': 'true'}})"
+                        for label in order
+                    ),
+                ))
+                executor = self._build_cluster_tcp_executor(primary_address)
+                with self._renewing_lease(lock_instance, unit_label, UNIT_TEARDOWN_LOCKNAME):
+                    executor.execute_py(script)
+
+            if unit_label in topology and unit_label not in order:
+                # Held back by the quorum guard, retried once the lock is released
+                raise MySQLLockAcquisitionError(f"Removal of {unit_label} deferred for quorum")
+        except (ExecutionError, MySQLSetClusterPrimaryError) as e:
+            raise MySQLRemoveInstanceError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
+            self._release_lock(
+                executor=locking_executor,
+                unit_label=unit_label,
+                unit_task=CharmLockingQueryBuilder.INSTANCE_REMOVAL_TASK,
+            )
+
     def dissolve_cluster(self, force: bool = True) -> None:
         """Dissolve the cluster independently of the unit teardown process."""
         cluster_names = self.get_cluster_names()
@@ -2125,44 +3281,341 @@ class MySQLBase(ABC):
             self.remove_replica_cluster(self.cluster_name)
 
         if force:
-            self._cluster_client_tcp.destroy_cluster(self.cluster_name, {"force": "true"})
+            try:
+                self._cluster_client_tcp.destroy_cluster(self.cluster_name, {"force": "true"})
+            finally:
+                self._cluster_status_snapshot.invalidate()
 
     def _acquire_lock(self, executor: BaseExecutor, unit_label: str, unit_task: str) -> bool:
         """Attempts to acquire a lock by using the mysql.juju_units_operations table."""
-        acquire_query = self._lock_query_builder.build_acquire_query(
-            task=unit_task,
-            instance=unit_label,
+        return self._acquire_slot(executor, unit_label, unit_task, 1) is not None
+
+    def _release_lock(self, executor: BaseExecutor, unit_label: str, unit_task: str) -> bool:
+        """Releases a lock in the mysql.juju_units_operations table."""
+        return self._release_slot(executor, unit_label, unit_task, 1)
+
+    def _acquire_join_slot(
+        self, executor: BaseExecutor, unit_label: str, slots: int
+    ) -> int | None:
+        """Attempts to acquire one of the instance addition slots, returning its index."""
+        if slots <= 1:
+            acquired = self._acquire_lock(
+                executor=executor,
+                unit_label=unit_label,
+                unit_task=CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK,
+            )
+            return 0 if acquired else None
+
+        return self._acquire_slot(
+            executor, unit_label, CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK, slots
         )
-        fetch_query = self._lock_query_builder.build_fetch_acquired_query(
-            task=unit_task,
+
+    def _release_join_slot(self, executor: BaseExecutor, unit_label: str, slots: int) -> bool:
+        """Releases the instance addition slot held by the unit."""
+        if slots <= 1:
+            return self._release_lock(
+                executor=executor,
+                unit_label=unit_label,
+                unit_task=CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK,
+            )
+
+        return self._release_slot(
+            executor, unit_label, CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK, slots
         )
 
+    def _lock_sql_batch(self, executor: BaseExecutor, statements: list[str]) -> list[list[dict]]:
+        """Run a batch of locking statements, creating the queue and lease tables if missing.
+
+        Returns:
+            List with the rows returned by each statement
+
+        Raises:
+            ExecutionError: if any of the statements fails
+        """
+        try:
+            with self._sql_batch(executor) as batch:
+                for statement in statements:
+                    batch.add(statement)
+        except ExecutionError as e:
+            if not MISSING_TABLE_PATTERN.search(str(e)):
+                raise
+
+            # Clusters created without them get the tables on their first use
+            logger.info("Creating the lock queue and lease tables")
+            creation_queries = self._lock_query_builder.build_support_tables_creation_queries()
+            with self._sql_batch(executor) as batch:
+                for statement in [*creation_queries, *statements]:
+                    batch.add(statement)
+            return batch.results[len(creation_queries) :]
+
+        return batch.results
+
+    def _enqueue_queries(self, unit_label: str, unit_task: str) -> list[str]:
+        """Queries taking or refreshing the unit ticket in the lock queue."""
+        return [
+            self._lock_query_builder.build_expire_tickets_query(),
+            *self._lock_query_builder.build_enqueue_queries(unit_task, unit_label),
+        ]
+
+    def _acquire_slot(
+        self, executor: BaseExecutor, unit_label: str, unit_task: str, slots: int
+    ) -> int | None:
+        """Attempts to acquire one of the slots of a lock, in arrival order.
+
+        Returns:
+            The index of the acquired slot, None if not acquired.
+        """
+        builder = self._lock_query_builder
+        queries = [
+            *self._enqueue_queries(unit_label, unit_task),
+            # Slots are added on demand, for tables created with a single one
+            builder.build_slots_creation_query(unit_task, slots),
+            *builder.build_acquire_slot_queries(unit_task, unit_label, slots),
+            builder.build_fetch_acquired_slots_query(unit_task, slots),
+        ]
+
         try:
             logger.debug(f"Attempting to acquire lock {unit_task} for unit {unit_label}")
-            ____ = executor.execute_sql(acquire_query)
-            rows = executor.execute_sql(fetch_query)
+            results = self._lock_sql_batch(executor, queries)
         except ExecutionError:
             logger.debug(f"Failed to acquire lock {unit_task}")
-            return False
-        else:
-            return unit_label in [row["executor"] for row in rows]
+            return None
 
-    def _release_lock(self, executor: BaseExecutor, unit_label: str, unit_task: str) -> bool:
-        """Releases a lock in the mysql.juju_units_operations table."""
-        query = self._lock_query_builder.build_release_query(
-            task=unit_task,
-            instance=unit_label,
-        )
+        tasks = builder.slot_tasks(unit_task, slots)
+        for row in results[-1]:
+            if row["executor"] == unit_label:
+                return tasks.index(row["task"])
+
+        return None
 
+    def _release_slot(
+        self, executor: BaseExecutor, unit_label: str, unit_task: str, slots: int
+    ) -> bool:
+        """Releases the lock slot held by the unit, its lease and its queue ticket."""
         try:
             logger.debug(f"Attempting to release lock {unit_task} for unit {unit_label}")
-            executor.execute_sql(query)
+            with self._sql_batch(executor) as batch:
+                for query in self._lock_query_builder.build_release_slot_queries(
+                    unit_task, unit_label, slots
+                ):
+                    batch.add(query)
         except ExecutionError:
             logger.debug(f"Failed to release lock {unit_task}")
             return False
         else:
             return True
 
+    @contextmanager
+    def _renewing_lease(
+        self, lock_instance: str, unit_label: str, unit_task: str, slots: int = 1
+    ) -> Generator:
+        """Renew the lease of the held lock slot from a background thread, while in context.
+
+        Meant for long operations, e.g. clones, to keep their lock from being taken over.
+        """
+        stopped = threading.Event()
+        queries = self._lock_query_builder.build_renew_lease_queries(unit_task, unit_label, slots)
+        executor = self._build_instance_tcp_executor(lock_instance)
+
+        def heartbeat() -> None:
+            while not stopped.wait(LOCK_LEASE_RENEWAL_INTERVAL):
+                try:
+                    with self._sql_batch(executor) as batch:
+                        for query in queries:
+                            batch.add(query)
+                except ExecutionError:
+                    logger.warning(f"Failed to renew the lease of lock {unit_task}")
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            thread.join()
+
+    def get_lock_holders(self, from_instance: str | None = None) -> list[dict]:
+        """Get the holders of the topology locks, with the age and expiry of their lease.
+
+        Raises:
+            MySQLGetLockHoldersError: if the locks cannot be fetched
+        """
+        executor = self._build_instance_tcp_executor(from_instance or self.instance_address)
+
+        try:
+            return executor.execute_sql(self._lock_query_builder.build_fetch_holders_query())
+        except ExecutionError as e:
+            if MISSING_TABLE_PATTERN.search(str(e)):
+                # The lock tables are created on first use
+                return []
+            raise MySQLGetLockHoldersError() from e
+
+    def get_lock_queue_position(
+        self, from_instance: str, task_name: str, unit_label: str
+    ) -> int | None:
+        """Take or refresh the unit ticket in the lock queue.
+
+        Returns:
+            The number of units ahead in the queue, lock holders included,
+            None if the queue could not be reached.
+        """
+        executor = self._build_instance_tcp_executor(from_instance)
+        queries = [
+            *self._enqueue_queries(unit_label, task_name),
+            "SELECT @juju_queue_position AS position",
+        ]
+
+        try:
+            results = self._lock_sql_batch(executor, queries)
+        except ExecutionError:
+            logger.error(f"Failed to take a ticket for lock {task_name}")
+            return None
+
+        return int(results[-1][0]["position"])
+
+    def _get_recovery_method(self, instance_address: str, from_instance: str) -> str:
+        """Choose between incremental and clone recovery for a joining instance.
+
+        Incremental recovery is chosen when the binlogs of `from_instance` still hold every
+        transaction missing on the joiner, and the joiner has no transaction unknown to the
+        group. The recovery method is left to MySQL Shell when the GTID sets cannot be read.
+        """
+        query = (
+            "SELECT "
+            "GTID_SUBTRACT(@@gtid_executed, {joiner}) AS missing, "
+            "GTID_SUBTRACT(@@gtid_executed, @@gtid_purged) AS in_binlogs, "
+            "GTID_SUBSET(@@gtid_purged, {joiner}) AS purged_applied, "
+            "GTID_SUBSET({joiner}, @@gtid_executed) AS no_errant, "
+            "(SELECT COALESCE(SUM(data_length + index_length), 0) "
+            "FROM information_schema.tables) AS data_size"
+        )
+        donor_executor = self._build_instance_tcp_executor(from_instance)
+
+        try:
+            rows = self._build_instance_tcp_executor(instance_address).execute_sql(
+                "SELECT @@gtid_executed AS gtid_executed"
+            )
+            joiner = self._quoter.quote_value(re.sub(r"\s", "", rows[0]["gtid_executed"]))
+            gtids = donor_executor.execute_sql(query.format(joiner=joiner))[0]
+            binlogs = donor_executor.execute_sql("SHOW BINARY LOGS")
+        except (ExecutionError, IndexError, KeyError):
+            logger.warning("Failed to compare the GTID sets, leaving the recovery method to MySQL")
+            return "auto"
+
+        missing = _count_gtids(gtids["missing"])
+        if int(gtids["purged_applied"]) and int(gtids["no_errant"]):
+            # Assuming transactions of similar sizes across the binlogs
+            binlogs_size = sum(int(binlog["File_size"]) for binlog in binlogs)
+            method = "incremental"
+            transfer_size = binlogs_size * missing // max(_count_gtids(gtids["in_binlogs"]), 1)
+        else:
+            method = "clone"
+            transfer_size = int(gtids["data_size"])
+
+        logger.info(
+            f"Joining {instance_address} with {method} recovery, {missing} transactions "
+            f"missing, estimated transfer of {transfer_size} bytes"
+        )
+        return method
+
+    @contextmanager
+    def _tuned_clone(
+        self, donor: str, recipient: str, recipient_label: str, clone_variables: dict[str, dict]
+    ) -> Generator:
+        """Tune the clone variables of the donor and the recipient for the length of a join.
+
+        Each instance renders clone variables for its own resources, and the join uses
+        the lowest limits of both, with compression as configured on the recipient.
+        Both are restored to their rendered variables, as a donor shared by concurrent
+        joins may still be tuned by another one. The current values are only used for
+        units not reporting their rendered variables.
+        """
+        query = "SELECT " + ", ".join(f"@@GLOBAL.{name} AS {name}" for name in CLONE_VARIABLES)
+        executors = [
+            self._build_instance_tcp_executor(instance.split(":")[0])
+            for instance in (donor, recipient)
+        ]
+        donor_label = next(
+            (
+                label
+                for label, member in (self.get_cluster_topology() or {}).items()
+                if member["address"].split(":")[0] == donor.split(":")[0]
+            ),
+            None,
+        )
+
+        try:
+            donor_values, recipient_values = (
+                clone_variables.get(label) or executor.execute_sql(query)[0]
+                for label, executor in zip((donor_label, recipient_label), executors)
+            )
+        except (ExecutionError, IndexError, KeyError):
+            logger.warning("Failed to read the clone variables, cloning without tuning them")
+            yield
+            return
+
+        # Unlimited (zero) and unrendered (DEFAULT) values leave the other one applying
+        values = {
+            name: min(
+                (
+                    int(value)
+                    for value in (donor_values[name], recipient_values[name])
+                    if str(value).isdigit() and int(value)
+                ),
+                default="DEFAULT",
+            )
+            for name in CLONE_VARIABLES
+        }
+        values["clone_enable_compression"] = recipient_values["clone_enable_compression"]
+        logger.info(f"Cloning from {donor} with {values}")
+
+        def assign(executor: BaseExecutor, variables: dict) -> None:
+            # Rendered values are integers, ON/OFF or DEFAULT, all accepted unquoted
+            assignments = ", ".join(f"{name} = {variables[name]}" for name in CLONE_VARIABLES)
+            try:
+                executor.execute_sql(f"SET GLOBAL {assignments}")
+            except ExecutionError:
+                # The recipient restarts once cloned
+                logger.warning("Failed to set the clone variables")
+
+        for executor in executors:
+            assign(executor, values)
+        try:
+            yield
+        finally:
+            for executor, previous_values in zip(executors, (donor_values, recipient_values)):
+                assign(executor, previous_values)
+
+    def _get_clone_donor(self, from_instance: str, rank: int = 0) -> str | None:
+        """Get the clone donor of the given load rank, among the ONLINE secondaries.
+
+        Members are ranked by the transactions queued for certification and for
+        the applier, as reported by the group replication member stats. Concurrent
+        joins take different ranks, for them not to share donors.
+        """
+        query = (
+            "SELECT members.member_host, members.member_port "
+            "FROM performance_schema.replication_group_members AS members "
+            "JOIN performance_schema.replication_group_member_stats AS stats "
+            "USING (member_id) "
+            "WHERE members.member_state = 'ONLINE' AND members.member_role = 'SECONDARY' "
+            "ORDER BY stats.count_transactions_in_queue "
+            "+ stats.count_transactions_remote_in_applier_queue, members.member_host"
+        )
+        executor = self._build_instance_tcp_executor(from_instance)
+
+        try:
+            donors = executor.execute_sql(query)
+        except ExecutionError:
+            logger.warning("Failed to fetch the member stats, leaving the donor choice to MySQL")
+            return None
+
+        if not donors:
+            return None
+
+        donor = donors[rank % len(donors)]
+        return f"{donor['member_host']}:{donor['member_port']}"
+
     def _get_cluster_member_addresses(self, exclude_units: list[str]) -> list[str]:
         """Get the addresses of the cluster's members."""
         topology = self.get_cluster_topology()
@@ -2179,16 +3632,9 @@ class MySQLBase(ABC):
 
     def get_cluster_primary_address(self, from_instance: str | None = None) -> str | None:
         """Get the cluster primary's address."""
-        if not from_instance:
-            from_instance = self.instance_address
-
-        client = MySQLClusterClient(
-            executor=self._build_cluster_tcp_executor(from_instance),
-        )
-
         try:
             logger.debug("Getting cluster primary address")
-            status = client.fetch_cluster_status(self.cluster_name)
+            status = self._fetch_cluster_status(from_instance)
         except ExecutionError as e:
             raise MySQLGetClusterPrimaryAddressError() from e
 
@@ -2252,6 +3698,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLSetClusterPrimaryError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def get_mysql_version(self) -> str | None:
         """Get the running mysqld version."""
@@ -2281,9 +3729,28 @@ class MySQLBase(ABC):
         except ExecutionError as e:
             raise MySQLCheckUserExistenceError() from e
 
+    def update_user_max_connections(
+        self, username: str, max_connections: int, host: str = "%"
+    ) -> None:
+        """Updates the number of simultaneous connections allowed to a user."""
+        # Limit is set on the global primary
+        instance_address = self.get_cluster_global_primary_address()
+        if not instance_address:
+            raise MySQLUpdateUserMaxConnectionsError("No primary found")
+
+        executor = self._build_instance_tcp_executor(instance_address)
+
+        try:
+            executor.execute_sql(
+                f"ALTER USER '{username}'@'{host}' WITH MAX_USER_CONNECTIONS {max_connections}"
+            )
+        except ExecutionError as e:
+            raise MySQLUpdateUserMaxConnectionsError() from e
+
     @retry(
+        before_sleep=_record_retry,
         reraise=True,
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | _stop_on_unreachable_host,
         wait=wait_fixed(GET_MEMBER_ROLE_TIME),
     )
     def get_member_role(self) -> str:
@@ -2299,8 +3766,9 @@ class MySQLBase(ABC):
         return role.value
 
     @retry(
+        before_sleep=_record_retry,
         reraise=True,
-        stop=stop_after_attempt(3),
+        stop=stop_after_attempt(3) | _stop_on_unreachable_host,
         wait=wait_fixed(GET_MEMBER_STATE_TIME),
     )
     def get_member_state(self) -> str:
@@ -2315,6 +3783,46 @@ class MySQLBase(ABC):
 
         return state.value
 
+    @retry(
+        before_sleep=_record_retry,
+        reraise=True,
+        stop=stop_after_attempt(3) | _stop_on_unreachable_host,
+        wait=wait_fixed(GET_MEMBER_STATE_TIME),
+    )
+    def get_member_health(self) -> MemberHealth:
+        """Get member role and state, along with the group primary, in a single query."""
+        query = (
+            "SELECT member_id = @@server_uuid AS is_self, member_host, member_role, member_state "
+            "FROM performance_schema.replication_group_members"
+        )
+        executor = self._build_instance_tcp_executor(self.instance_address)
+
+        try:
+            rows = executor.execute_sql(query)
+        except ExecutionError as e:
+            raise MySQLUnableToGetMemberStateError() from e
+
+        member = next((row for row in rows if int(row["is_self"])), {})
+        primary = next(
+            (
+                row
+                for row in rows
+                if row["member_role"] == InstanceRole.PRIMARY
+                and row["member_state"] == InstanceState.ONLINE
+            ),
+            None,
+        )
+
+        return MemberHealth(
+            role=member.get("member_role") or "UNKNOWN",
+            state=member.get("member_state") or "UNKNOWN",
+            primary_address=primary["member_host"] if primary else None,
+            member_count=len(rows),
+            online_member_count=len([
+                row for row in rows if row["member_state"] == InstanceState.ONLINE
+            ]),
+        )
+
     def is_cluster_auto_rejoin_ongoing(self) -> bool:
         """Check if the instance is performing a cluster auto rejoin operation."""
         return self._instance_client_tcp.check_work_ongoing("%auto-rejoin%")
@@ -2343,11 +3851,13 @@ class MySQLBase(ABC):
         """Stop Group replication if enabled on the instance."""
         with suppress(ExecutionError):
             self._instance_client_tcp.stop_instance_replication()
+        self._cluster_status_snapshot.invalidate()
 
     def start_group_replication(self) -> None:
         """Start Group replication on the instance."""
         with suppress(ExecutionError):
             self._instance_client_tcp.start_instance_replication()
+        self._cluster_status_snapshot.invalidate()
 
     def force_quorum_from_instance(self) -> None:
         """Force quorum from the current instance.
@@ -2369,6 +3879,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLForceQuorumFromInstanceError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def reboot_from_complete_outage(self) -> None:
         """Wrapper for reboot_cluster_from_complete_outage command."""
@@ -2376,19 +3888,90 @@ class MySQLBase(ABC):
             self._cluster_client_tcp.reboot_cluster(self.cluster_name)
         except ExecutionError as e:
             raise MySQLRebootFromCompleteOutageError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
-    def hold_if_recovering(self) -> None:
-        """Hold execution if member is recovering."""
+    def get_recovery_progress(self) -> RecoveryProgress | None:
+        """Get the progress of the local member recovery, None when not recovering.
+
+        Clones report the bytes of their current stage, along with its throughput.
+        Incremental recoveries report the transactions applied out of those received
+        on the group replication recovery channel, without throughput.
+        """
+        clone_query = (
+            "SELECT stage, estimate, data, data_speed "
+            "FROM performance_schema.clone_progress "
+            "WHERE state = 'In Progress'"
+        )
+        recovery_query = (
+            "SELECT received_transaction_set AS received, "
+            "GTID_SUBTRACT(received_transaction_set, @@gtid_executed) AS backlog "
+            "FROM performance_schema.replication_connection_status "
+            "WHERE channel_name = 'group_replication_recovery' AND service_state = 'ON'"
+        )
+        executor = self._build_instance_tcp_executor(self.instance_address)
+
+        try:
+            rows = executor.execute_sql(clone_query)
+        except ExecutionError:
+            # The clone plugin may not be installed
+            rows = []
+
+        if rows:
+            return RecoveryProgress(
+                stage=rows[0]["stage"].lower().replace("_", " "),
+                done=int(rows[0]["data"] or 0),
+                total=int(rows[0]["estimate"] or 0),
+                speed=float(rows[0]["data_speed"] or 0) or None,
+            )
+
+        try:
+            rows = executor.execute_sql(recovery_query)
+        except ExecutionError:
+            logger.debug("Failed to query the recovery channel")
+            return None
+
+        if not rows:
+            return None
+
+        received = _count_gtids(rows[0]["received"] or "")
+        return RecoveryProgress(
+            stage="incremental",
+            done=received - _count_gtids(rows[0]["backlog"] or ""),
+            total=received,
+        )
+
+    def hold_if_recovering(
+        self, on_progress: Callable[[RecoveryProgress], None] | None = None
+    ) -> str | None:
+        """Hold execution while the member is recovering, returning once it is not.
+
+        Progress is reported to `on_progress` on every check, the throughput of
+        incremental recoveries being measured between checks.
+
+        Returns:
+            The member state it left recovering for, None if it could not be read.
+        """
+        previous, previous_time = None, 0.0
         while True:
             try:
                 member_state = self.get_member_state()
             except MySQLUnableToGetMemberStateError:
-                break
-            if member_state == InstanceState.RECOVERING:
-                logger.debug("Unit is recovering")
-                time.sleep(RECOVERY_CHECK_TIME)
-            else:
-                break
+                return None
+            if member_state != InstanceState.RECOVERING:
+                return member_state
+
+            logger.debug("Unit is recovering")
+            if on_progress and (progress := self.get_recovery_progress()):
+                now = time.monotonic()
+                if progress.speed is None and previous and previous.stage == progress.stage:
+                    progress = progress._replace(
+                        speed=(progress.done - previous.done) / (now - previous_time)
+                    )
+                previous, previous_time = progress, now
+                on_progress(progress)
+
+            time.sleep(RECOVERY_CHECK_TIME)
 
     def set_instance_offline_mode(self, offline_mode: bool = False) -> None:
         """Sets the instance offline_mode."""
@@ -2398,6 +3981,8 @@ class MySQLBase(ABC):
             self._instance_client_tcp.set_instance_variable(Scope.GLOBAL, "offline_mode", mode)
         except ExecutionError as e:
             raise MySQLSetInstanceOfflineModeError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def set_instance_option(self, option: str, value: Any) -> None:
         """Sets an instance option."""
@@ -2410,6 +3995,8 @@ class MySQLBase(ABC):
             )
         except ExecutionError as e:
             raise MySQLSetInstanceOptionError() from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def offline_mode_and_hidden_instance_exists(self) -> bool:
         """Indicates whether an instance exists in offline_mode and hidden from router."""
@@ -2436,7 +4023,6 @@ class MySQLBase(ABC):
         # Reference: based off xtradb-cluster-operator
         # https://github.com/percona/percona-xtradb-cluster-operator/blob/main/pkg/pxc/app/config/autotune.go#L31-L54
 
-        chunk_size_min = BYTES_1MiB
         chunk_size_default = 128 * BYTES_1MiB
         group_replication_message_cache_default = BYTES_1GiB
 
@@ -2455,13 +4041,14 @@ class MySQLBase(ABC):
                 pool_size += chunk_size_default - (pool_size % chunk_size_default)
 
             if pool_size > BYTES_1GiB:
-                chunk_size = int(pool_size / 8)
+                # Chunks only grow in powers of two, for most memory changes to resize
+                # the buffer pool online. MySQL advises against more than 1000 chunks
+                chunk_size = BUFFER_POOL_CHUNK_SIZE_MIN
+                while pool_size > BUFFER_POOL_MAX_CHUNKS * chunk_size:
+                    chunk_size *= 2
 
-                if chunk_size % chunk_size_min != 0:
-                    # round chunk_size to a multiple of chunk_size_min
-                    chunk_size += chunk_size_min - (chunk_size % chunk_size_min)
-
-                pool_size = chunk_size * 8
+                # round pool_size down to a multiple of the chunks of the 8 instances
+                pool_size -= pool_size % (8 * chunk_size)
 
                 innodb_buffer_pool_chunk_size = chunk_size
 
@@ -2489,11 +4076,161 @@ class MySQLBase(ABC):
 
         return available_memory // bytes_per_connection
 
+    def get_thread_parameters(self, cpus: int) -> dict[str, int | str]:
+        """Calculate the thread and parallelism parameters for the instance, from its CPUs.
+
+        MySQL defaults are kept as a floor for I/O and applier threads, for small instances
+        not to be starved, while purge threads and table cache instances follow the CPUs.
+        """
+        return {
+            "innodb_read_io_threads": min(max(cpus // 2, 4), 64),
+            "innodb_write_io_threads": min(max(cpus // 2, 4), 64),
+            "innodb_parallel_read_threads": min(max(cpus // 2, 4), 256),
+            "innodb_purge_threads": min(max(cpus // 4, 1), 32),
+            "replica_parallel_workers": min(max(cpus, 4), 64),
+            # Removed on MySQL 8.4, where WRITESET is always used
+            "loose-binlog_transaction_dependency_tracking": "WRITESET",
+            "table_open_cache_instances": min(max(cpus, 1), 16),
+        }
+
+    def get_redo_log_capacity(
+        self,
+        buffer_pool_size: int,
+        write_rate: float | None = None,
+        checkpoint_age: int = 0,
+    ) -> int:
+        """Calculate the redo log capacity for the instance.
+
+        The redo log is sized to a quarter of the buffer pool, and to hold
+        REDO_LOG_WRITE_WINDOW seconds of writes at the observed rate, in bytes per second.
+        A known checkpoint age is kept under half the capacity, past which flushing
+        turns aggressive and writes start to stall.
+        """
+        capacity = max(
+            buffer_pool_size // 4,
+            int((write_rate or 0) * REDO_LOG_WRITE_WINDOW),
+            2 * checkpoint_age,
+        )
+        capacity = min(max(capacity, REDO_LOG_CAPACITY_MIN), REDO_LOG_CAPACITY_MAX)
+        return capacity - capacity % BYTES_1MiB
+
+    def get_redo_log_status(self) -> RedoLogStatus | None:
+        """Get the redo log usage of the instance, None when unknown.
+
+        Requires MySQL 8.0.30 or later, for the redo log capacity to be dynamic.
+        """
+        status_query = (
+            "SELECT variable_value FROM performance_schema.global_status "
+            "WHERE variable_name = 'Innodb_redo_log_{}'"
+        )
+        query = (
+            "SELECT @@innodb_redo_log_capacity AS capacity, "
+            "@@innodb_buffer_pool_size AS buffer_pool_size, "
+            f"({status_query.format('current_lsn')}) AS current_lsn, "
+            f"({status_query.format('checkpoint_lsn')}) AS checkpoint_lsn, "
+            f"({status_query.format('resize_status')}) AS resize_status"
+        )
+        executor = self._build_instance_tcp_executor(self.instance_address)
+
+        try:
+            row = executor.execute_sql(query)[0]
+            return RedoLogStatus(
+                capacity=int(row["capacity"]),
+                buffer_pool_size=int(row["buffer_pool_size"]),
+                current_lsn=int(row["current_lsn"]),
+                checkpoint_lsn=int(row["checkpoint_lsn"]),
+                resize_status=row["resize_status"],
+            )
+        except (ExecutionError, IndexError, TypeError, ValueError):
+            logger.debug("Failed to query the redo log status")
+            return None
+
+    def get_io_parameters(self, storage_probe: StorageProbe, cpus: int) -> dict[str, int | str]:
+        """Calculate the InnoDB flushing parameters for the instance, from its storage.
+
+        Background flushing gets half the measured random write IOPS, the other half being
+        left to foreground writes, and may burst up to what the volume sustains in 16KiB
+        pages. Neighbour pages are only flushed together on spinning disk like volumes,
+        and dedicated log writer threads only run when fsyncs are fast enough for the log
+        writes not to be I/O bound, with CPUs to spare for them.
+        """
+        iops = storage_probe.random_write_iops
+        sequential_pages = storage_probe.sequential_throughput // INNODB_PAGE_SIZE
+
+        io_capacity = min(max(iops // 2, 200), 20000)
+        io_capacity_max = min(max(min(iops, sequential_pages), 2 * io_capacity), 40000)
+
+        return {
+            "innodb_io_capacity": io_capacity,
+            "innodb_io_capacity_max": io_capacity_max,
+            "innodb_flush_neighbors": 1 if iops < 1000 else 0,
+            "innodb_log_writer_threads": (
+                "ON" if storage_probe.fsync_latency < 0.001 and cpus >= 4 else "OFF"
+            ),
+        }
+
+    def get_clone_parameters(
+        self,
+        buffers_memory: int,
+        max_concurrency: int | None = None,
+        max_bandwidth: int | None = None,
+        compression: str = "auto",
+    ) -> dict[str, int | str]:
+        """Calculate the clone parameters for the instance, from its resources.
+
+        Threads follow the available CPUs, and the buffer takes a 1024th of the
+        `buffers_memory`, the memory left after the InnoDB buffer pool and the group
+        replication message cache, between 1MiB and 64MiB.
+        The network bandwidth leaves a quarter of a known link to production traffic,
+        and is compressed on links up to 1Gb/s when there are CPUs to spare for it.
+        `max_bandwidth`, in MiB/s, caps both the data and network bandwidths.
+        """
+        cpus = self.get_available_cpus()
+        link_speed = self.get_link_speed()
+
+        network_bandwidth = 0  # unlimited
+        if link_speed:
+            network_bandwidth = link_speed * 10**6 // 8 * 3 // 4 // BYTES_1MiB
+        if max_bandwidth:
+            network_bandwidth = min(network_bandwidth or max_bandwidth, max_bandwidth)
+
+        if compression == "auto":
+            compression = "on" if link_speed and link_speed <= 1000 and cpus >= 4 else "off"
+
+        return {
+            "clone_max_concurrency": max_concurrency or min(cpus, CLONE_MAX_CONCURRENCY),
+            "clone_buffer_size": min(max(buffers_memory // 1024 // BYTES_1MiB, 1), 64)
+            * BYTES_1MiB,
+            "clone_max_data_bandwidth": max_bandwidth or 0,
+            "clone_max_network_bandwidth": network_bandwidth,
+            "clone_enable_compression": compression.upper(),
+        }
+
     @abstractmethod
     def get_available_memory(self) -> int:
         """Platform dependent method to get the available memory for mysql-server."""
         raise NotImplementedError
 
+    def get_available_cpus(self) -> int:
+        """Platform dependent method to get the CPUs available to mysql-server.
+
+        Defaults to running `nproc` on the server where MySQL is running.
+        """
+        try:
+            nproc, _ = self._execute_commands(["nproc"])
+            return int(nproc)
+        except (MySQLExecError, ValueError):
+            logger.warning("Failed to query the available CPUs")
+            return 1
+
+    def get_link_speed(self) -> int | None:
+        """Platform dependent method to get the speed in Mb/s of the instance link, if known."""
+        return None
+
+    def get_storage_probe(self) -> StorageProbe | None:
+        """Platform dependent method to get the data volume write performance, if measured."""
+        return None
+
     def execute_backup_commands(
         self,
         s3_path: str,
@@ -2508,11 +4245,10 @@ class MySQLBase(ABC):
         group: str | None = None,
     ) -> tuple[str, str]:
         """Executes commands to create a backup with the given args."""
-        nproc_command = ["nproc"]
         make_temp_dir_command = f"mktemp --directory {tmp_base_directory}/xtra_backup_XXXX".split()
 
         try:
-            nproc, _ = self._execute_commands(nproc_command)
+            nproc = self.get_available_cpus()
             tmp_dir, _ = self._execute_commands(make_temp_dir_command, user=user, group=group)
         except MySQLExecError as e:
             logger.error("Failed to execute commands prior to running backup")
@@ -2616,13 +4352,12 @@ class MySQLBase(ABC):
         group: str | None = None,
     ) -> tuple[str, str, str]:
         """Retrieve the specified backup from S3."""
-        nproc_command = ["nproc"]
         make_temp_dir_command = (
             f"mktemp --directory {temp_restore_directory}/#mysql_sst_XXXX".split()
         )
 
         try:
-            nproc, _ = self._execute_commands(nproc_command)
+            nproc = self.get_available_cpus()
 
             tmp_dir, _ = self._execute_commands(
                 make_temp_dir_command,
@@ -2891,15 +4626,22 @@ class MySQLBase(ABC):
         require_tls: bool = False,
     ) -> None:
         """Setup TLS files and requirement mode."""
-        tls_var = "require_secure_transport"
-        tls_val = "ON" if require_tls else "OFF"
+        variables = {
+            "ssl_ca": ca_path,
+            "ssl_key": key_path,
+            "ssl_cert": cert_path,
+            "require_secure_transport": "ON" if require_tls else "OFF",
+        }
+        executor = self._build_instance_tcp_executor(self.instance_address)
 
         try:
-            self._instance_client_tcp.set_instance_variable(Scope.PERSIST, "ssl_ca", ca_path)
-            self._instance_client_tcp.set_instance_variable(Scope.PERSIST, "ssl_key", key_path)
-            self._instance_client_tcp.set_instance_variable(Scope.PERSIST, "ssl_cert", cert_path)
-            self._instance_client_tcp.set_instance_variable(Scope.PERSIST, tls_var, tls_val)
-            self._instance_client_tcp.reload_instance_certs()
+            with self._sql_batch(executor) as batch:
+                for name, value in variables.items():
+                    batch.add(
+                        f"SET @@PERSIST.{self._quoter.quote_identifier(name)} = "
+                        f"{self._quoter.quote_value(value)}"
+                    )
+                batch.add("ALTER INSTANCE RELOAD TLS")
         except ExecutionError as e:
             raise MySQLTLSSetupError() from e
 
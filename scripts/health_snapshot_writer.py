@@ -0,0 +1,203 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Write a periodically refreshed snapshot of the local MySQL instance health.
+
+Also dispatch an event when the group replication membership seen by the instance changes.
+"""
+
+import json
+import logging
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+import mysql.connector
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = 5  # seconds
+CONNECTION_TIMEOUT = 5  # seconds
+ACCESS_DENIED_ERROR_CODE = 1045
+
+MEMBERS_QUERY = (
+    "SELECT member_id = @@server_uuid AS is_self, member_host, member_role, member_state "
+    "FROM performance_schema.replication_group_members"
+)
+APPLIER_QUEUE_QUERY = (
+    "SELECT count_transactions_remote_in_applier_queue AS applier_queue "
+    "FROM performance_schema.replication_group_member_stats "
+    "WHERE member_id = @@server_uuid"
+)
+RECOVERY_QUERY = (
+    "SELECT service_state "
+    "FROM performance_schema.replication_connection_status "
+    "WHERE channel_name = 'group_replication_recovery'"
+)
+CLONE_QUERY = (
+    "SELECT stage, estimate, data "
+    "FROM performance_schema.clone_progress "
+    "WHERE state = 'In Progress'"
+)
+
+
+def dispatch(run_command, unit, charm_directory, changes):
+    """Use the juju-run command to dispatch :class:`GroupMembershipChangeEvent`."""
+    dispatch_sub_command = (
+        "JUJU_DISPATCH_PATH=hooks/group_membership_change GROUP_MEMBERSHIP_CHANGES={} {}/dispatch"
+    )
+    # Not waited for, juju-run blocking while other hooks run. Input generated by the charm
+    return subprocess.Popen([  # noqa: S603
+        run_command,
+        "-u",
+        unit,
+        dispatch_sub_command.format(shlex.quote(json.dumps(changes)), charm_directory),
+    ])
+
+
+def membership_changes(previous_members, members):
+    """List the members that joined, left, or changed role or state."""
+    changes = []
+    for host in sorted(previous_members.keys() | members.keys()):
+        previous_role, previous_state = previous_members.get(host, (None, None))
+        role, state = members.get(host, (None, None))
+        if (previous_role, previous_state) != (role, state):
+            changes.append({
+                "host": host,
+                "previous-role": previous_role,
+                "previous-state": previous_state,
+                "role": role,
+                "state": state,
+            })
+
+    return changes
+
+
+def fetch_all(connection, query):
+    """Run a query, returning its rows as dictionaries."""
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute(query)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def build_snapshot(connection):
+    """Build the health snapshot from the instance performance schema."""
+    members = fetch_all(connection, MEMBERS_QUERY)
+    member = next((row for row in members if int(row["is_self"])), {})
+    primary = next(
+        (
+            row
+            for row in members
+            if row["member_role"] == "PRIMARY" and row["member_state"] == "ONLINE"
+        ),
+        None,
+    )
+
+    snapshot = {
+        "mysqld_alive": True,
+        "members": {
+            row["member_host"]: [row["member_role"] or None, row["member_state"] or None]
+            for row in members
+        },
+        "member_role": member.get("member_role") or "UNKNOWN",
+        "member_state": member.get("member_state") or "UNKNOWN",
+        "primary_address": primary["member_host"] if primary else None,
+        "member_count": len(members),
+        "online_member_count": len([row for row in members if row["member_state"] == "ONLINE"]),
+        "applier_queue": None,
+        "recovery_channel_state": None,
+        "clone": None,
+    }
+
+    # Recovery details are best effort, the member fields above being the essential ones
+    try:
+        rows = fetch_all(connection, APPLIER_QUEUE_QUERY)
+        snapshot["applier_queue"] = int(rows[0]["applier_queue"]) if rows else None
+
+        rows = fetch_all(connection, RECOVERY_QUERY)
+        snapshot["recovery_channel_state"] = rows[0]["service_state"] if rows else None
+
+        rows = fetch_all(connection, CLONE_QUERY)
+        if rows:
+            snapshot["clone"] = {
+                "stage": rows[0]["stage"],
+                "estimate": int(rows[0]["estimate"] or 0),
+                "data": int(rows[0]["data"] or 0),
+            }
+    except mysql.connector.Error:
+        logger.exception("Unable to query recovery progress")
+
+    return snapshot
+
+
+def write_snapshot(path, snapshot):
+    """Atomically replace the snapshot file."""
+    snapshot["timestamp"] = time.time()
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(snapshot, file)
+    os.replace(temporary_path, path)
+
+
+def main():
+    """Main refresh loop.
+
+    Keep a single connection to the instance, reopened when lost, and refresh the
+    snapshot every 5 seconds, dispatching an event on membership changes. The password
+    is read from the standard input.
+    """
+    run_command, unit, charm_directory, user, socket_path, snapshot_path = sys.argv[1:]
+    password = sys.stdin.readline().strip()
+
+    connection = None
+    previous_members = None
+    dispatches = []
+    while True:
+        try:
+            if connection is None or not connection.is_connected():
+                connection = mysql.connector.connect(
+                    user=user,
+                    password=password,
+                    unix_socket=socket_path,
+                    autocommit=True,
+                    connection_timeout=CONNECTION_TIMEOUT,
+                )
+            snapshot = build_snapshot(connection)
+        except mysql.connector.Error as e:
+            if e.errno == ACCESS_DENIED_ERROR_CODE:
+                # Credentials were rotated, the charm starts a new writer
+                print(f"Exiting on authentication failure: {e}")
+                sys.exit(1)
+
+            print(f"Unable to query mysqld: {e}")
+            sys.stdout.flush()
+            connection = None
+            snapshot = {"mysqld_alive": False}
+
+        write_snapshot(snapshot_path, snapshot)
+
+        if snapshot["mysqld_alive"]:
+            members = {host: tuple(value) for host, value in snapshot["members"].items()}
+            changes = (
+                membership_changes(previous_members, members)
+                if previous_members is not None
+                else []
+            )
+            if changes:
+                print(f"Detected group membership changes {changes}")
+                sys.stdout.flush()
+                dispatches.append(dispatch(run_command, unit, charm_directory, changes))
+            previous_members = members
+
+        dispatches = [process for process in dispatches if process.poll() is None]
+        time.sleep(REFRESH_INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,14 @@ from ops.main import main
 if is_wrong_architecture() and __name__ == "__main__":
     main(WrongArchitectureWarningCharm)
 
+import json
 import logging
-import random
+import math
+import os
 import socket
 import subprocess
-from time import sleep
+from collections import Counter
+from time import monotonic, time
 
 import ops
 from charms.data_platform_libs.v0.data_models import TypedCharmBase
@@ -28,9 +31,15 @@ from charms.mysql.v0.async_replication import (
 )
 from charms.mysql.v0.backups import S3_INTEGRATOR_RELATION_NAME, MySQLBackups
 from charms.mysql.v0.mysql import (
+    BYTES_1MB,
+    EXECUTOR_CALLS,
+    HOST_CIRCUIT_BREAKER,
+    MONITORING_USER_MAX_CONNECTIONS,
+    REDO_LOG_WRITE_WINDOW,
     UNIT_ADD_LOCKNAME,
     Error,
     InstanceState,
+    MemberHealth,
     MySQLAddInstanceToClusterError,
     MySQLCharmBase,
     MySQLConfigureInstanceError,
@@ -46,7 +55,11 @@ from charms.mysql.v0.mysql import (
     MySQLRebootFromCompleteOutageError,
     MySQLRejoinInstanceToClusterError,
     MySQLSetClusterPrimaryError,
+    MySQLSetVariableError,
     MySQLUnableToGetMemberStateError,
+    MySQLUpdateUserMaxConnectionsError,
+    RecoveryProgress,
+    Scopes,
 )
 from charms.mysql.v0.tls import MySQLTLS
 from charms.rolling_ops.v0.rollingops import RollingOpsManager
@@ -66,6 +79,7 @@ from ops import (
     WaitingStatus,
 )
 from tenacity import (
+    RetryCallState,
     RetryError,
     Retrying,
     retry_if_exception_type,
@@ -85,6 +99,7 @@ from constants import (
     CLUSTER_ADMIN_USERNAME,
     COS_AGENT_RELATION_NAME,
     DB_RELATION_NAME,
+    EXECUTOR_CALLS_FILE,
     GR_MAX_MEMBERS,
     MONITORING_PASSWORD_KEY,
     MONITORING_USERNAME,
@@ -93,12 +108,20 @@ from constants import (
     MYSQLD_SOCK_FILE,
     PASSWORD_LENGTH,
     PEER,
+    REDO_LOG_SAMPLE_FILE,
+    RESTART_TIMINGS_FILE,
+    RESTART_TIMINGS_KEPT,
     ROOT_PASSWORD_KEY,
     SERVER_CONFIG_PASSWORD_KEY,
     SERVER_CONFIG_USERNAME,
     TRACING_PROTOCOL,
 )
 from flush_mysql_logs import FlushMySQLLogsCharmEvents, MySQLLogs
+from health_snapshot import (
+    GroupMembershipChangeCharmEvents,
+    GroupMembershipChangeEvent,
+    HealthSnapshot,
+)
 from hostname_resolution import MySQLMachineHostnameResolution
 from ip_address_observer import IPAddressChangeCharmEvents
 from log_rotation_setup import LogRotationSetup
@@ -130,7 +153,9 @@ class MySQLDNotRestartedError(Error):
     """Exception raised when MySQLD is not restarted after configuring instance."""
 
 
-class MySQLCustomCharmEvents(FlushMySQLLogsCharmEvents, IPAddressChangeCharmEvents):
+class MySQLCustomCharmEvents(
+    FlushMySQLLogsCharmEvents, GroupMembershipChangeCharmEvents, IPAddressChangeCharmEvents
+):
     """Custom event sources for the charm."""
 
 
@@ -164,12 +189,26 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
     def __init__(self, *args):
         super().__init__(*args)
 
+        # MySQL helper object and operation counters, reset on every dispatch
+        self._mysql_cache: tuple[tuple, MySQL] | None = None
+        self._dispatch_counters = Counter()
+
+        self.framework.observe(self.framework.on.commit, self._on_commit)
+        for event in (
+            self.on[PEER].relation_created,
+            self.on[PEER].relation_joined,
+            self.on[PEER].relation_changed,
+            self.on[PEER].relation_departed,
+        ):
+            self.framework.observe(event, self._invalidate_mysql_cache)
+
         self.framework.observe(self.on.install, self._on_install)
         self.framework.observe(self.on.leader_elected, self._on_leader_elected)
         self.framework.observe(self.on.leader_settings_changed, self._on_leader_settings_changed)
         self.framework.observe(self.on.config_changed, self._on_config_changed)
         self.framework.observe(self.on.start, self._on_start)
         self.framework.observe(self.on.update_status, self._on_update_status)
+        self.framework.observe(self.on.group_membership_change, self._on_group_membership_change)
         self.framework.observe(
             self.on.database_storage_detaching, self._on_database_storage_detaching
         )
@@ -204,6 +243,7 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         self.s3_integrator = S3Requirer(self, S3_INTEGRATOR_RELATION_NAME)
         self.backups = MySQLBackups(self, self.s3_integrator)
         self.hostname_resolution = MySQLMachineHostnameResolution(self)
+        self.health_snapshot = HealthSnapshot(self)
         self.upgrade = MySQLVMUpgrade(
             self,
             dependency_model=get_mysql_dependencies_model(),
@@ -269,7 +309,7 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         """Handle the leader settings changed event."""
         self.unit_peer_data.update({"leader": "false"})
 
-    def _on_config_changed(self, _) -> None:
+    def _on_config_changed(self, _) -> None:  # noqa: C901
         """Handle the config changed event."""
         if not self._is_peer_data_set:
             # skip when not initialized
@@ -314,8 +354,23 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
                 if config not in new_config_dict:
                     # skip removed configs
                     continue
+                if config == "innodb_buffer_pool_size":
+                    # resized online, in chunk multiples
+                    try:
+                        self._mysql.resize_buffer_pool(int(new_config_dict[config]))
+                    except MySQLSetVariableError:
+                        logger.exception("Failed to resize the buffer pool online, restarting")
+                        self.on[f"{self.restart.name}"].acquire_lock.emit()
+                    continue
+                value = new_config_dict[config]
+                if config == "innodb_redo_log_capacity" and int(value) < int(
+                    previous_config.get(config, 0)
+                ):
+                    # never shrunk online, the rendered capacity applies on restart
+                    continue
+                # Integer variables do not accept quoted values
                 self._mysql.set_dynamic_variable(
-                    config.removeprefix("loose-"), new_config_dict[config]
+                    config.removeprefix("loose-"), int(value) if value.isdigit() else value
                 )
 
     def _on_start(self, event: StartEvent) -> None:
@@ -395,36 +450,44 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         if not self._mysql.is_instance_in_cluster(self.unit_label):
             return
 
-        def _get_leader_unit() -> Unit | None:
-            """Get the leader unit."""
-            for unit in self.peers.units:
-                if self.peers.data[unit]["leader"] == "true":
-                    return unit
-
-        if self.is_unit_primary() and not self.unit.is_leader():
-            # Preemptively switch primary to unit leader
-            logger.info("Switching primary to the leader unit")
-            if leader_unit := _get_leader_unit():
-                try:
-                    self._mysql.set_cluster_primary(
-                        new_primary_address=self.get_unit_address(leader_unit, PEER)
-                    )
-                except MySQLSetClusterPrimaryError:
-                    logger.warning("Failed to switch primary to leader unit")
-
         # If instance is part of a replica cluster, locks are managed by
         # the primary cluster primary (i.e. cluster set global primary)
-        from_instance = None
+        lock_instance = None
         if self._mysql.is_cluster_replica():
-            from_instance = self._mysql.get_cluster_global_primary_address()
-
-        # The following operation uses locks to ensure that only one instance is removed
-        # from the cluster at a time (to avoid split-brain or lack of majority issues)
-        self._mysql.remove_instance(self.unit_label, from_instance=from_instance)
+            lock_instance = self._mysql.get_cluster_global_primary_address()
+
+        # The first departing unit to take the removal lock removes all the departing
+        # instances at once, in an order keeping the majority (to avoid split-brain
+        # or lack of majority issues), switching the primary beforehand if departing
+        self._mysql.remove_instances(
+            self.unit_label,
+            self._get_departing_unit_labels(),
+            lock_instance=lock_instance,
+        )
 
         # Inform other hooks of current status
         self.unit_peer_data["unit-status"] = "removing"
 
+    def _get_departing_unit_labels(self) -> list[str]:
+        """Get the labels of the units being removed, this one included.
+
+        Departing units are the ones Juju reports as dying in the goal state.
+        """
+        try:
+            goal_state = json.loads(
+                subprocess.check_output(["goal-state", "--format=json"], text=True)  # noqa: S607
+            )
+            labels = {
+                name.replace("/", "-")
+                for name, unit in goal_state.get("units", {}).items()
+                if unit["status"] == "dying"
+            }
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError, KeyError):
+            logger.warning("Unable to get the goal state, removing this unit only")
+            return [self.unit_label]
+
+        return sorted(labels | {self.unit_label})
+
     def _handle_non_online_instance_status(self, state: str) -> bool:
         """Helper method to handle non-online instance statuses.
 
@@ -506,13 +569,12 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
             logger.warning("Instance does not have ONLINE peers. Cannot perform manual rejoin")
             return
 
-        # add random delay to mitigate collisions when multiple units are rejoining
-        # due the difference between the time we test for locks and acquire them
-        # Not used for cryptographic purpose
-        sleep(random.uniform(0, 1.5))  # noqa: S311
-
-        if self._mysql.are_locks_acquired(cluster_primary, UNIT_ADD_LOCKNAME):
-            logger.info("waiting: cluster lock is held")
+        # Rejoining units queue for the lock along with the joining ones
+        position = self._mysql.get_lock_queue_position(
+            cluster_primary, UNIT_ADD_LOCKNAME, self.unit_label
+        )
+        if position is None or position > 0:
+            logger.info(f"waiting: cluster lock is held, {position} units ahead in queue")
             return
         try:
             self._mysql.rejoin_instance_to_cluster(
@@ -533,6 +595,8 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
             instance_address=self.unit_address,
             instance_unit_label=self.unit_label,
             from_instance=cluster_primary,
+            on_clone_donor=self._report_clone_donor,
+            clone_variables=self._get_clone_variables(),
         )
 
     def _on_update_status(self, _) -> None:  # noqa: C901
@@ -577,11 +641,11 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
 
         # retrieve and persist state for every unit
         try:
-            role = self._mysql.get_member_role()
-            state = self._mysql.get_member_state()
+            health = self.get_member_health()
         except MySQLUnableToGetMemberStateError:
-            role = "UNKNOWN"
-            state = "UNREACHABLE"
+            health = MemberHealth("UNKNOWN", "UNREACHABLE", None, 0, 0)
+
+        role, state = health.role, health.state
 
         logger.info(f"Unit workload member-state is {state} with member-role {role}")
 
@@ -601,11 +665,21 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         if not self._handle_non_online_instance_status(state):
             return
 
+        if state == InstanceState.ONLINE:
+            self._tune_redo_log_capacity()
+
         if self.unit.is_leader() and state == InstanceState.ONLINE:
-            try:
-                primary_address = self._mysql.get_cluster_primary_address()
-            except MySQLGetClusterPrimaryAddressError:
+            primary_address = health.primary_address
+            if health.online_member_count * 2 <= health.member_count:
+                # a minority partition still lists its primary, the cluster status tells
+                # whether the group has quorum
                 primary_address = None
+            if not primary_address:
+                # only fetch the full cluster status when the group shows no usable primary
+                try:
+                    primary_address = self._mysql.get_cluster_primary_address()
+                except MySQLGetClusterPrimaryAddressError:
+                    primary_address = None
 
             if not primary_address:
                 logger.error("Cluster has no primary. Check cluster status on online units.")
@@ -619,6 +693,42 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
             # Set active status when primary is known
             self.app.status = ActiveStatus()
 
+            self._update_monitoring_user_max_connections()
+
+    def _update_monitoring_user_max_connections(self) -> None:
+        """Allow the monitoring user the connections of the exporter and the health writer.
+
+        Monitoring users created before the health snapshot writer allow fewer connections.
+        """
+        if self.app_peer_data.get("monitoring-max-connections") == str(
+            MONITORING_USER_MAX_CONNECTIONS
+        ):
+            return
+
+        try:
+            self._mysql.update_user_max_connections(
+                MONITORING_USERNAME, MONITORING_USER_MAX_CONNECTIONS
+            )
+        except (MySQLGetClusterPrimaryAddressError, MySQLUpdateUserMaxConnectionsError):
+            logger.exception("Failed to update the monitoring user connections limit")
+            return
+
+        self.app_peer_data["monitoring-max-connections"] = str(MONITORING_USER_MAX_CONNECTIONS)
+
+    def _on_group_membership_change(self, event: GroupMembershipChangeEvent) -> None:
+        """Handle group replication membership changes, as seen by the local instance.
+
+        Reacts right away to the changes otherwise noticed on the next update-status.
+        """
+        for change in event.changes:
+            logger.info(
+                f"Group member {change['host']} changed from "
+                f"{change['previous-state']}/{change['previous-role']} to "
+                f"{change['state']}/{change['role']}"
+            )
+
+        self.update_endpoints()
+
     def _on_cos_agent_relation_created(self, event: RelationCreatedEvent) -> None:
         """Handle the cos_agent relation created event.
 
@@ -652,12 +762,23 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
 
     @property
     def _mysql(self):
-        """Returns an instance of the MySQL object."""
-        return MySQL(
-            self.unit_fqdn,
-            MYSQLD_SOCK_FILE,
+        """Returns an instance of the MySQL object.
+
+        The instance is built once per dispatch, and rebuilt whenever the secrets,
+        the cluster names or the peer relation change.
+        """
+        cache_key = (
             self.app_peer_data["cluster-name"],
             self.app_peer_data["cluster-set-domain-name"],
+        )
+        if self._mysql_cache and self._mysql_cache[0] == cache_key:
+            return self._mysql_cache[1]
+
+        self._dispatch_counters["mysql-builds"] += 1
+        mysql = MySQL(
+            self.unit_fqdn,
+            MYSQLD_SOCK_FILE,
+            *cache_key,
             self.get_secret("app", ROOT_PASSWORD_KEY),  # pyright: ignore [reportArgumentType]
             SERVER_CONFIG_USERNAME,
             self.get_secret("app", SERVER_CONFIG_PASSWORD_KEY),  # pyright: ignore [reportArgumentType]
@@ -669,6 +790,70 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
             self.get_secret("app", BACKUPS_PASSWORD_KEY),  # pyright: ignore [reportArgumentType]
             self,
         )
+        self._mysql_cache = (cache_key, mysql)
+        return mysql
+
+    def _invalidate_mysql_cache(self, _=None) -> None:
+        """Discard the MySQL object, to have it rebuilt on the next access."""
+        self._mysql_cache = None
+
+    def get_secret(self, scope: Scopes, key: str) -> str | None:
+        """Get secret from the secret storage, counting the reads."""
+        self._dispatch_counters["secret-reads"] += 1
+        return super().get_secret(scope, key)
+
+    def set_secret(self, scope: Scopes, key: str, value: str | None) -> None:
+        """Set a secret in the secret storage, invalidating the MySQL object."""
+        super().set_secret(scope, key, value)
+        self._invalidate_mysql_cache()
+
+    def remove_secret(self, scope: Scopes, key: str) -> None:
+        """Remove a secret from the secret storage, invalidating the MySQL object."""
+        super().remove_secret(scope, key)
+        self._invalidate_mysql_cache()
+
+    def _on_commit(self, _) -> None:
+        """Log the operation counters and the executor calls of the dispatch."""
+        summary = EXECUTOR_CALLS.summary()
+        summary["unreachable_hosts"] = HOST_CIRCUIT_BREAKER.tripped_hosts
+        slowest = sorted(
+            summary["operations"].items(), key=lambda item: item[1]["total_time"], reverse=True
+        )[:3]
+        slowest_text = ", ".join(
+            f"{operation} {stats['total_time']}s" for operation, stats in slowest
+        )
+
+        logger.info(
+            f"Dispatch built the MySQL object {self._dispatch_counters['mysql-builds']} times"
+            f" and read {self._dispatch_counters['secret-reads']} secrets;"
+            f" {summary['calls']} executor calls took {summary['total_time']}s"
+            f" ({summary['errors']} errors, {summary['retries']} retries)"
+            + (f", slowest: {slowest_text}" if slowest else "")
+            + (
+                f", unreachable hosts: {', '.join(summary['unreachable_hosts'])}"
+                if summary["unreachable_hosts"]
+                else ""
+            )
+        )
+
+        if summary["calls"]:
+            self._write_executor_calls_summary(summary)
+
+        EXECUTOR_CALLS.reset()
+        HOST_CIRCUIT_BREAKER.reset()
+        self._dispatch_counters.clear()
+
+    def _write_executor_calls_summary(self, summary: dict) -> None:
+        """Write the executor calls summary of the dispatch, keeping the last one per hook."""
+        path = self.charm_dir / EXECUTOR_CALLS_FILE
+        dispatch = os.environ.get("JUJU_DISPATCH_PATH", "unknown")
+
+        try:
+            summaries = json.loads(path.read_text()) if path.exists() else {}
+            summaries[dispatch] = {"timestamp": int(time()), **summary}
+            path.write_text(json.dumps(summaries, indent=2))
+        except (OSError, ValueError):
+            logger.warning("Failed to write the executor calls summary")
 
     @property
     def _has_blocked_status(self) -> bool:
@@ -689,6 +874,14 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         """Returns whether the unit is in blocked state and should not run any operations."""
         return self.unit_peer_data.get("member-state") == "waiting"
 
+    def get_member_health(self) -> MemberHealth:
+        """Get the health of the unit member, from the health snapshot when recent."""
+        return self.health_snapshot.member_health() or self._mysql.get_member_health()
+
+    def is_mysqld_alive(self) -> bool:
+        """Returns whether mysqld is running, and answered the last health refresh if recent."""
+        return self._mysql.is_mysqld_running() and self.health_snapshot.mysqld_alive() is not False
+
     def is_unit_primary(self) -> bool:
         """Returns whether the unit is the primary."""
         return self._mysql.get_primary_label() == self.unit_label
@@ -787,6 +980,8 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         # ensure hostname can be resolved
         self.hostname_resolution.update_etc_hosts(None)
 
+        # Before mysqld first starts, for the probe not to compete with it
+        self._mysql.probe_storage()
         self._mysql.write_mysqld_config()
         self.log_rotation_setup.setup()
         self._mysql.reset_root_password_and_start_mysqld()
@@ -905,18 +1100,35 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
 
     def _get_primary_from_online_peer(self) -> str | None:
         """Get the primary address from an online peer."""
-        for unit in self.peers.units:
-            # TODO:
-            #  Remove `.lower()` when migrating to MySQL 8.4
-            #  (when breaking changes are allowed)
-            if self.peers.data[unit].get("member-state") == InstanceState.ONLINE.lower():
-                try:
-                    return self._mysql.get_cluster_primary_address(
-                        from_instance=self.get_unit_address(unit, PEER)
-                    )
-                except MySQLGetClusterPrimaryAddressError:
-                    # try next unit
-                    continue
+        # TODO:
+        #  Remove `.lower()` when migrating to MySQL 8.4
+        #  (when breaking changes are allowed)
+        online_peers = [
+            self.get_unit_address(unit, PEER)
+            for unit in self.peers.units
+            if self.peers.data[unit].get("member-state") == InstanceState.ONLINE.lower()
+        ]
+        results = self._mysql.probe_instances(
+            lambda address: self._mysql.get_cluster_primary_address(from_instance=address),
+            online_peers,
+            stop_when=bool,
+            ignore=(MySQLGetClusterPrimaryAddressError,),
+        )
+
+        return next((primary for primary in results.values() if primary), None)
+
+    def _report_clone_donor(self, donor: str) -> None:
+        """Report the member the unit clones its data from."""
+        logger.info(f"Cloning data from {donor}")
+        self.unit.status = MaintenanceStatus(f"joining the cluster, cloning from {donor}")
+
+    def _get_clone_variables(self) -> dict[str, dict]:
+        """Get the clone variables rendered for each unit, by unit label."""
+        return {
+            self.get_unit_label(unit): json.loads(self.peers.data[unit]["clone-variables"])
+            for unit in self.app_units
+            if "clone-variables" in self.peers.data[unit]
+        }
 
     def join_unit_to_cluster(self) -> None:
         """Join the unit to the cluster.
@@ -952,14 +1164,20 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
                 if self._mysql.is_cluster_replica(from_instance):
                     lock_instance = self._mysql.get_cluster_global_primary_address(from_instance)
 
-                # add random delay to mitigate collisions when multiple units are joining
-                # due the difference between the time we test for locks and acquire them
-                # Not used for cryptographic purpose
-                sleep(random.uniform(0, 1.5))  # noqa: S311
-
-                if self._mysql.are_locks_acquired(lock_instance, UNIT_ADD_LOCKNAME):
-                    self.unit.status = WaitingStatus("waiting to join the cluster.")
-                    logger.info("waiting: cluster lock is held")
+                # Units are granted the lock in the order they first asked for it
+                join_slots = self.config.experimental_max_concurrent_joins
+                position = self._mysql.get_lock_queue_position(
+                    lock_instance, UNIT_ADD_LOCKNAME, instance_label
+                )
+                if position is None:
+                    self.unit.status = WaitingStatus("waiting to join the cluster")
+                    logger.info("waiting: cluster lock queue unreachable")
+                    return
+                if position >= join_slots:
+                    self.unit.status = WaitingStatus(
+                        f"waiting to join the cluster (queue position {position - join_slots + 1})"
+                    )
+                    logger.info(f"waiting: cluster lock is held, {position} units ahead in queue")
                     return
 
                 self.unit.status = MaintenanceStatus("joining the cluster")
@@ -968,13 +1186,16 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
                 # harmless otherwise
                 self._mysql.stop_group_replication()
                 # Add the instance to the cluster. This operation uses locks to ensure that
-                # only one instance is added to the cluster at a time
-                # (so only one instance is involved in a state transfer at a time)
+                # at most `experimental-max-concurrent-joins` instances are added at a time
+                # (so only that many instances are involved in state transfers at a time)
                 self._mysql.add_instance_to_cluster(
                     instance_address=instance_address,
                     instance_unit_label=instance_label,
                     from_instance=from_instance,
                     lock_instance=lock_instance,
+                    join_slots=join_slots,
+                    on_clone_donor=self._report_clone_donor,
+                    clone_variables=self._get_clone_variables(),
                 )
             except MySQLAddInstanceToClusterError:
                 logger.info(f"Unable to add instance {instance_address} to cluster.")
@@ -991,23 +1212,104 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
         self.unit.status = ActiveStatus(self.active_status_message)
         logger.info(f"Instance {instance_label} added to cluster")
 
+    def _report_recovery_progress(self, progress: RecoveryProgress) -> None:
+        """Report the recovery progress, with its throughput and ETA when known."""
+        percent = progress.done * 100 // progress.total if progress.total else 0
+        if progress.stage == "incremental":
+            details = [f"{progress.done}/{progress.total} transactions"]
+            if progress.speed:
+                details.append(f"{progress.speed:.0f} trx/s")
+            message = f"recovering {percent}%"
+        else:
+            details = [
+                progress.stage,
+                f"{progress.done // BYTES_1MB}/{progress.total // BYTES_1MB} MB",
+            ]
+            if progress.speed:
+                details.append(f"{progress.speed / BYTES_1MB:.0f} MB/s")
+            message = f"cloning {percent}%"
+
+        if (eta := progress.eta) is not None:
+            details.append(f"~{max(round(eta / 60), 1)} min")
+
+        logger.debug(f"Recovery progress {progress}")
+        self.unit.status = MaintenanceStatus(f"{message} ({', '.join(details)})")
+
+    def _tune_redo_log_capacity(self) -> None:
+        """Grow the redo log online when the observed writes outgrow it.
+
+        The redo log write rate is sampled on every update-status, and the capacity grown
+        once it falls a quarter short of what the rate or the checkpoint age call for.
+        It is never shrunk online, an oversized redo log only costing disk space.
+        """
+        if self.config.profile == "testing" or not (status := self._mysql.get_redo_log_status()):
+            return
+
+        now = time()
+        # Kept locally, for samples not to trigger relation-changed on the peers
+        path = self.charm_dir / REDO_LOG_SAMPLE_FILE
+        try:
+            previous = json.loads(path.read_text()) if path.exists() else {}
+            path.write_text(json.dumps({"lsn": status.current_lsn, "timestamp": now}))
+        except (OSError, ValueError):
+            logger.warning("Failed to sample the redo log writes")
+            return
+        # Left in the peer data by former revisions
+        self.unit_peer_data.pop("redo-log-sample", None)
+        if not previous or status.current_lsn < previous["lsn"] or now <= previous["timestamp"]:
+            return
+
+        write_rate = (status.current_lsn - previous["lsn"]) / (now - previous["timestamp"])
+        capacity = self._mysql.get_redo_log_capacity(
+            status.buffer_pool_size, write_rate, status.checkpoint_age
+        )
+        if capacity <= status.capacity * 1.25 or status.resize_status != "OK":
+            return
+
+        logger.info(
+            f"Growing the redo log from {status.capacity} to {capacity} bytes, "
+            f"for {write_rate:.0f} bytes/s and a checkpoint age of {status.checkpoint_age} bytes"
+        )
+        # Kept for the configuration file to render the same capacity
+        self.unit_peer_data["redo-log-write-rate"] = str(
+            math.ceil(capacity / REDO_LOG_WRITE_WINDOW)
+        )
+        try:
+            config = self._mysql.write_mysqld_config()
+            self._mysql.set_dynamic_variable(
+                "innodb_redo_log_capacity", int(config["innodb_redo_log_capacity"])
+            )
+        except (MySQLCreateCustomMySQLDConfigError, MySQLSetVariableError):
+            logger.exception("Failed to grow the redo log")
+
     def recover_unit_after_restart(self) -> None:
         """Wait for unit recovery/rejoin after restart."""
-        recovery_attempts = 30
+        recovery_timeout = 30 * 15
+        recovered_at = None
+
+        def stop_after_recovery(_: RetryCallState) -> bool:
+            # The wait for a recovery, possibly a long clone, is not part of the budget
+            return recovered_at is not None and monotonic() - recovered_at >= recovery_timeout
+
         logger.info("Recovering unit")
         if self.app.planned_units() == 1:
             self._mysql.reboot_from_complete_outage()
         else:
             try:
                 for attempt in Retrying(
-                    stop=stop_after_attempt(recovery_attempts), wait=wait_fixed(15)
+                    stop=stop_after_recovery,
+                    wait=wait_exponential(multiplier=0.5, max=15),
                 ):
                     with attempt:
-                        self._mysql.hold_if_recovering()
-                        if not self._mysql.is_instance_in_cluster(self.unit_label):
+                        member_state = self._mysql.hold_if_recovering(
+                            on_progress=self._report_recovery_progress
+                        )
+                        if recovered_at is None:
+                            recovered_at = monotonic()
+                        if member_state != InstanceState.ONLINE:
                             logger.debug(
-                                "Instance not yet back in the cluster."
-                                f" Retry {attempt.retry_state.attempt_number}/{recovery_attempts}"
+                                f"Instance not yet back in the cluster ({member_state})."
+                                f" Retry {attempt.retry_state.attempt_number}"
                             )
                             raise Exception
             except RetryError:
@@ -1020,6 +1322,8 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
             self._mysql.restart_mysqld()
             return
 
+        timings = {}
+        phase_start = monotonic()
         if self.app.planned_units() > 1 and self.is_unit_primary():
             try:
                 new_primary = self.get_unit_address(self.peers.units.pop(), PEER)
@@ -1027,16 +1331,39 @@ class MySQLOperatorCharm(MySQLCharmBase, TypedCharmBase[CharmConfig]):
                 self._mysql.set_cluster_primary(new_primary)
             except MySQLSetClusterPrimaryError:
                 logger.warning("Changing primary failed")
+            timings["primary-switch"], phase_start = monotonic() - phase_start, monotonic()
 
         logger.debug("Restarting mysqld")
         self.unit.status = MaintenanceStatus("restarting MySQL")
+        # Returns once mysqld accepts connections
         self._mysql.restart_mysqld()
+        timings["mysqld-ready"], phase_start = monotonic() - phase_start, monotonic()
+
         self.unit.status = MaintenanceStatus("recovering unit after restart")
-        sleep(10)
         self.recover_unit_after_restart()
+        timings["member-online"] = monotonic() - phase_start
+        self._record_restart_timings(timings)
 
         self._on_update_status(None)
 
+    def _record_restart_timings(self, timings: dict[str, float]) -> None:
+        """Log the time taken by each restart phase, keeping those of the last restarts."""
+        logger.info(
+            "Restart took "
+            + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in timings.items())
+        )
+        path = self.charm_dir / RESTART_TIMINGS_FILE
+
+        try:
+            restarts = json.loads(path.read_text()) if path.exists() else []
+            restarts.append({
+                "timestamp": int(time()),
+                **{phase: round(seconds, 3) for phase, seconds in timings.items()},
+            })
+            path.write_text(json.dumps(restarts[-RESTART_TIMINGS_KEPT:], indent=2))
+        except (OSError, ValueError):
+            logger.warning("Failed to write the restart timings")
+
 
 if __name__ == "__main__":
     main(MySQLOperatorCharm)
@@ -11,7 +11,7 @@ import re
 from typing import ClassVar
 
 from charms.data_platform_libs.v0.data_models import BaseConfigModel
-from charms.mysql.v0.mysql import MAX_CONNECTIONS_FLOOR
+from charms.mysql.v0.mysql import MAX_CONCURRENT_JOINS, MAX_CONNECTIONS_FLOOR
 from pydantic import validator
 
 logger = logging.getLogger(__name__)
@@ -22,13 +22,16 @@ class MySQLConfig:
 
     # Static config requires workload restart
     static_config: ClassVar[set[str]] = {
-        "innodb_buffer_pool_size",
         "innodb_buffer_pool_chunk_size",
         "group_replication_message_cache_size",
         "log_error",
         "loose-audit_log_strategy",
         "loose-audit_log_format",
         "admin_address",
+        "innodb_read_io_threads",
+        "innodb_write_io_threads",
+        "innodb_purge_threads",
+        "table_open_cache_instances",
     }
 
     def __init__(self, config_file_path: str):
@@ -67,6 +70,10 @@ class CharmConfig(BaseConfigModel):
     mysql_interface_user: str | None
     mysql_interface_database: str | None
     experimental_max_connections: int | None
+    experimental_max_concurrent_joins: int
+    experimental_clone_max_concurrency: int | None
+    experimental_clone_max_bandwidth: int | None
+    experimental_clone_compression: str
     binlog_retention_days: int
     plugin_audit_enabled: bool
     plugin_audit_strategy: str
@@ -127,6 +134,36 @@ class CharmConfig(BaseConfigModel):
 
         return value
 
+    @validator("experimental_max_concurrent_joins")
+    @classmethod
+    def experimental_max_concurrent_joins_validator(cls, value: int) -> int:
+        """Check experimental max concurrent joins."""
+        if not 1 <= value <= MAX_CONCURRENT_JOINS:
+            raise ValueError(
+                f"experimental-max-concurrent-joins ({value=}) must be between 1 "
+                + f"and {MAX_CONCURRENT_JOINS}"
+            )
+
+        return value
+
+    @validator("experimental_clone_max_concurrency", "experimental_clone_max_bandwidth")
+    @classmethod
+    def experimental_clone_limits_validator(cls, value: int) -> int | None:
+        """Check experimental clone limits."""
+        if value < 1:
+            raise ValueError("experimental-clone limits must be greater than 0")
+
+        return value
+
+    @validator("experimental_clone_compression")
+    @classmethod
+    def experimental_clone_compression_validator(cls, value: str) -> str:
+        """Check experimental clone compression."""
+        if value not in ["auto", "on", "off"]:
+            raise ValueError("Value not one of 'auto', 'on' or 'off'")
+
+        return value
+
     @validator("binlog_retention_days")
     @classmethod
     def binlog_retention_days_validator(cls, value: int) -> int:
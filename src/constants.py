@@ -38,6 +38,11 @@ CHARMED_MYSQL_BINLOGS_COLLECTOR_SERVICE = "mysql-pitr-helper-collector"
 CHARMED_MYSQL_COMMON_DIRECTORY = "/var/snap/charmed-mysql/common"
 CHARMED_MYSQL_DATA_DIRECTORY = "/var/snap/charmed-mysql/current"
 MYSQLD_SOCK_FILE = f"{CHARMED_MYSQL_COMMON_DIRECTORY}/var/run/mysqld/mysqld.sock"
+CGROUP_MOUNT = "/sys/fs/cgroup"
+# Storage benchmark run on the data directory before mysqld first starts
+STORAGE_PROBE_FILE_SIZE = 64 * 1024 * 1024
+STORAGE_PROBE_DURATION = 1  # seconds, for each measurement
+STORAGE_PROBE_JOBS = 4
 MYSQLD_CONFIG_DIRECTORY = f"{CHARMED_MYSQL_DATA_DIRECTORY}/etc/mysql/mysql.conf.d"
 MYSQLD_DEFAULTS_CONFIG_FILE = f"{CHARMED_MYSQL_DATA_DIRECTORY}/etc/mysql/mysql.cnf"
 MYSQLD_CUSTOM_CONFIG_FILE = f"{MYSQLD_CONFIG_DIRECTORY}/z-custom-mysqld.cnf"
@@ -61,3 +66,13 @@ SECRET_KEY_FALLBACKS = {
     "certificate-authority": "ca",
 }
 TRACING_PROTOCOL = "otlp_http"
+# Summary of the executor calls made by the last dispatch of each hook, under the charm dir
+EXECUTOR_CALLS_FILE = "executor_calls.json"
+# Time taken by each phase of the last restarts, under the charm dir
+RESTART_TIMINGS_FILE = "restart_timings.json"
+RESTART_TIMINGS_KEPT = 10
+# Last redo log LSN sampled by update-status, under the charm dir
+REDO_LOG_SAMPLE_FILE = "redo_log_sample.json"
+# Health snapshot kept by the health snapshot writer process, under the charm dir
+HEALTH_SNAPSHOT_FILE = "health_snapshot.json"
+HEALTH_SNAPSHOT_MAX_AGE = 30  # seconds
@@ -46,7 +46,7 @@ class MySQLLogs(Object):
             self.charm.peers is None
             or not self.charm.unit_initialized()
             or not self.charm.upgrade.idle
-            or not self.charm._mysql.is_mysqld_running()
+            or not self.charm.is_mysqld_alive()
         ):
             # skip when not initialized, during an upgrade, or when mysqld is not running
             return
@@ -0,0 +1,200 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Set up the health snapshot writer, and read the snapshots it keeps."""
+
+import json
+import logging
+import os
+import signal
+import subprocess
+import time
+import typing
+
+from charms.mysql.v0.mysql import MemberHealth
+from ops.charm import CharmEvents
+from ops.framework import EventBase, EventSource, Object
+
+from constants import (
+    HEALTH_SNAPSHOT_FILE,
+    HEALTH_SNAPSHOT_MAX_AGE,
+    MONITORING_PASSWORD_KEY,
+    MONITORING_USERNAME,
+    MYSQLD_SOCK_FILE,
+)
+from ip_address_observer import check_pid
+
+logger = logging.getLogger(__name__)
+
+# File path for the spawned health snapshot writer process to write logs.
+LOG_FILE_PATH = "/var/log/health_snapshot_writer.log"
+
+
+if typing.TYPE_CHECKING:
+    from charm import MySQLOperatorCharm
+
+
+class GroupMembershipChangeEvent(EventBase):
+    """A custom event for group replication membership changes.
+
+    Carries the changed members, with their previous and current role and state.
+    """
+
+    def __init__(self, handle, changes: list[dict] | None = None):
+        super().__init__(handle)
+
+        # Set by the health snapshot writer when dispatching the event
+        self.changes = (
+            changes
+            if changes is not None
+            else json.loads(os.environ.get("GROUP_MEMBERSHIP_CHANGES", "[]"))
+        )
+
+    def snapshot(self) -> dict:
+        """Snapshot the changes, for the event to be deferred."""
+        return {"changes": self.changes}
+
+    def restore(self, snapshot: dict) -> None:
+        """Restore the changes of a deferred event."""
+        self.changes = snapshot["changes"]
+
+
+class GroupMembershipChangeCharmEvents(CharmEvents):
+    """A CharmEvents extension for group replication membership changes.
+
+    Includes :class:`GroupMembershipChangeEvent` in those that can be handled.
+    """
+
+    group_membership_change = EventSource(GroupMembershipChangeEvent)
+
+
+class HealthSnapshot(Object):
+    """Keeps a local health snapshot of mysqld, for hooks not to query it every time.
+
+    The snapshot is refreshed by a long-running writer process holding a single
+    connection to mysqld. Readers only trust snapshots younger than HEALTH_SNAPSHOT_MAX_AGE.
+    The writer also dispatches :class:`GroupMembershipChangeEvent` on membership changes.
+    """
+
+    def __init__(self, charm: "MySQLOperatorCharm"):
+        super().__init__(charm, "health-snapshot")
+
+        self.charm = charm
+
+        self.framework.observe(self.charm.on.update_status, self._on_update_status)
+        self.framework.observe(self.charm.on.stop, self._on_stop)
+
+    @property
+    def path(self):
+        """Path of the snapshot file."""
+        return self.charm.charm_dir / HEALTH_SNAPSHOT_FILE
+
+    def _on_update_status(self, _) -> None:
+        """Make sure the writer runs once the member is initialized."""
+        if self.charm.peers is None or not self.charm.unit_peer_data.get("member-role"):
+            return
+
+        self.start_writer()
+
+    def _on_stop(self, _) -> None:
+        """Stop the writer along with the unit."""
+        self.stop_writer()
+
+    def start_writer(self) -> None:
+        """Start the health snapshot writer running in a new process."""
+        if (pid := self.charm.unit_peer_data.get("health-writer-pid")) and check_pid(int(pid)):
+            return
+
+        password = self.charm.get_secret("app", MONITORING_PASSWORD_KEY)
+        if not password:
+            return
+
+        logger.info("Starting health snapshot writer process")
+
+        juju_command = (
+            os.path.exists("/usr/bin/juju-run") and "/usr/bin/juju-run"
+        ) or "/usr/bin/juju-exec"
+
+        # We need to trick Juju into thinking that we are not running
+        # in a hook context, as Juju will disallow use of juju-run.
+        new_env = os.environ.copy()
+        if "JUJU_CONTEXT_ID" in new_env:
+            new_env.pop("JUJU_CONTEXT_ID")
+
+        # The writer uses the MySQL connector from the charm virtual environment
+        new_env["PYTHONPATH"] = str(self.charm.charm_dir / "venv")
+
+        # Input generated by the charm
+        process = subprocess.Popen(  # noqa: S603
+            [
+                "/usr/bin/python3",
+                "scripts/health_snapshot_writer.py",
+                juju_command,
+                self.charm.unit.name,
+                str(self.charm.charm_dir),
+                MONITORING_USERNAME,
+                MYSQLD_SOCK_FILE,
+                str(self.path),
+            ],
+            # Cannot use a context
+            stdin=subprocess.PIPE,
+            stdout=open(LOG_FILE_PATH, "a"),  # noqa: SIM115
+            stderr=subprocess.STDOUT,
+            env=new_env,
+            text=True,
+        )
+        # Not passed as argument, to keep it out of the process list
+        process.stdin.write(f"{password}\n")
+        process.stdin.close()
+
+        self.charm.unit_peer_data.update({"health-writer-pid": f"{process.pid}"})
+        logger.info(f"Started health snapshot writer process with PID {process.pid}")
+
+    def stop_writer(self) -> None:
+        """Stop running the writer if it is indeed running."""
+        if self.charm.peers is None or "health-writer-pid" not in self.charm.unit_peer_data:
+            return
+
+        writer_pid = int(self.charm.unit_peer_data["health-writer-pid"])
+
+        try:
+            os.kill(writer_pid, signal.SIGTERM)
+            logger.info(f"Stopped running health snapshot writer process with PID {writer_pid}")
+            del self.charm.unit_peer_data["health-writer-pid"]
+        except OSError:
+            pass
+
+        self.path.unlink(missing_ok=True)
+
+    def read(self) -> dict | None:
+        """Read the snapshot, if recent enough."""
+        try:
+            snapshot = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - snapshot.get("timestamp", 0) > HEALTH_SNAPSHOT_MAX_AGE:
+            logger.debug("Ignoring stale health snapshot")
+            return None
+
+        return snapshot
+
+    def mysqld_alive(self) -> bool | None:
+        """Whether mysqld answered the last refresh, None without recent snapshot."""
+        if not (snapshot := self.read()):
+            return None
+
+        return snapshot["mysqld_alive"]
+
+    def member_health(self) -> MemberHealth | None:
+        """Member health from the snapshot, None without recent snapshot of a live mysqld."""
+        if not (snapshot := self.read()) or not snapshot["mysqld_alive"]:
+            return None
+
+        return MemberHealth(
+            role=snapshot["member_role"],
+            state=snapshot["member_state"],
+            primary_address=snapshot["primary_address"],
+            member_count=snapshot["member_count"],
+            online_member_count=snapshot["online_member_count"],
+        )
@@ -0,0 +1,675 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""MySQL Shell executors reusing long-lived sessions.
+
+Every call made through the upstream `LocalExecutor` spawns a new `mysqlsh` process,
+which loads the embedded Python runtime and opens a new MySQL session before running
+the actual statement. Hooks issue tens of such calls, making the process and
+connection setup the dominant cost of most of them.
+
+The `PersistentExecutor` keeps one `mysqlsh` process per connection target alive for
+the lifetime of the hook process and feeds it scripts through its standard input.
+Results are reported back through a dedicated pipe, so that the shell's own output
+(prompts, warnings, buffering) never interferes with the exchanged payloads. Scripts
+connecting to other instances have the global session pointed back to the connection
+target once done, or the shell discarded when that session was closed.
+
+The `HybridExecutor` goes one step further, sending plain SQL through a MySQL protocol
+connection, and keeping the MySQL Shell sessions for the AdminAPI scripts only.
+"""
+
+import atexit
+import base64
+import json
+import logging
+import os
+import select
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, ClassVar
+
+import mysql.connector
+from mysql_shell.executors import LocalExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+logger = logging.getLogger(__name__)
+
+# Client error codes signaling that the underlying MySQL session is no longer usable
+CONNECTION_LOST_ERROR_CODES = frozenset({2006, 2013, 2055})
+
+# Seconds to wait for a newly spawned shell to report its session state
+SESSION_STARTUP_TIMEOUT = 30
+
+# Script evaluated once by every spawned shell. It defines the function in charge of
+# running the requests, and reports each outcome as a single JSON line on `__result_fd`
+BOOTSTRAP_SCRIPT = """
+import base64 as __base64
+import json as __json
+import os as __os
+import sys as __sys
+
+shell.options.set("useWizards", False)
+__home_session = shell.get_session()
+
+
+class __PrintCapture:
+    def __init__(self):
+        self.prints = []
+        self.buffer = ""
+
+    def write(self, text):
+        self.buffer += text
+        if self.buffer.endswith("\\n"):
+            self.prints.append(self.buffer[:-1])
+            self.buffer = ""
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def last(self):
+        chunks = [*self.prints, self.buffer]
+        return next((chunk for chunk in reversed(chunks) if chunk.strip()), "{}")
+
+
+def __send(frame):
+    data = (__json.dumps(frame, default=str) + "\\n").encode()
+    while data:
+        data = data[__os.write(__result_fd, data):]
+
+
+def __error(exc):
+    return {"error": {"message": str(exc), "code": getattr(exc, "code", None)}}
+
+
+def __restore_session():
+    # Scripts can repoint the global session, e.g. to the cluster primary
+    if __home_session is None or not __home_session.is_open():
+        return False
+    shell.set_session(__home_session)
+    return True
+
+
+def __run_py(script):
+    capture = __PrintCapture()
+    namespace = dict(globals())
+    stdout, __sys.stdout = __sys.stdout, capture
+    try:
+        exec(script, namespace)
+    finally:
+        __sys.stdout = stdout
+    return {"output": capture.last()}
+
+
+def __run_sql(statements):
+    results = []
+    try:
+        for statement in statements:
+            result = shell.get_session().run_sql(statement)
+            if not result.has_data():
+                results.append(None)
+                continue
+            columns = [column.column_label for column in result.get_columns()]
+            results.append([
+                {column: row[index] for index, column in enumerate(columns)}
+                for row in result.fetch_all()
+            ])
+    except BaseException:
+        # Not to leave the session within a failed transaction
+        try:
+            shell.get_session().run_sql("ROLLBACK")
+        except BaseException:
+            pass
+        raise
+    return {"results": results}
+
+
+def __run(payload):
+    try:
+        request = __json.loads(__base64.b64decode(payload).decode())
+        if request["kind"] == "ping":
+            session = shell.get_session()
+            if session is None or not session.is_open():
+                raise RuntimeError("No open session")
+            session.run_sql("SELECT 1")
+            frame = {"ready": True}
+        elif request["kind"] == "py":
+            frame = __run_py(request["script"])
+        else:
+            frame = __run_sql(request["statements"])
+    except BaseException as exc:
+        frame = __error(exc)
+    if not __restore_session():
+        frame["session_lost"] = True
+    __send(frame)
+"""
+
+
+def split_sql_statements(script: str) -> list[str]:
+    """Split a SQL script into its statements.
+
+    Semicolons within quoted strings, quoted identifiers and comments are ignored.
+
+    Args:
+        script: the SQL script to split
+
+    Returns:
+        A list with the non-empty statements, without their trailing delimiter
+    """
+    statements = []
+    current = []
+    quote = None
+    index = 0
+
+    while index < len(script):
+        char = script[index]
+        pair = script[index : index + 2]
+
+        if quote:
+            current.append(char)
+            if char == "\\" and quote != "`":
+                current.append(script[index + 1 : index + 2])
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+            current.append(char)
+        elif pair == "--" or char == "#":
+            end = script.find("\n", index)
+            index = len(script) if end == -1 else end
+            continue
+        elif pair == "/*":
+            end = script.find("*/", index + 2)
+            index = len(script) if end == -1 else end + 2
+            current.append(" ")
+            continue
+        elif char == ";":
+            statements.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+
+        index += 1
+
+    statements.append("".join(current))
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+class _ShellSession:
+    """A long-lived MySQL Shell process holding an open session."""
+
+    def __init__(self, command: list[str], password: str | None):
+        """Spawn the shell process and wait for its session to be ready."""
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._result_fd, write_fd = os.pipe()
+        # The shell reports its own errors there, such as failures to connect at startup
+        self._output = tempfile.TemporaryFile(mode="w+")  # noqa: SIM115
+
+        try:
+            self._process = subprocess.Popen(  # noqa: S603
+                command,
+                stdin=subprocess.PIPE,
+                stdout=self._output,
+                stderr=subprocess.STDOUT,
+                pass_fds=(write_fd,),
+                text=True,
+            )
+        except OSError as e:
+            os.close(self._result_fd)
+            self._output.close()
+            raise ExecutionError({"message": str(e)}) from e
+        finally:
+            os.close(write_fd)
+
+        bootstrap = f"__result_fd = {write_fd}\n{BOOTSTRAP_SCRIPT}"
+        encoded = base64.b64encode(bootstrap.encode()).decode()
+
+        try:
+            self._write(password or "")
+            self._write(f'exec(__import__("base64").b64decode("{encoded}").decode())')
+            frame = self._request({"kind": "ping"}, SESSION_STARTUP_TIMEOUT)
+        except ExecutionError as e:
+            error = self._shell_error()
+            self.close()
+            if error:
+                raise ExecutionError(error) from e
+            raise
+
+        if "error" in frame:
+            error = self._shell_error() or frame["error"]
+            self.close()
+            raise ExecutionError(error)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the shell process is still running."""
+        return self._process.poll() is None
+
+    def _shell_error(self) -> dict | None:
+        """Return the last error reported by the shell on its output, if any."""
+        try:
+            self._output.seek(0)
+            lines = self._output.read().splitlines()
+        except (OSError, ValueError):
+            return None
+
+        # Errors are printed as JSON documents, along with prompts and warnings
+        for line in reversed(lines):
+            with suppress(ValueError):
+                document = json.loads(line)
+                error = document.get("error") if isinstance(document, dict) else None
+                if isinstance(error, dict):
+                    return error
+                if isinstance(error, str) and error.strip():
+                    return {"message": error}
+
+        return None
+
+    def _write(self, line: str) -> None:
+        """Write a line to the shell standard input."""
+        try:
+            self._process.stdin.write(f"{line}\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise ExecutionError(
+                self._shell_error() or {"message": "MySQL Shell process exited"}
+            ) from e
+
+    def _read_frame(self, timeout: int | None) -> dict:
+        """Read a single result frame, waiting at most `timeout` seconds."""
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while b"\n" not in self._buffer:
+            remaining = max(deadline - time.monotonic(), 0) if deadline else None
+            ready, _, _ = select.select([self._result_fd], [], [], remaining)
+            if not ready:
+                raise ExecutionError()
+
+            chunk = os.read(self._result_fd, 65536)
+            if not chunk:
+                raise ExecutionError(
+                    self._shell_error() or {"message": "MySQL Shell process exited"}
+                )
+            self._buffer += chunk
+
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def _request(self, request: dict, timeout: int | None) -> dict:
+        """Send a request to the shell and return its result frame."""
+        payload = base64.b64encode(json.dumps(request).encode()).decode()
+        self._write(f'__run("{payload}")')
+        return self._read_frame(timeout)
+
+    def request(self, request: dict, timeout: int | None) -> dict:
+        """Send a request to the shell, serializing concurrent callers."""
+        with self._lock:
+            return self._request(request, timeout)
+
+    def close(self) -> None:
+        """Terminate the shell process."""
+        if self.alive:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
+        if self._result_fd is not None:
+            os.close(self._result_fd)
+            self._result_fd = None
+
+        self._output.close()
+
+
+class PersistentExecutor(LocalExecutor):
+    """MySQL Shell executor reusing one shell process per connection target.
+
+    Sessions are shared among all the executor instances with the same connection
+    details, and are terminated when the hook process exits.
+    """
+
+    _sessions: ClassVar[dict[tuple, _ShellSession]] = {}
+    _sessions_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, conn_details: ConnectionDetails, shell_path: str):
+        """Initialize the executor."""
+        super().__init__(conn_details, shell_path)
+
+    @property
+    def _session_key(self) -> tuple:
+        """Return the key identifying the session for the connection details."""
+        details = self._conn_details
+        return (
+            self._shell_path,
+            details.host,
+            details.port,
+            details.socket,
+            details.username,
+            details.password,
+        )
+
+    def _get_session(self) -> _ShellSession:
+        """Return a running shell session, spawning one if needed."""
+        key = self._session_key
+
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session and session.alive:
+                return session
+
+        # Spawned without holding the lock, not to serialize sessions to other targets
+        command = [*self._common_args(), *self._connection_args(), "--py", "--interactive"]
+        spawned = _ShellSession(command, self._conn_details.password)
+
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session and session.alive:
+                spawned.close()
+                return session
+
+            if session:
+                session.close()
+
+            self._sessions[key] = spawned
+            return spawned
+
+    def _discard_session(self) -> None:
+        """Terminate the session, to have it spawned again on the next call."""
+        with self._sessions_lock:
+            session = self._sessions.pop(self._session_key, None)
+
+        if session:
+            session.close()
+
+    def _request(self, request: dict, timeout: int | None) -> dict:
+        """Send a request to the session of the connection target."""
+        session = self._get_session()
+
+        try:
+            frame = session.request(request, timeout)
+        except ExecutionError:
+            # Timed out requests might still be running in the session
+            self._discard_session()
+            raise
+
+        if frame.get("session_lost") or (
+            "error" in frame and frame["error"].get("code") in CONNECTION_LOST_ERROR_CODES
+        ):
+            # The session to the connection target was closed, e.g. by a script
+            # connecting to another instance
+            self._discard_session()
+
+        if "error" in frame:
+            raise ExecutionError(frame["error"])
+
+        return frame
+
+    @classmethod
+    def close_sessions(cls) -> None:
+        """Terminate all the shell sessions."""
+        with cls._sessions_lock:
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        self._request({"kind": "ping"}, SESSION_STARTUP_TIMEOUT)
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script.
+
+        Arguments:
+            script: Python script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            String with the last output printed by the script.
+        """
+        frame = self._request({"kind": "py", "script": script}, timeout)
+        return frame["output"]
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            List of dictionaries, one per row returned by the last statement
+        """
+        statements = split_sql_statements(script)
+        if not statements:
+            return []
+
+        frame = self._request({"kind": "sql", "statements": statements}, timeout)
+        return next((rows for rows in reversed(frame["results"]) if rows is not None), [])
+
+    def execute_sql_batch(
+        self, statements: list[str], *, timeout: int | None = None
+    ) -> list[list[dict]]:
+        """Execute a batch of single SQL statements.
+
+        Arguments:
+            statements: SQL statements to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            List with the rows returned by each statement
+        """
+        frame = self._request({"kind": "sql", "statements": statements}, timeout)
+        return [rows or [] for rows in frame["results"]]
+
+
+class _SQLConnection:
+    """A MySQL protocol connection to a single target."""
+
+    def __init__(self, details: ConnectionDetails):
+        """Open the connection."""
+        self._lock = threading.Lock()
+
+        options = {
+            "user": details.username,
+            "password": details.password,
+            "autocommit": True,
+            "connection_timeout": SESSION_STARTUP_TIMEOUT,
+        }
+        if details.socket:
+            options["unix_socket"] = details.socket
+        else:
+            options["host"] = details.host
+            options["port"] = int(details.port)
+
+        try:
+            self._connection = mysql.connector.connect(**options)
+        except mysql.connector.Error as e:
+            raise ExecutionError({"message": e.msg, "code": e.errno}) from e
+
+    @property
+    def alive(self) -> bool:
+        """Whether the connection is still open."""
+        return self._connection.is_connected()
+
+    @staticmethod
+    def _convert_value(value: Any) -> Any:
+        """Convert a column value into the type reported by the MySQL Shell JSON output."""
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, bytes | bytearray):
+            return value.decode(errors="replace")
+        if isinstance(value, datetime | date | timedelta):
+            return str(value)
+        if isinstance(value, set):
+            return ",".join(sorted(value))
+        return value
+
+    def execute(self, statements: list[str]) -> list[list[dict] | None]:
+        """Execute the statements, serializing concurrent callers.
+
+        Returns:
+            List with the rows returned by each statement, None for those without rows
+        """
+        results = []
+
+        with self._lock:
+            cursor = self._connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+                    if not cursor.with_rows:
+                        results.append(None)
+                        continue
+
+                    columns = cursor.column_names
+                    results.append([
+                        {
+                            column: self._convert_value(value)
+                            for column, value in zip(columns, row, strict=True)
+                        }
+                        for row in cursor.fetchall()
+                    ])
+            except mysql.connector.Error:
+                # Not to leave the connection within a failed transaction
+                if self._connection.in_transaction:
+                    with suppress(mysql.connector.Error):
+                        self._connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        return results
+
+    def close(self) -> None:
+        """Close the connection."""
+        with suppress(mysql.connector.Error):
+            self._connection.close()
+
+
+class HybridExecutor(PersistentExecutor):
+    """MySQL Shell executor sending plain SQL through MySQL protocol connections.
+
+    Python scripts, used for AdminAPI operations, keep running on the MySQL Shell.
+    Connections are shared among all the executor instances with the same connection
+    details, and are closed when the hook process exits.
+    """
+
+    _connections: ClassVar[dict[tuple, _SQLConnection]] = {}
+    _connections_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, conn_details: ConnectionDetails, shell_path: str):
+        """Initialize the executor."""
+        super().__init__(conn_details, shell_path)
+
+    def _get_connection(self) -> _SQLConnection:
+        """Return an open connection, opening one if needed."""
+        key = self._session_key
+
+        with self._connections_lock:
+            connection = self._connections.get(key)
+            if connection and connection.alive:
+                return connection
+
+        # Opened without holding the lock, not to serialize connections to other targets
+        opened = _SQLConnection(self._conn_details)
+
+        with self._connections_lock:
+            connection = self._connections.get(key)
+            if connection and connection.alive:
+                opened.close()
+                return connection
+
+            if connection:
+                connection.close()
+
+            self._connections[key] = opened
+            return opened
+
+    def _discard_connection(self) -> None:
+        """Close the connection, to have it opened again on the next call."""
+        with self._connections_lock:
+            connection = self._connections.pop(self._session_key, None)
+
+        if connection:
+            connection.close()
+
+    @classmethod
+    def close_connections(cls) -> None:
+        """Close all the connections."""
+        with cls._connections_lock:
+            connections = list(cls._connections.values())
+            cls._connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        self._get_connection()
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script.
+
+        Scripts with a timeout run on the MySQL Shell, whose requests can be abandoned.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            List of dictionaries, one per row returned by the last statement
+        """
+        if timeout:
+            return super().execute_sql(script, timeout=timeout)
+
+        statements = split_sql_statements(script)
+        if not statements:
+            return []
+
+        results = self._execute(statements)
+        return next((rows for rows in reversed(results) if rows is not None), [])
+
+    def execute_sql_batch(
+        self, statements: list[str], *, timeout: int | None = None
+    ) -> list[list[dict]]:
+        """Execute a batch of single SQL statements.
+
+        Arguments:
+            statements: SQL statements to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            List with the rows returned by each statement
+        """
+        if timeout:
+            return super().execute_sql_batch(statements, timeout=timeout)
+
+        return [rows or [] for rows in self._execute(statements)]
+
+    def _execute(self, statements: list[str]) -> list[list[dict] | None]:
+        """Execute the statements through the connection of the connection target."""
+        connection = self._get_connection()
+
+        try:
+            return connection.execute(statements)
+        except mysql.connector.Error as e:
+            if e.errno in CONNECTION_LOST_ERROR_CODES or not connection.alive:
+                self._discard_connection()
+            raise ExecutionError({"message": e.msg, "code": e.errno}) from e
+
+
+atexit.register(PersistentExecutor.close_sessions)
+atexit.register(HybridExecutor.close_connections)
@@ -5,18 +5,29 @@
 
 import json
 import logging
+import math
+import mmap
 import os
 import pathlib
 import platform
+import random
 import shutil
+import socket
+import statistics
 import subprocess
 import tempfile
+import time
 import typing
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 import jinja2
 from charms.mysql.v0.mysql import (
+    ADMIN_PORT,
     BYTES_1MB,
+    CLONE_VARIABLES,
+    INNODB_PAGE_SIZE,
+    BYTES_1MiB,
     Error,
     MySQLBase,
     MySQLExecError,
@@ -27,14 +38,23 @@ from charms.mysql.v0.mysql import (
     MySQLServiceNotRunningError,
     MySQLStartMySQLDError,
     MySQLStopMySQLDError,
+    StorageProbe,
 )
 from charms.operator_libs_linux.v2 import snap
-from mysql_shell.executors import LocalExecutor
 from mysql_shell.executors.errors import ExecutionError
-from tenacity import RetryError, Retrying, retry, stop_after_attempt, stop_after_delay, wait_fixed
+from tenacity import (
+    RetryError,
+    Retrying,
+    retry,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_fixed,
+)
 from typing_extensions import override
 
 from constants import (
+    CGROUP_MOUNT,
     CHARMED_MYSQL_BINLOGS_COLLECTOR_SERVICE,
     CHARMED_MYSQL_COMMON_DIRECTORY,
     CHARMED_MYSQL_SNAP_NAME,
@@ -51,8 +71,12 @@ from constants import (
     MYSQLD_DEFAULTS_CONFIG_FILE,
     MYSQLD_SOCK_FILE,
     ROOT_SYSTEM_USER,
+    STORAGE_PROBE_DURATION,
+    STORAGE_PROBE_FILE_SIZE,
+    STORAGE_PROBE_JOBS,
     XTRABACKUP_PLUGIN_DIR,
 )
+from mysql_shell_executors import HybridExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -145,7 +169,7 @@ class MySQL(MySQLBase):
             backups_user=backups_user,
             backups_password=backups_password,
             mysqlsh_path=CHARMED_MYSQLSH,
-            executor_class=LocalExecutor,
+            executor_class=HybridExecutor,
         )
 
         self.charm = charm
@@ -231,19 +255,107 @@ class MySQL(MySQLBase):
 
     @override
     def get_available_memory(self) -> int:
-        """Retrieves the total memory of the server where mysql is running."""
+        """Retrieves the memory available to mysql on the server where it is running.
+
+        That is the total memory of the server, unless lower cgroup v2 `memory.max` or
+        cgroup v1 `memory.limit_in_bytes` limits apply, as in containers.
+        """
         try:
             logger.debug("Querying system total memory")
             with open("/proc/meminfo") as meminfo:
-                for line in meminfo:
-                    if "MemTotal" in line:
-                        return int(line.split()[1]) * 1024
-
-            raise MySQLGetAvailableMemoryError
+                total_memory = next(
+                    (int(line.split()[1]) * 1024 for line in meminfo if "MemTotal" in line), None
+                )
         except OSError as e:
             logger.error("Failed to query system memory")
             raise MySQLGetAvailableMemoryError from e
 
+        if total_memory is None:
+            raise MySQLGetAvailableMemoryError
+
+        limits = []
+        for path in cgroup_files("memory", "memory.max", "memory.limit_in_bytes"):
+            try:
+                if (limit := path.read_text().strip()) != "max":
+                    limits.append(int(limit))
+            except (OSError, ValueError):
+                logger.debug(f"Unable to read the cgroup memory limit from {path}")
+
+        return min([total_memory, *limits])
+
+    @override
+    def get_available_cpus(self) -> int:
+        """Retrieves the CPUs available to mysql on the server where it is running.
+
+        That is the CPUs of the process affinity, unless lower cgroup v2 `cpu.max` or
+        cgroup v1 `cpu.cfs_quota_us` quotas apply, rounded up to whole CPUs.
+        """
+        cpus = len(os.sched_getaffinity(0))
+
+        for path in cgroup_files("cpu", "cpu.max", "cpu.cfs_quota_us"):
+            try:
+                if path.name == "cpu.max":
+                    quota, period = path.read_text().split()
+                else:
+                    quota = path.read_text().strip()
+                    period = (path.parent / "cpu.cfs_period_us").read_text().strip()
+                if quota not in ("max", "-1"):
+                    cpus = min(cpus, max(math.ceil(int(quota) / int(period)), 1))
+            except (OSError, ValueError):
+                logger.debug(f"Unable to read the cgroup CPU quota from {path}")
+
+        return cpus
+
+    @override
+    def get_link_speed(self) -> int | None:
+        """Retrieves the speed in Mb/s of the network interface holding the instance address."""
+        try:
+            interfaces = json.loads(
+                subprocess.check_output(["ip", "-json", "address", "show"], text=True)  # noqa: S607
+            )
+            interface = next(
+                interface["ifname"]
+                for interface in interfaces
+                if any(
+                    address.get("local") == self.instance_address
+                    for address in interface.get("addr_info", [])
+                )
+            )
+            # Virtual interfaces fail to report their speed, or report -1
+            speed = int(pathlib.Path(f"/sys/class/net/{interface}/speed").read_text())
+        except (OSError, ValueError, StopIteration, subprocess.CalledProcessError):
+            logger.debug("Unable to query the network link speed")
+            return None
+
+        return speed if speed > 0 else None
+
+    @override
+    def get_storage_probe(self) -> StorageProbe | None:
+        """Retrieves the data volume write performance cached by `probe_storage`."""
+        try:
+            return StorageProbe(**json.loads(self.charm.unit_peer_data["storage-probe"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def probe_storage(self) -> None:
+        """Measure the data volume write performance once, caching it in the unit peer data.
+
+        Only run before mysqld first starts, units deployed by former revisions are
+        never probed and keep the default flush settings.
+        """
+        if self.get_storage_probe():
+            return
+
+        logger.info(f"Probing the storage performance of {MYSQL_DATA_DIR}")
+        try:
+            storage_probe = measure_storage(MYSQL_DATA_DIR)
+        except OSError:
+            logger.exception("Failed to probe the storage, keeping the default flush settings")
+            return
+
+        logger.info(f"Measured storage performance {storage_probe}")
+        self.charm.unit_peer_data["storage-probe"] = json.dumps(storage_probe._asdict())
+
     def write_mysqld_config(self) -> dict:
         """Create custom mysql config file.
 
@@ -255,6 +367,8 @@ class MySQL(MySQLBase):
         if self.charm.config.profile_limit_memory:
             # Convert from config value in MB to bytes
             memory_limit = self.charm.config.profile_limit_memory * BYTES_1MB
+        # Peak write rate the redo log was last grown for, if ever
+        redo_log_write_rate = float(self.charm.unit_peer_data.get("redo-log-write-rate", 0))
         try:
             content_str, content_dict = self.render_mysqld_configuration(
                 profile=self.charm.config.profile,
@@ -265,11 +379,20 @@ class MySQL(MySQLBase):
                 memory_limit=memory_limit,
                 binlog_retention_days=self.charm.config.binlog_retention_days,
                 experimental_max_connections=self.charm.config.experimental_max_connections,
+                clone_max_concurrency=self.charm.config.experimental_clone_max_concurrency,
+                clone_max_bandwidth=self.charm.config.experimental_clone_max_bandwidth,
+                clone_compression=self.charm.config.experimental_clone_compression,
+                redo_log_write_rate=redo_log_write_rate,
             )
         except (MySQLGetAvailableMemoryError, MySQLGetAutoTuningParametersError) as e:
             logger.exception("Failed to get available memory or auto tuning parameters")
             raise MySQLCreateCustomMySQLDConfigError from e
 
+        # Restored on the instance once it donated to a join, only changing along the config
+        self.charm.unit_peer_data["clone-variables"] = json.dumps({
+            name: content_dict.get(f"loose-{name}", "DEFAULT") for name in CLONE_VARIABLES
+        })
+
         # create the mysqld config directory if it does not exist
         pathlib.Path(MYSQLD_CONFIG_DIRECTORY).mkdir(mode=0o755, parents=True, exist_ok=True)
 
@@ -403,17 +526,22 @@ class MySQL(MySQLBase):
                     "mysqld service not running"
                 ) from e
 
-    @retry(reraise=True, stop=stop_after_delay(120), wait=wait_fixed(5))
+    @retry(reraise=True, stop=stop_after_delay(120), wait=wait_exponential(multiplier=0.25, max=5))
     def wait_until_mysql_connection(self, check_port: bool = True) -> None:
         """Wait until a connection to MySQL has been obtained.
 
-        Retry every 5 seconds for 120 seconds if there is an issue obtaining a connection.
+        Retry for 120 seconds if there is an issue obtaining a connection, waiting from
+        half a second up to 5 seconds between attempts. The admin port is probed before
+        connecting with mysqlsh, for it not to be spawned against a starting server.
         """
         logger.debug("Waiting for MySQL connection")
 
         if not os.path.exists(MYSQLD_SOCK_FILE):
             raise MySQLServiceNotRunningError("MySQL socket file not found")
 
+        if check_port and not self.is_admin_port_open():
+            raise MySQLServiceNotRunningError("MySQL admin port not open")
+
         if check_port and not self.check_mysqlsh_connection():
             raise MySQLServiceNotRunningError("Connection with mysqlsh not possible")
 
@@ -637,6 +765,14 @@ class MySQL(MySQLBase):
         """Returns whether mysqld is running."""
         return os.path.exists(MYSQLD_SOCK_FILE)
 
+    def is_admin_port_open(self) -> bool:
+        """Returns whether the admin port accepts connections."""
+        try:
+            with socket.create_connection((self.instance_address, ADMIN_PORT), timeout=1):
+                return True
+        except OSError:
+            return False
+
     def is_server_connectable(self) -> bool:
         """Returns whether the server is connectable."""
         # Always true since the charm runs on the same server as mysqld
@@ -652,6 +788,9 @@ class MySQL(MySQLBase):
             snap_service_operation(CHARMED_MYSQL_SNAP_NAME, CHARMED_MYSQLD_SERVICE, "stop")
         except (SnapServiceOperationError, MySQLKillSessionError) as e:
             raise MySQLStopMySQLDError(e.message) from e
+        finally:
+            # The member leaves the group along with mysqld
+            self._cluster_status_snapshot.invalidate()
 
     def start_mysqld(self) -> None:
         """Starts the mysqld process."""
@@ -670,6 +809,8 @@ class MySQL(MySQLBase):
                 logger.exception("Failed to start mysqld")
 
             raise MySQLStartMySQLDError(e.message) from e
+        finally:
+            self._cluster_status_snapshot.invalidate()
 
     def restart_mysqld(self) -> None:
         """Restarts the mysqld process."""
@@ -934,3 +1075,98 @@ def snap_service_operation(snapname: str, service: str, operation: str) -> bool:
         error_message = f"Failed to run snap service operation, snap={snapname}, service={service}, operation={operation}"
         logger.exception(error_message)
         raise SnapServiceOperationError(error_message) from e
+
+
+def cgroup_files(controller: str, v2_name: str, v1_name: str) -> list[pathlib.Path]:
+    """List the existing cgroup files of the charm process, from its cgroup up to the root.
+
+    Both the cgroup v2 unified hierarchy and the cgroup v1 hierarchy of the controller
+    are looked up, for hybrid setups to be covered.
+    """
+    try:
+        cgroups = pathlib.Path("/proc/self/cgroup").read_text().splitlines()
+    except OSError:
+        return []
+
+    files = []
+    for cgroup in cgroups:
+        _, controllers, path = cgroup.split(":", 2)
+        if not controllers:
+            mount, name = pathlib.Path(CGROUP_MOUNT), v2_name
+        elif controller in controllers.split(","):
+            mount, name = pathlib.Path(CGROUP_MOUNT, controllers), v1_name
+        else:
+            continue
+
+        parts = pathlib.PurePosixPath(path).parts[1:]
+        for depth in range(len(parts), -1, -1):
+            if (file := mount.joinpath(*parts[:depth], name)).exists():
+                files.append(file)
+
+    return files
+
+
+def measure_storage(directory: str) -> StorageProbe:
+    """Run a short write benchmark on a scratch file in the directory.
+
+    Sequential 1MiB writes fill the file first, random page writes from a few threads
+    then land on it, and small writes are last fsynced one at a time. Each measurement
+    is bounded to STORAGE_PROBE_DURATION seconds, and uses direct I/O where the
+    filesystem supports it, for the page cache not to inflate the results.
+    """
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=".storage-probe.") as file:
+        try:
+            fd = os.open(file.name, os.O_WRONLY | os.O_DSYNC | os.O_DIRECT)
+        except OSError:
+            # e.g. on tmpfs
+            fd = os.open(file.name, os.O_WRONLY | os.O_DSYNC)
+
+        # Anonymous maps are page aligned, as direct I/O requires
+        block = mmap.mmap(-1, BYTES_1MiB)
+        block.write(os.urandom(BYTES_1MiB))
+        page = memoryview(block)[:INNODB_PAGE_SIZE]
+        try:
+            written = 0
+            start = time.monotonic()
+            deadline = start + STORAGE_PROBE_DURATION
+            # Each measurement makes at least one write, however slow the storage
+            while written < INNODB_PAGE_SIZE or (
+                written < STORAGE_PROBE_FILE_SIZE and time.monotonic() < deadline
+            ):
+                written += os.pwrite(fd, block, written)
+            sequential_throughput = int(written / (time.monotonic() - start))
+
+            pages = written // INNODB_PAGE_SIZE
+
+            def random_writes() -> int:
+                count = 0
+                while not count or time.monotonic() < deadline:
+                    # Not used for security purposes
+                    os.pwrite(fd, page, random.randrange(pages) * INNODB_PAGE_SIZE)  # noqa: S311
+                    count += 1
+                return count
+
+            start = time.monotonic()
+            deadline = start + STORAGE_PROBE_DURATION
+            with ThreadPoolExecutor(STORAGE_PROBE_JOBS) as pool:
+                jobs = [pool.submit(random_writes) for _ in range(STORAGE_PROBE_JOBS)]
+            random_write_iops = int(sum(job.result() for job in jobs) / (time.monotonic() - start))
+
+            latencies = []
+            deadline = time.monotonic() + STORAGE_PROBE_DURATION
+            while not latencies or time.monotonic() < deadline:
+                start = time.monotonic()
+                os.pwrite(file.fileno(), block[:4096], 0)
+                os.fsync(file.fileno())
+                latencies.append(time.monotonic() - start)
+            fsync_latency = statistics.median(latencies)
+        finally:
+            page.release()
+            block.close()
+            os.close(fd)
+
+    return StorageProbe(
+        random_write_iops=random_write_iops,
+        fsync_latency=fsync_latency,
+        sequential_throughput=sequential_throughput,
+    )
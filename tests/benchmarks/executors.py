@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Compare the MySQL Shell executors on the calls issued by typical hooks.
+
+Meant to be run on a deployed unit, from the charm directory, as root:
+
+    PYTHONPATH=src:lib:venv python3 tests/benchmarks/executors.py --help
+"""
+
+import argparse
+import statistics
+import time
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import MySQLClusterClient, MySQLInstanceClient
+from mysql_shell.executors import LocalExecutor
+from mysql_shell.models import ConnectionDetails
+from mysql_shell.models.statement import VariableScope
+
+from constants import CHARMED_MYSQLSH
+from mysql_shell_executors import HybridExecutor, PersistentExecutor
+
+QUOTER = StringQueryQuoter()
+
+
+def update_status_hook(
+    details: ConnectionDetails, cluster_name: str, executor_class: type
+) -> None:
+    """Replay the calls issued by an update-status hook on the leader unit."""
+    instance_client = MySQLInstanceClient(executor_class(details, CHARMED_MYSQLSH), QUOTER)
+    cluster_client = MySQLClusterClient(executor_class(details, CHARMED_MYSQLSH), QUOTER)
+
+    instance_client.get_instance_replication_role()
+    instance_client.get_instance_replication_state()
+    cluster_client.fetch_cluster_status(cluster_name)
+    instance_client.get_instance_variable(VariableScope.GLOBAL, "super_read_only")
+    instance_client.search_instance_replication_members()
+
+
+def config_changed_hook(
+    details: ConnectionDetails, cluster_name: str, executor_class: type
+) -> None:
+    """Replay the calls issued by a config-changed hook."""
+    instance_client = MySQLInstanceClient(executor_class(details, CHARMED_MYSQLSH), QUOTER)
+
+    instance_client.get_instance_version()
+    for variable in ("max_connections", "binlog_expire_logs_seconds", "innodb_buffer_pool_size"):
+        instance_client.get_instance_variable(VariableScope.GLOBAL, variable)
+
+
+HOOKS = {
+    "update-status": update_status_hook,
+    "config-changed": config_changed_hook,
+}
+
+
+def benchmark(
+    details: ConnectionDetails, cluster_name: str, executor_class: type, hook, iterations: int
+) -> list[float]:
+    """Return the wall time of every replayed hook."""
+    timings = []
+    for _ in range(iterations):
+        start = time.monotonic()
+        hook(details, cluster_name, executor_class)
+        timings.append(time.monotonic() - start)
+
+        # Hooks run in their own process, sessions do not outlive them
+        PersistentExecutor.close_sessions()
+        HybridExecutor.close_connections()
+
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cluster-name", required=True)
+    parser.add_argument("--user", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", default="3306")
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    details = ConnectionDetails(
+        username=args.user,
+        password=args.password,
+        host=args.host,
+        port=args.port,
+    )
+    for hook_name, hook in HOOKS.items():
+        for executor_class in (LocalExecutor, PersistentExecutor, HybridExecutor):
+            timings = benchmark(details, args.cluster_name, executor_class, hook, args.iterations)
+            print(
+                f"{hook_name:<15} {executor_class.__name__:<20} "
+                f"median={statistics.median(timings):.3f}s "
+                f"max={max(timings):.3f}s"
+            )
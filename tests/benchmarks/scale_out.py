@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Measure the time to add units to a deployed cluster, for several join concurrencies.
+
+Meant to be run against a Juju model with a deployed and active MySQL application:
+
+    python3 tests/benchmarks/scale_out.py --units 6 --concurrency 1 3
+
+Every run adds the units, waits for all of them to be active, and removes them again.
+"""
+
+import argparse
+import json
+import subprocess
+import time
+
+POLL_INTERVAL = 10  # seconds
+
+
+def juju(*args: str) -> str:
+    """Run a juju command, returning its output."""
+    return subprocess.check_output(["juju", *args], text=True)
+
+
+def units(application: str) -> dict:
+    """Get the application units status."""
+    status = json.loads(juju("status", application, "--format", "json"))
+    return status["applications"][application].get("units", {})
+
+
+def wait_for_active(application: str, count: int, timeout: float) -> None:
+    """Wait for the application to have `count` active and idle units."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        statuses = units(application).values()
+        if len(statuses) == count and all(
+            unit["workload-status"]["current"] == "active"
+            and unit["juju-status"]["current"] == "idle"
+            for unit in statuses
+        ):
+            return
+        time.sleep(POLL_INTERVAL)
+
+    raise TimeoutError(f"{application} did not reach {count} active units")
+
+
+def scale_out(application: str, added_units: int, concurrency: int, timeout: float) -> float:
+    """Return the time to add the units, scaling the application back in afterwards."""
+    juju("config", application, f"experimental-max-concurrent-joins={concurrency}")
+    initial_units = set(units(application))
+
+    start = time.monotonic()
+    juju("add-unit", application, "-n", str(added_units))
+    wait_for_active(application, len(initial_units) + added_units, timeout)
+    elapsed = time.monotonic() - start
+
+    juju("remove-unit", *sorted(set(units(application)) - initial_units))
+    wait_for_active(application, len(initial_units), timeout)
+
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--application", default="mysql")
+    parser.add_argument("--units", type=int, default=6)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--timeout", type=float, default=3600)
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        elapsed = scale_out(args.application, args.units, concurrency, args.timeout)
+        print(f"units={args.units:<3} concurrency={concurrency:<3} elapsed={elapsed:.0f}s")
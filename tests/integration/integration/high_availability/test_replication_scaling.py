@@ -5,11 +5,22 @@ import logging
 
 import jubilant_backports
 import pytest
+from charms.mysql.v0.mysql import (
+    LOCK_LEASE_DURATION,
+    LOCK_QUEUE_TICKET_RETENTION,
+    LOCK_QUEUE_TICKET_TIMEOUT,
+    QueuedLockingQueryBuilder,
+)
 from jubilant_backports import Juju
 
-from ...helpers import generate_random_string
+from ...helpers import execute_queries_on_unit, generate_random_string
 from ...helpers_ha import (
+    TEST_DATABASE_NAME,
+    get_app_leader,
     get_app_units,
+    get_mysql_primary_unit,
+    get_mysql_server_credentials,
+    get_unit_ip,
     insert_mysql_test_data,
     remove_mysql_test_data,
     scale_app_units,
@@ -88,3 +99,70 @@ async def test_scaling_without_data_loss(juju: Juju) -> None:
     # Ensure that the data still exists in all the units
     await verify_mysql_test_data(juju, MYSQL_APP_NAME, table_name, table_value)
     await remove_mysql_test_data(juju, MYSQL_APP_NAME, table_name)
+
+
+@pytest.mark.abort_on_fail
+async def test_lock_slot_queries(juju: Juju) -> None:
+    """Test the topology lock queries acquire and take over slots on a live instance."""
+    builder = QueuedLockingQueryBuilder(
+        table_schema=TEST_DATABASE_NAME,
+        table_name="locks",
+        queue_table_name="locks_queue",
+        lease_table_name="locks_leases",
+        ticket_timeout=LOCK_QUEUE_TICKET_TIMEOUT,
+        ticket_retention=LOCK_QUEUE_TICKET_RETENTION,
+        lease_duration=LOCK_LEASE_DURATION,
+    )
+    queue_table = f"`{TEST_DATABASE_NAME}`.`locks_queue`"
+    lease_table = f"`{TEST_DATABASE_NAME}`.`locks_leases`"
+
+    mysql_primary = get_mysql_primary_unit(juju, MYSQL_APP_NAME)
+    credentials = get_mysql_server_credentials(juju, get_app_leader(juju, MYSQL_APP_NAME))
+
+    async def execute_queries(queries: list[str]) -> list:
+        return await execute_queries_on_unit(
+            get_unit_ip(juju, MYSQL_APP_NAME, mysql_primary),
+            credentials["username"],
+            credentials["password"],
+            queries,
+            commit=True,
+        )
+
+    async def acquire_slot(instance: str) -> list:
+        """Acquire the lock slot, returning the lease holder."""
+        return await execute_queries([
+            builder.build_expire_tickets_query(),
+            *builder.build_enqueue_queries("unit-add", instance),
+            builder.build_slots_creation_query("unit-add", 1),
+            *builder.build_acquire_slot_queries("unit-add", instance, 1),
+            f"SELECT executor FROM {lease_table}",
+        ])
+
+    await execute_queries([
+        f"CREATE DATABASE IF NOT EXISTS `{TEST_DATABASE_NAME}`",
+        *builder.build_table_creation_query().split(";"),
+        *builder.build_support_tables_creation_queries(),
+    ])
+
+    assert await acquire_slot("mysql-7") == ["mysql-7"]
+    # acquiring a held slot again renews its lease
+    assert await acquire_slot("mysql-7") == ["mysql-7"]
+    assert await acquire_slot("mysql-8") == ["mysql-7"]
+
+    # slots with an expired lease are taken over
+    await execute_queries([
+        f"UPDATE {lease_table} SET renewed_at = CURRENT_TIMESTAMP - INTERVAL 1 HOUR"
+    ])
+    assert await acquire_slot("mysql-8") == ["mysql-8"]
+
+    # held slots without lease are taken over, here once their holder ticket is stale
+    await execute_queries([
+        f"DELETE FROM {lease_table}",
+        f"UPDATE {queue_table} SET updated_at = CURRENT_TIMESTAMP - INTERVAL 20 MINUTE",
+    ])
+    assert await acquire_slot("mysql-9") == ["mysql-9"]
+
+    await execute_queries([
+        f"DROP TABLE `{TEST_DATABASE_NAME}`.`{table}`"
+        for table in ("locks", "locks_queue", "locks_leases")
+    ])
@@ -0,0 +1,54 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from charms.mysql.v0.mysql import MySQLGetLockHoldersError
+from ops.testing import ActionFailed, Harness
+
+from charm import MySQLOperatorCharm
+
+
+@pytest.fixture
+def harness():
+    """Start the charm so harness.charm exists."""
+    harness = Harness(MySQLOperatorCharm)
+    harness.begin()
+    yield harness
+    harness.cleanup()
+
+
+def test_get_lock_holders_action(harness):
+    """The action reports every held lock, with the age and expiry of its lease."""
+    backend = MagicMock()
+    backend.get_lock_holders.return_value = [
+        {"task": "unit-add", "executor": "mysql-3", "lease_age": 120, "lease_expires_in": 280},
+        {"task": "unit-add-2", "executor": "mysql-4", "lease_age": None, "lease_expires_in": None},
+    ]
+
+    with patch.object(
+        MySQLOperatorCharm, "_mysql", new_callable=PropertyMock, return_value=backend
+    ):
+        output = harness.run_action("get-lock-holders")
+
+    assert output.results == {
+        "locks": {
+            "unit-add": {"holder": "mysql-3", "lease-age": 120, "lease-expires-in": 280},
+            "unit-add-2": {"holder": "mysql-4"},
+        }
+    }
+
+
+def test_get_lock_holders_action_failure(harness):
+    """The action fails when the locks cannot be read."""
+    backend = MagicMock()
+    backend.get_lock_holders.side_effect = MySQLGetLockHoldersError
+
+    with (
+        patch.object(
+            MySQLOperatorCharm, "_mysql", new_callable=PropertyMock, return_value=backend
+        ),
+        pytest.raises(ActionFailed),
+    ):
+        harness.run_action("get-lock-holders")
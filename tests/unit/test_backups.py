@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from charms.mysql.v0.mysql import (
+    MemberHealth,
     MySQLConfigureInstanceError,
     MySQLCreateClusterError,
     MySQLDeleteTempBackupDirectoryError,
@@ -361,12 +362,13 @@ Juju Version: 0.0.0
         self.assertEqual(error_message, "Cluster is not in a healthy state")
 
     @patch("mysql_vm_helpers.MySQL.offline_mode_and_hidden_instance_exists", return_value=False)
-    @patch("mysql_vm_helpers.MySQL.get_member_state", return_value="ONLINE")
-    @patch("mysql_vm_helpers.MySQL.get_member_role", return_value="SECONDARY")
+    @patch(
+        "mysql_vm_helpers.MySQL.get_member_health",
+        return_value=MemberHealth("SECONDARY", "ONLINE", "1.1.1.1", 2, 2),
+    )
     def test_can_unit_perform_backup(
         self,
-        _get_member_role,
-        _get_member_state,
+        _get_member_health,
         _offline_mode_and_hidden_instance_exists,
     ):
         """Test _can_unit_perform_backup()."""
@@ -375,30 +377,26 @@ Juju Version: 0.0.0
         self.assertIsNone(error_message)
 
     @patch("mysql_vm_helpers.MySQL.offline_mode_and_hidden_instance_exists", return_value=False)
-    @patch("mysql_vm_helpers.MySQL.get_member_state")
-    @patch("mysql_vm_helpers.MySQL.get_member_role")
+    @patch("mysql_vm_helpers.MySQL.get_member_health")
     @patch("mysql_vm_helpers.MySQL.reconcile_binlogs_collection", return_value=True)
     @patch("python_hosts.Hosts.write")
     def test_can_unit_perform_backup_failure(
         self,
         _,
         __,
-        _get_member_role,
-        _get_member_state,
+        _get_member_health,
         _offline_mode_and_hidden_instance_exists,
     ):
         """Test failure of _can_unit_perform_backup()."""
         # test non-online state
-        _get_member_role.return_value = "SECONDARY"
-        _get_member_state.return_value = "RECOVERING"
+        _get_member_health.return_value = MemberHealth("SECONDARY", "RECOVERING", None, 2, 1)
 
         success, error_message = self.mysql_backups._can_unit_perform_backup()
         self.assertFalse(success)
         self.assertEqual(error_message, "Unit cannot perform backups as its state is RECOVERING")
 
         # test more than one unit and backup on primary
-        _get_member_role.return_value = "PRIMARY"
-        _get_member_state.return_value = "ONLINE"
+        _get_member_health.return_value = MemberHealth("PRIMARY", "ONLINE", "1.1.1.1", 2, 2)
 
         self.harness.add_relation_unit(self.peer_relation_id, "mysql/1")
 
@@ -409,7 +407,7 @@ Juju Version: 0.0.0
         self.harness.remove_relation_unit(self.peer_relation_id, "mysql/1")
 
         # test error getting member state
-        _get_member_state.side_effect = MySQLUnableToGetMemberStateError
+        _get_member_health.side_effect = MySQLUnableToGetMemberStateError
 
         success, error_message = self.mysql_backups._can_unit_perform_backup()
         self.assertFalse(success)
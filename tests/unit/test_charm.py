@@ -1,19 +1,31 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import json
+import subprocess
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import PropertyMock, patch
 
 import pytest
 from charms.mysql.v0.mysql import (
+    EXECUTOR_CALLS,
+    HOST_CIRCUIT_BREAKER,
+    MemberHealth,
     MySQLConfigureInstanceError,
     MySQLConfigureMySQLUsersError,
     MySQLCreateClusterError,
     MySQLInitializeJujuOperationsTableError,
+    MySQLSetVariableError,
+    MySQLUnableToGetMemberStateError,
+    MySQLUpdateUserMaxConnectionsError,
+    RecoveryProgress,
+    RedoLogStatus,
 )
 from ops.model import ActiveStatus, BlockedStatus, MaintenanceStatus, WaitingStatus
 from ops.testing import Harness
-from tenacity import Retrying, stop_after_attempt
+from tenacity import RetryError, Retrying, stop_after_attempt
 
 from charm import MySQLOperatorCharm
 from mysql_vm_helpers import (
@@ -231,14 +243,14 @@ class TestCharm(unittest.TestCase):
         self.charm.on.start.emit()
         self.assertTrue(isinstance(self.harness.model.unit.status, BlockedStatus))
 
+    @patch("mysql_vm_helpers.MySQL.update_user_max_connections")
     @patch(
         "charm.MySQLOperatorCharm.cluster_initialized",
         new_callable=PropertyMock(return_value=True),
     )
     @patch("charm.MySQLOperatorCharm.unit_initialized", return_value=True)
     @patch("charms.mysql.v0.mysql.MySQLCharmBase.active_status_message", return_value="")
-    @patch("mysql_vm_helpers.MySQL.get_member_state")
-    @patch("mysql_vm_helpers.MySQL.get_member_role")
+    @patch("mysql_vm_helpers.MySQL.get_member_health")
     @patch("mysql_vm_helpers.MySQL.get_cluster_primary_address")
     @patch("charm.is_volume_mounted", return_value=True)
     @patch("mysql_vm_helpers.MySQL.reboot_from_complete_outage")
@@ -259,11 +271,11 @@ class TestCharm(unittest.TestCase):
         _reboot_from_complete_outage,
         _is_volume_mounted,
         _get_cluster_primary_address,
-        _get_member_role,
-        _get_member_state,
+        _get_member_health,
         _active_status_message,
         _unit_initialized,
         _cluster_initialized,
+        _update_user_max_connections,
     ):
         self.harness.update_relation_data(
             self.peer_relation_id,
@@ -284,26 +296,43 @@ class TestCharm(unittest.TestCase):
                 "member-state": "online",
             },
         )
-        _get_member_role.return_value = "PRIMARY"
-        _get_member_state.return_value = "ONLINE"
+        _get_member_health.return_value = MemberHealth("PRIMARY", "ONLINE", "1.1.1.1", 1, 1)
 
         self.charm.on.update_status.emit()
-        _get_member_role.assert_called_once()
-        _get_member_state.assert_called_once()
+        _get_member_health.assert_called_once()
         _reboot_from_complete_outage.assert_not_called()
         _snap_service_operation.assert_not_called()
         _is_volume_mounted.assert_called_once()
-        _get_cluster_primary_address.assert_called_once()
+        _get_cluster_primary_address.assert_not_called()
+        _update_user_max_connections.assert_called_once_with("monitoring", 4)
 
         self.assertTrue(isinstance(self.harness.model.unit.status, ActiveStatus))
 
+        # test group without primary, checked against the cluster status
+        _get_member_health.reset_mock()
+        _get_member_health.return_value = MemberHealth("SECONDARY", "ONLINE", None, 2, 1)
+        _get_cluster_primary_address.return_value = None
+
+        self.charm.on.update_status.emit()
+        _get_cluster_primary_address.assert_called_once()
+        self.assertTrue(isinstance(self.harness.model.app.status, MaintenanceStatus))
+
+        # test minority partition, still listing its primary but without quorum
+        _get_member_health.return_value = MemberHealth("PRIMARY", "ONLINE", "1.1.1.1", 3, 1)
+        _get_cluster_primary_address.reset_mock()
+        self.harness.model.app.status = ActiveStatus()
+
+        self.charm.on.update_status.emit()
+        _get_cluster_primary_address.assert_called_once()
+        self.assertEqual(
+            self.harness.model.app.status, MaintenanceStatus("Cluster has no primary.")
+        )
+
         # test instance state = offline
-        _get_member_role.reset_mock()
-        _get_member_state.reset_mock()
+        _get_member_health.reset_mock()
         _get_cluster_primary_address.reset_mock()
 
-        _get_member_role.return_value = "PRIMARY"
-        _get_member_state.return_value = "OFFLINE"
+        _get_member_health.return_value = MemberHealth("PRIMARY", "OFFLINE", None, 1, 0)
         self.harness.update_relation_data(
             self.peer_relation_id,
             self.charm.unit.name,
@@ -313,29 +342,287 @@ class TestCharm(unittest.TestCase):
         )
 
         self.charm.on.update_status.emit()
-        _get_member_role.assert_called_once()
-        _get_member_state.assert_called_once()
+        _get_member_health.assert_called_once()
         _reboot_from_complete_outage.assert_called_once()
         _snap_service_operation.assert_called()
         _get_cluster_primary_address.assert_not_called()
 
         self.assertTrue(isinstance(self.harness.model.unit.status, MaintenanceStatus))
         # test instance state = unreachable
-        _get_member_role.reset_mock()
-        _get_member_state.reset_mock()
+        _get_member_health.reset_mock()
         _get_cluster_primary_address.reset_mock()
         _snap_service_operation.reset_mock()
 
         _reboot_from_complete_outage.reset_mock()
         _snap_service_operation.return_value = False
-        _get_member_role.return_value = "PRIMARY"
-        _get_member_state.return_value = "UNREACHABLE"
+        _get_member_health.side_effect = MySQLUnableToGetMemberStateError
 
         self.charm.on.update_status.emit()
-        _get_member_role.assert_called_once()
-        _get_member_state.assert_called_once()
+        _get_member_health.assert_called_once()
         _reboot_from_complete_outage.assert_not_called()
         _snap_service_operation.assert_called_once()
         _get_cluster_primary_address.assert_not_called()
 
         self.assertTrue(isinstance(self.harness.model.unit.status, BlockedStatus))
+
+    @patch("charm.MySQLOperatorCharm._on_peer_relation_changed")
+    @patch("socket.getfqdn", return_value="test-hostname")
+    def test_mysql_cached_per_dispatch(self, _, __):
+        self.harness.set_leader(True)
+        self.charm._dispatch_counters.clear()
+
+        mysql = self.charm._mysql
+        self.assertIs(self.charm._mysql, mysql)
+        self.assertEqual(self.charm._dispatch_counters["mysql-builds"], 1)
+        self.assertEqual(self.charm._dispatch_counters["secret-reads"], 5)
+
+        # changing a secret rebuilds the object
+        self.charm.set_secret("app", "root-password", "new-password")
+        self.assertIsNot(self.charm._mysql, mysql)
+        self.assertEqual(self.charm._mysql.root_password, "new-password")
+        self.assertEqual(self.charm._dispatch_counters["mysql-builds"], 2)
+
+        # changing the peer relation rebuilds the object
+        mysql = self.charm._mysql
+        self.harness.update_relation_data(
+            self.peer_relation_id, "mysql/1", {"member-state": "online"}
+        )
+        self.assertIsNot(self.charm._mysql, mysql)
+
+        # changing the cluster name rebuilds the object
+        mysql = self.charm._mysql
+        self.charm.app_peer_data["cluster-name"] = "new-cluster"
+        self.assertEqual(self.charm._mysql.cluster_name, "new-cluster")
+        self.assertIsNot(self.charm._mysql, mysql)
+
+    @patch.dict("os.environ", {"JUJU_DISPATCH_PATH": "hooks/update-status"})
+    def test_on_commit_writes_executor_calls_summary(self):
+        EXECUTOR_CALLS.reset()
+        EXECUTOR_CALLS.record_call("get_member_state", "127.0.0.1:33062", 0.02, False)
+        EXECUTOR_CALLS.record_call("get_member_state", "127.0.0.1:33062", 3, True)
+        EXECUTOR_CALLS.record_retry("get_member_state")
+        HOST_CIRCUIT_BREAKER.trip("10.1.1.1", "Can't connect to MySQL server on '10.1.1.1'")
+
+        with (
+            tempfile.TemporaryDirectory() as charm_dir,
+            patch(
+                "charm.MySQLOperatorCharm.charm_dir",
+                new_callable=PropertyMock,
+                return_value=Path(charm_dir),
+            ),
+            self.assertLogs("charm", level="INFO") as logs,
+        ):
+            self.harness.framework.on.commit.emit()
+            summary = json.loads((Path(charm_dir) / "executor_calls.json").read_text())
+
+        self.assertIn("2 executor calls took 3.02s (1 errors, 1 retries)", logs.output[0])
+        self.assertIn("unreachable hosts: 10.1.1.1", logs.output[0])
+        self.assertIn("10.1.1.1", summary["hooks/update-status"]["unreachable_hosts"])
+        self.assertEqual(HOST_CIRCUIT_BREAKER.tripped_hosts, {})
+        operation = summary["hooks/update-status"]["operations"]["get_member_state"]
+        self.assertEqual(operation["histogram"]["0.05"], 1)
+        self.assertEqual(operation["histogram"]["5"], 1)
+        self.assertEqual(EXECUTOR_CALLS.summary()["calls"], 0)
+
+    def test_report_recovery_progress(self):
+        """Test the recovery progress is reported in the unit status."""
+        self.charm._report_recovery_progress(
+            RecoveryProgress("file copy", 5160000000, 12000000000, 20000000)
+        )
+        self.assertEqual(
+            self.charm.unit.status,
+            MaintenanceStatus("cloning 43% (file copy, 5160/12000 MB, 20 MB/s, ~6 min)"),
+        )
+
+        self.charm._report_recovery_progress(RecoveryProgress("incremental", 250, 1000))
+        self.assertEqual(
+            self.charm.unit.status, MaintenanceStatus("recovering 25% (250/1000 transactions)")
+        )
+
+    @patch("log_rotation_setup.LogRotationSetup.setup")
+    @patch("config.MySQLConfig.custom_config", new_callable=PropertyMock)
+    @patch("charm.MySQLOperatorCharm._is_peer_data_set", new_callable=PropertyMock)
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    def test_on_config_changed_grows_redo_log(
+        self, _mysql, _is_peer_data_set, _custom_config, _setup
+    ):
+        """Test a larger rendered redo log capacity is applied online, a smaller one is not."""
+        _is_peer_data_set.return_value = True
+        _custom_config.return_value = {"innodb_redo_log_capacity": "536870912"}
+        mysql = _mysql.return_value
+        mysql.write_mysqld_config.return_value = {"innodb_redo_log_capacity": "1073741824"}
+
+        self.charm.on.config_changed.emit()
+        mysql.set_dynamic_variable.assert_called_once_with("innodb_redo_log_capacity", 1073741824)
+
+        mysql.set_dynamic_variable.reset_mock()
+        mysql.write_mysqld_config.return_value = {"innodb_redo_log_capacity": "268435456"}
+        self.charm.on.config_changed.emit()
+        mysql.set_dynamic_variable.assert_not_called()
+
+    @patch("charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock")
+    @patch("log_rotation_setup.LogRotationSetup.setup")
+    @patch("config.MySQLConfig.custom_config", new_callable=PropertyMock)
+    @patch("charm.MySQLOperatorCharm._is_peer_data_set", new_callable=PropertyMock)
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    def test_on_config_changed_resizes_buffer_pool(
+        self, _mysql, _is_peer_data_set, _custom_config, _setup, _on_acquire_lock
+    ):
+        """Test buffer pool changes are applied online, restarting only on chunk changes."""
+        _is_peer_data_set.return_value = True
+        _custom_config.return_value = {
+            "innodb_buffer_pool_size": "1342177280",
+            "innodb_buffer_pool_chunk_size": "16777216",
+        }
+        mysql = _mysql.return_value
+        mysql.write_mysqld_config.return_value = {
+            "innodb_buffer_pool_size": "2147483648",
+            "innodb_buffer_pool_chunk_size": "16777216",
+            "innodb_redo_log_capacity": "536870912",
+        }
+
+        self.charm.on.config_changed.emit()
+        mysql.resize_buffer_pool.assert_called_once_with(2147483648)
+        mysql.set_dynamic_variable.assert_called_with("innodb_redo_log_capacity", 536870912)
+        _on_acquire_lock.assert_not_called()
+
+        # restarted when the resize fails
+        mysql.resize_buffer_pool.side_effect = MySQLSetVariableError
+        self.charm.on.config_changed.emit()
+        _on_acquire_lock.assert_called_once()
+
+        _on_acquire_lock.reset_mock()
+        mysql.resize_buffer_pool.reset_mock()
+        mysql.write_mysqld_config.return_value = {
+            "innodb_buffer_pool_size": "17179869184",
+            "innodb_buffer_pool_chunk_size": "33554432",
+        }
+        self.charm.on.config_changed.emit()
+        mysql.resize_buffer_pool.assert_not_called()
+        _on_acquire_lock.assert_called_once()
+
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    def test_update_monitoring_user_max_connections(self, _mysql):
+        """Test the monitoring user connections limit is raised once."""
+        self.harness.set_leader()
+        mysql = _mysql.return_value
+        mysql.update_user_max_connections.side_effect = MySQLUpdateUserMaxConnectionsError
+
+        self.charm._update_monitoring_user_max_connections()
+        self.assertNotIn("monitoring-max-connections", self.charm.app_peer_data)
+
+        mysql.update_user_max_connections.side_effect = None
+        self.charm._update_monitoring_user_max_connections()
+        self.charm._update_monitoring_user_max_connections()
+        self.assertEqual(mysql.update_user_max_connections.call_count, 2)
+        mysql.update_user_max_connections.assert_called_with("monitoring", 4)
+        self.assertEqual(self.charm.app_peer_data["monitoring-max-connections"], "4")
+
+    @patch("charm.time")
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    def test_tune_redo_log_capacity(self, _mysql, _time):
+        """Test the redo log is grown online once the observed writes outgrow it."""
+        charm_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(charm_dir.cleanup)
+        patcher = patch(
+            "charm.MySQLOperatorCharm.charm_dir",
+            new_callable=PropertyMock,
+            return_value=Path(charm_dir.name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        mysql = _mysql.return_value
+        mysql.get_redo_log_status.return_value = RedoLogStatus(
+            1024 * 2**20, 4 * 2**30, 10**9, 10**9, "OK"
+        )
+        mysql.write_mysqld_config.return_value = {"innodb_redo_log_capacity": "2147483648"}
+
+        # first sample, no rate known yet
+        _time.return_value = 1000
+        mysql.get_redo_log_capacity.return_value = 2 * 2**30
+        self.charm._tune_redo_log_capacity()
+        mysql.get_redo_log_capacity.assert_not_called()
+        # sampled in local state, not in the peer relation
+        self.assertNotIn("redo-log-sample", self.charm.unit_peer_data)
+        self.assertTrue((Path(charm_dir.name) / "redo_log_sample.json").exists())
+
+        # within a quarter of the current capacity
+        _time.return_value = 1300
+        mysql.get_redo_log_capacity.return_value = 1200 * 2**20
+        self.charm._tune_redo_log_capacity()
+        mysql.get_redo_log_capacity.assert_called_once_with(4 * 2**30, 0, 0)
+        mysql.set_dynamic_variable.assert_not_called()
+
+        _time.return_value = 1600
+        mysql.get_redo_log_capacity.return_value = 2 * 2**30
+        self.charm._tune_redo_log_capacity()
+        mysql.write_mysqld_config.assert_called_once()
+        mysql.set_dynamic_variable.assert_called_once_with("innodb_redo_log_capacity", 2147483648)
+        self.assertEqual(self.charm.unit_peer_data["redo-log-write-rate"], "1193047")
+
+    @patch("subprocess.check_output")
+    def test_get_departing_unit_labels(self, _check_output):
+        """Test departing units are read from the goal state, this unit at least."""
+        _check_output.return_value = json.dumps({
+            "units": {
+                "mysql/0": {"status": "active"},
+                "mysql/1": {"status": "dying"},
+                "mysql/2": {"status": "dying"},
+            }
+        })
+        self.assertEqual(
+            self.charm._get_departing_unit_labels(), ["mysql-0", "mysql-1", "mysql-2"]
+        )
+
+        # removals go on when the goal state cannot be read
+        for error in (FileNotFoundError, subprocess.CalledProcessError(1, "goal-state")):
+            _check_output.side_effect = error
+            self.assertEqual(self.charm._get_departing_unit_labels(), ["mysql-0"])
+
+        _check_output.side_effect = None
+        _check_output.return_value = json.dumps({"units": {"mysql/1": {}}})
+        self.assertEqual(self.charm._get_departing_unit_labels(), ["mysql-0"])
+
+    @patch("time.sleep")
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    def test_recover_unit_after_restart(self, _mysql, _):
+        """Test the rejoin budget only counts the checks made once recovered."""
+        clock = [0]
+
+        def hold_if_recovering(**_) -> str:
+            # a long clone first, then quick checks
+            clock[0] += 100 if clock[0] else 3600
+            return "OFFLINE"
+
+        _mysql.return_value.hold_if_recovering.side_effect = hold_if_recovering
+        self.harness.set_planned_units(2)
+
+        with patch("charm.monotonic", side_effect=lambda: clock[0]), self.assertRaises(RetryError):
+            self.charm.recover_unit_after_restart()
+
+        self.assertEqual(_mysql.return_value.hold_if_recovering.call_count, 6)
+
+    @patch("charm.MySQLOperatorCharm._on_update_status")
+    @patch("charm.MySQLOperatorCharm.recover_unit_after_restart")
+    @patch("charm.MySQLOperatorCharm._mysql", new_callable=PropertyMock)
+    @patch("charm.MySQLOperatorCharm.unit_initialized", return_value=True)
+    def test_restart_records_timings(
+        self, _unit_initialized, _mysql, _recover_unit_after_restart, _
+    ):
+        """Test restarts record the time taken by each of their phases."""
+        with (
+            tempfile.TemporaryDirectory() as charm_dir,
+            patch(
+                "charm.MySQLOperatorCharm.charm_dir",
+                new_callable=PropertyMock,
+                return_value=Path(charm_dir),
+            ),
+        ):
+            for _ in range(12):
+                self.charm._restart(None)
+            restarts = json.loads((Path(charm_dir) / "restart_timings.json").read_text())
+
+        self.assertEqual(len(restarts), 10)
+        self.assertEqual(set(restarts[-1]), {"timestamp", "mysqld-ready", "member-online"})
+        _mysql.return_value.restart_mysqld.assert_called()
+        _recover_unit_after_restart.assert_called()
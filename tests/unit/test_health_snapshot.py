@@ -0,0 +1,155 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import PropertyMock, mock_open, patch
+
+from charms.mysql.v0.mysql import MemberHealth
+from ops.testing import Harness
+
+from charm import MySQLOperatorCharm
+from constants import PEER
+
+APP_NAME = "mysql"
+
+SNAPSHOT = {
+    "mysqld_alive": True,
+    "member_role": "SECONDARY",
+    "member_state": "ONLINE",
+    "primary_address": "1.1.1.1",
+    "member_count": 3,
+    "online_member_count": 3,
+    "applier_queue": 0,
+    "recovery_channel_state": "OFF",
+    "clone": None,
+}
+
+
+class TestHealthSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.harness = Harness(MySQLOperatorCharm)
+        self.addCleanup(self.harness.cleanup)
+        self.harness.begin()
+        self.charm = self.harness.charm
+        self.health_snapshot = self.charm.health_snapshot
+        self.peer_relation_id = self.harness.add_relation(PEER, APP_NAME)
+        self.harness.update_relation_data(
+            self.peer_relation_id,
+            APP_NAME,
+            {"cluster-name": "test-cluster", "cluster-set-domain-name": "test-domain"},
+        )
+
+        charm_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(charm_dir.cleanup)
+        self.charm_dir = Path(charm_dir.name)
+        patcher = patch(
+            "charm.MySQLOperatorCharm.charm_dir",
+            new_callable=PropertyMock,
+            return_value=self.charm_dir,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_snapshot(self, age: float = 0, **fields) -> None:
+        snapshot = {**SNAPSHOT, **fields, "timestamp": time.time() - age}
+        (self.charm_dir / "health_snapshot.json").write_text(json.dumps(snapshot))
+
+    def test_read(self):
+        """Test only recent snapshots are read."""
+        self.assertIsNone(self.health_snapshot.read())
+
+        self.write_snapshot()
+        self.assertEqual(self.health_snapshot.read()["member_state"], "ONLINE")
+        self.assertEqual(
+            self.health_snapshot.member_health(),
+            MemberHealth("SECONDARY", "ONLINE", "1.1.1.1", 3, 3),
+        )
+        self.assertTrue(self.health_snapshot.mysqld_alive())
+
+        self.write_snapshot(age=60)
+        self.assertIsNone(self.health_snapshot.read())
+        self.assertIsNone(self.health_snapshot.mysqld_alive())
+
+        (self.charm_dir / "health_snapshot.json").write_text("{")
+        self.assertIsNone(self.health_snapshot.read())
+
+    @patch("mysql_vm_helpers.MySQL.is_mysqld_running", return_value=True)
+    @patch("mysql_vm_helpers.MySQL.get_member_health")
+    def test_charm_reads_snapshot(self, _get_member_health, _is_mysqld_running):
+        """Test the charm reads recent snapshots instead of querying mysqld."""
+        _get_member_health.return_value = MemberHealth("PRIMARY", "ONLINE", "1.1.1.2", 3, 3)
+
+        self.write_snapshot()
+        self.assertEqual(self.charm.get_member_health().role, "SECONDARY")
+        self.assertTrue(self.charm.is_mysqld_alive())
+        _get_member_health.assert_not_called()
+
+        self.write_snapshot(mysqld_alive=False)
+        self.assertEqual(self.charm.get_member_health().role, "PRIMARY")
+        self.assertFalse(self.charm.is_mysqld_alive())
+
+        self.write_snapshot(age=60)
+        self.assertEqual(self.charm.get_member_health().role, "PRIMARY")
+        self.assertTrue(self.charm.is_mysqld_alive())
+
+    @patch("health_snapshot.check_pid", return_value=False)
+    @patch("builtins.open", new_callable=mock_open)
+    @patch("subprocess.Popen")
+    @patch("charm.MySQLOperatorCharm.get_secret", return_value="monitoring-password")
+    def test_start_writer(self, _get_secret, _popen, _open, _check_pid):
+        """Test starting the writer, passing the password through the standard input."""
+        _popen.return_value.pid = 1234
+
+        self.health_snapshot.start_writer()
+
+        command = _popen.call_args.args[0]
+        self.assertEqual(command[1], "scripts/health_snapshot_writer.py")
+        self.assertNotIn("monitoring-password", command)
+        _popen.return_value.stdin.write.assert_called_once_with("monitoring-password\n")
+        self.assertEqual(self.charm.unit_peer_data["health-writer-pid"], "1234")
+
+        # not started again while running
+        _popen.reset_mock()
+        _check_pid.return_value = True
+        self.health_snapshot.start_writer()
+        _popen.assert_not_called()
+
+    @patch("os.kill")
+    def test_stop_writer(self, _kill):
+        """Test stopping the writer discards its snapshot."""
+        self.write_snapshot()
+        self.charm.unit_peer_data["health-writer-pid"] = "1234"
+
+        self.health_snapshot.stop_writer()
+
+        _kill.assert_called_once()
+        self.assertNotIn("health-writer-pid", self.charm.unit_peer_data)
+        self.assertIsNone(self.health_snapshot.read())
+
+    @patch("charm.MySQLOperatorCharm.update_endpoints")
+    def test_group_membership_change(self, _update_endpoints):
+        """Test membership changes dispatched by the writer update the endpoints."""
+        changes = [
+            {
+                "host": "1.1.1.2",
+                "previous-role": "SECONDARY",
+                "previous-state": "ONLINE",
+                "role": "SECONDARY",
+                "state": "UNREACHABLE",
+            }
+        ]
+
+        with (
+            patch.dict("os.environ", {"GROUP_MEMBERSHIP_CHANGES": json.dumps(changes)}),
+            self.assertLogs("charm", level="INFO") as logs,
+        ):
+            self.charm.on.group_membership_change.emit()
+
+        _update_endpoints.assert_called_once()
+        self.assertIn(
+            "1.1.1.2 changed from ONLINE/SECONDARY to UNREACHABLE/SECONDARY", logs.output[0]
+        )
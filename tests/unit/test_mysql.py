@@ -4,11 +4,18 @@
 """Unit test for MySQL shared library."""
 
 import copy
+import json
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import tenacity
 from charms.mysql.v0.mysql import (
+    BYTES_1MB,
+    CLONE_VARIABLES,
+    EXECUTOR_CALLS,
+    HOST_CIRCUIT_BREAKER,
     LEGACY_ROLE_ROUTER,
     MODERN_ROLE_ROUTER,
     ROLE_BACKUP,
@@ -18,6 +25,8 @@ from charms.mysql.v0.mysql import (
     ROLE_READ,
     ROLE_STATS,
     UNIT_ADD_LOCKNAME,
+    BYTES_1GiB,
+    BYTES_1MiB,
     Error,
     MySQLAddInstanceToClusterError,
     MySQLBase,
@@ -42,6 +51,7 @@ from charms.mysql.v0.mysql import (
     MySQLExecuteBackupCommandsError,
     MySQLGetAutoTuningParametersError,
     MySQLGetClusterPrimaryAddressError,
+    MySQLGetLockHoldersError,
     MySQLGetMySQLVersionError,
     MySQLGetRouterUsersError,
     MySQLInitializeJujuOperationsTableError,
@@ -60,17 +70,47 @@ from charms.mysql.v0.mysql import (
     MySQLSetInstanceOptionError,
     MySQLSetVariableError,
     MySQLUnableToGetMemberStateError,
+    MySQLUnreachableHostError,
+    MySQLUpdateUserMaxConnectionsError,
+    RecoveryProgress,
+    RedoLogStatus,
+    StorageProbe,
 )
 from mysql_shell.builders import CharmAuthorizationQueryBuilder
 from mysql_shell.executors.errors import ExecutionError
 from mysql_shell.models import (
     ClusterGlobalStatus,
+    ConnectionDetails,
     InstanceRole,
     InstanceState,
 )
 
 from constants import CHARMED_MYSQLSH, MYSQLD_SOCK_FILE
 
+QUEUE_TABLE = "`mysql`.`juju_units_operations_queue`"
+LEASE_TABLE = "`mysql`.`juju_units_operations_leases`"
+SUPPORT_TABLES_QUERIES = [
+    f"CREATE TABLE IF NOT EXISTS {QUEUE_TABLE} ( "
+    "    ticket BIGINT UNSIGNED AUTO_INCREMENT, "
+    "    task VARCHAR(20), "
+    "    executor VARCHAR(20), "
+    "    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+    "    PRIMARY KEY(ticket), "
+    "    UNIQUE KEY(task, executor) "
+    ")",
+    f"CREATE TABLE IF NOT EXISTS {LEASE_TABLE} ( "
+    "    task VARCHAR(20), "
+    "    executor VARCHAR(20), "
+    "    acquired_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+    "    renewed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+    "    PRIMARY KEY(task) "
+    ")",
+]
+EXPIRED_LEASES_QUERY = (
+    "SELECT {column} FROM "
+    f"{LEASE_TABLE} WHERE renewed_at < CURRENT_TIMESTAMP - INTERVAL 300 SECOND"
+)
+
 SHORT_CLUSTER_STATUS = {
     "defaultReplicaSet": {
         "topology": {
@@ -213,7 +253,7 @@ class TestMySQLBase(unittest.TestCase):
             "UPDATE mysql.user SET authentication_string=null WHERE User='root' and Host='localhost'",
             "ALTER USER 'root'@'localhost' IDENTIFIED BY 'password'",
             "CREATE USER 'serverconfig'@'%' IDENTIFIED BY 'serverconfigpassword'",
-            "CREATE USER 'monitoring'@'%' IDENTIFIED BY 'monitoringpassword' WITH MAX_USER_CONNECTIONS 3",
+            "CREATE USER 'monitoring'@'%' IDENTIFIED BY 'monitoringpassword' WITH MAX_USER_CONNECTIONS 4",
             "CREATE USER 'backups'@'%' IDENTIFIED BY 'backupspassword'",
             "GRANT ALL ON *.* TO 'serverconfig'@'%' WITH GRANT OPTION",
             "GRANT charmed_stats TO 'monitoring'@'%'",
@@ -434,6 +474,7 @@ class TestMySQLBase(unittest.TestCase):
                 "    executor = '', "
                 "    status = 'not-started'"
             ),
+            *SUPPORT_TABLES_QUERIES,
         ))
 
         self.mysql.initialize_juju_units_operations_table()
@@ -502,6 +543,7 @@ class TestMySQLBase(unittest.TestCase):
             "cluster = dba.get_cluster('test_cluster')",
             "cluster.add_instance('127.0.0.2:3306', {'recoveryMethod': 'auto', 'label': 'mysql-1'})",
         ]
+        self.mock_executor.execute_sql.side_effect = ExecutionError
 
         self.mysql.add_instance_to_cluster(
             instance_address="127.0.0.2",
@@ -523,6 +565,7 @@ class TestMySQLBase(unittest.TestCase):
     ):
         """Test exceptions raised while running add_instance_to_cluster."""
         self.mock_executor.execute_py.side_effect = ExecutionError
+        self.mock_executor.execute_sql.return_value = []
 
         with self.assertRaises(MySQLAddInstanceToClusterError):
             self.mysql.add_instance_to_cluster(
@@ -532,6 +575,154 @@ class TestMySQLBase(unittest.TestCase):
             _acquire_lock.assert_called_once()
             _release_lock.assert_called_once()
 
+    def test_get_recovery_method(self):
+        """Test incremental recovery is chosen when the binlogs hold the missing transactions."""
+        gtids = {
+            "missing": "a:11-20",
+            "in_binlogs": "a:6-20",
+            "purged_applied": 1,
+            "no_errant": 1,
+            "data_size": 10000,
+        }
+        binlogs = [{"Log_name": "binlog.000001", "File_size": 1500}]
+        self.mock_executor.execute_sql.side_effect = [
+            [{"gtid_executed": "a:1-10"}],
+            [gtids],
+            binlogs,
+        ]
+
+        with self.assertLogs("charms.mysql.v0.mysql", level="INFO") as logs:
+            self.assertEqual(
+                self.mysql._get_recovery_method("127.0.0.2", "127.0.0.1"), "incremental"
+            )
+        self.assertIn("10 transactions missing, estimated transfer of 1000 bytes", logs.output[0])
+        self.assertIn(
+            "GTID_SUBSET(@@gtid_purged, 'a:1-10')",
+            self.mock_executor.execute_sql.call_args_list[1].args[0],
+        )
+
+        # purged transactions can only be recovered by cloning
+        self.mock_executor.execute_sql.side_effect = [
+            [{"gtid_executed": ""}],
+            [{**gtids, "missing": "a:1-20", "purged_applied": 0}],
+            binlogs,
+        ]
+        with self.assertLogs("charms.mysql.v0.mysql", level="INFO") as logs:
+            self.assertEqual(self.mysql._get_recovery_method("127.0.0.2", "127.0.0.1"), "clone")
+        self.assertIn("estimated transfer of 10000 bytes", logs.output[0])
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        self.assertEqual(self.mysql._get_recovery_method("127.0.0.2", "127.0.0.1"), "auto")
+
+    def test_plan_instances_removal(self):
+        """Test removals keep a majority, unreachable members first and the primary last."""
+
+        def member(role: str, status: str = "ONLINE") -> dict:
+            return {"memberRole": role, "status": status}
+
+        topology = {
+            "mysql-0": member("PRIMARY"),
+            "mysql-1": member("SECONDARY"),
+            "mysql-2": member("SECONDARY", "(MISSING)"),
+            "mysql-3": member("SECONDARY"),
+            "mysql-4": member("SECONDARY"),
+        }
+
+        self.assertEqual(
+            MySQLBase._plan_instances_removal(topology, ["mysql-0", "mysql-2", "mysql-3"]),
+            (["mysql-2", "mysql-0", "mysql-3"], "mysql-1"),
+        )
+        self.assertEqual(
+            MySQLBase._plan_instances_removal(topology, ["mysql-3", "mysql-4"]),
+            (["mysql-3", "mysql-4"], None),
+        )
+
+        # removals stop once they would run without a majority of ONLINE members
+        topology["mysql-3"] = member("SECONDARY", "UNREACHABLE")
+        self.assertEqual(
+            MySQLBase._plan_instances_removal(topology, ["mysql-3", "mysql-1", "mysql-4"]),
+            (["mysql-3", "mysql-1"], None),
+        )
+
+        # or would leave the group without one, 2 of 4 members being ONLINE afterwards
+        self.assertEqual(
+            MySQLBase._plan_instances_removal(topology, ["mysql-1", "mysql-4"]),
+            ([], None),
+        )
+
+        with self.assertRaises(MySQLRemoveInstanceError):
+            MySQLBase._plan_instances_removal(topology, ["mysql-0", "mysql-1", "mysql-4"])
+
+    @patch("charms.mysql.v0.mysql.MySQLBase.is_instance_in_cluster", return_value=True)
+    @patch("charms.mysql.v0.mysql.MySQLBase.set_cluster_primary")
+    @patch("charms.mysql.v0.mysql.MySQLBase._acquire_lock", return_value=True)
+    @patch("charms.mysql.v0.mysql.MySQLBase._release_lock")
+    def test_remove_instances(
+        self, _release_lock, _acquire_lock, _set_cluster_primary, _is_instance_in_cluster
+    ):
+        """Test departing instances are removed in a single pass, paying the lock once."""
+        status = {
+            "defaultReplicaSet": {
+                "status": "OK",
+                "primary": "1.1.1.1:3306",
+                "topology": {
+                    f"mysql-{index}": {
+                        "address": f"1.1.1.{index + 1}:3306",
+                        "memberRole": "PRIMARY" if index == 0 else "SECONDARY",
+                        "status": "ONLINE",
+                    }
+                    for index in range(5)
+                },
+            }
+        }
+        self.mock_executor.execute_py.side_effect = [json.dumps(status), json.dumps(status), ""]
+
+        self.mysql.remove_instances("mysql-0", ["mysql-0", "mysql-3", "mysql-4"])
+
+        _acquire_lock.assert_called_once()
+        _release_lock.assert_called_once()
+        _set_cluster_primary.assert_called_once_with("1.1.1.2")
+        self.mock_executor.execute_py.assert_called_with(
+            "\n".join((
+                "cluster = dba.get_cluster('test_cluster')",
+                "cluster.remove_instance('1.1.1.1:3306', {'force': 'true'})",
+                "cluster.remove_instance('1.1.1.4:3306', {'force': 'true'})",
+                "cluster.remove_instance('1.1.1.5:3306', {'force': 'true'})",
+            ))
+        )
+
+        # a unit held back by the quorum guard retries once the lock is released
+        status["defaultReplicaSet"]["topology"]["mysql-2"]["status"] = "(MISSING)"
+        status["defaultReplicaSet"]["topology"]["mysql-3"]["status"] = "UNREACHABLE"
+        self.mock_executor.execute_py.side_effect = [json.dumps(status), json.dumps(status)]
+        _release_lock.reset_mock()
+        with self.assertRaises(MySQLLockAcquisitionError):
+            self.mysql._remove_departing_instances.retry_with(stop=tenacity.stop_after_attempt(1))(
+                self.mysql, "mysql-1", ["mysql-1", "mysql-4"], None
+            )
+        _release_lock.assert_called_once()
+
+        # nothing left to do for the other departing units
+        _is_instance_in_cluster.return_value = False
+        _acquire_lock.reset_mock()
+        self.mysql.remove_instances("mysql-3", ["mysql-0", "mysql-3", "mysql-4"])
+        _acquire_lock.assert_not_called()
+
+    @patch("charms.mysql.v0.mysql.MySQLBase.is_instance_in_cluster", return_value=True)
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_cluster_topology")
+    @patch("charms.mysql.v0.mysql.MySQLBase.remove_instance")
+    def test_remove_instances_last_members(
+        self, _remove_instance, _get_cluster_topology, _is_instance_in_cluster
+    ):
+        """Test units removing the last members fall back to remove_instance, once."""
+        _get_cluster_topology.return_value = {"mysql-0": {}, "mysql-1": {}}
+        _remove_instance.side_effect = MySQLLockAcquisitionError
+
+        with self.assertRaises(MySQLLockAcquisitionError):
+            self.mysql.remove_instances("mysql-0", ["mysql-0", "mysql-1"])
+
+        _remove_instance.assert_called_once_with("mysql-0", lock_instance=None)
+
     def test_is_instance_configured_for_innodb(self):
         """Test with no exceptions while calling the is_instance_configured_for_innodb method."""
         self.mock_executor.execute_py.return_value = '{"status": "ok"}'
@@ -583,15 +774,17 @@ class TestMySQLBase(unittest.TestCase):
         self.mysql.remove_instance("mysql-0")
 
         _acquire_lock.assert_called_once_with(
-            executor=self.mock_executor,
+            executor=ANY,
             unit_label="mysql-0",
             unit_task="unit-teardown",
         )
+        self.assertIs(_acquire_lock.call_args.kwargs["executor"]._executor, self.mock_executor)
         _release_lock.assert_called_once_with(
-            executor=self.mock_executor,
+            executor=ANY,
             unit_label="mysql-0",
             unit_task="unit-teardown",
         )
+        self.assertIs(_release_lock.call_args.kwargs["executor"]._executor, self.mock_executor)
 
         self.mock_executor.execute_py.assert_called_once_with("\n".join(commands))
 
@@ -617,10 +810,11 @@ class TestMySQLBase(unittest.TestCase):
             self.mysql.remove_instance("mysql-0")
 
         _acquire_lock.assert_called_once_with(
-            executor=self.mock_executor,
+            executor=ANY,
             unit_label="mysql-0",
             unit_task="unit-teardown",
         )
+        self.assertIs(_acquire_lock.call_args.kwargs["executor"]._executor, self.mock_executor)
         _release_lock.assert_not_called()
 
     @patch("charms.mysql.v0.mysql.MySQLBase.get_cluster_primary_address")
@@ -653,56 +847,411 @@ class TestMySQLBase(unittest.TestCase):
             self.mysql.remove_instance("mysql-0")
 
         _acquire_lock.assert_called_once_with(
-            executor=self.mock_executor,
+            executor=ANY,
             unit_label="mysql-0",
             unit_task="unit-teardown",
         )
+        self.assertIs(_acquire_lock.call_args.kwargs["executor"]._executor, self.mock_executor)
         _release_lock.assert_called_once_with(
-            executor=self.mock_executor,
+            executor=ANY,
             unit_label="mysql-0",
             unit_task="unit-teardown",
         )
+        self.assertIs(_release_lock.call_args.kwargs["executor"]._executor, self.mock_executor)
 
         self.mock_executor.execute_py.assert_called_once_with("\n".join(commands))
 
     def test_acquire_lock(self):
         """Test a successful execution of _acquire_lock()."""
-        query = (
+        queries = [
+            f"DELETE FROM {QUEUE_TABLE} "
+            "WHERE updated_at < CURRENT_TIMESTAMP - INTERVAL 1800 SECOND "
+            f"OR executor IN ({EXPIRED_LEASES_QUERY.format(column='executor')})",
+            f"INSERT INTO {QUEUE_TABLE} (task, executor) VALUES ('unit-teardown', 'mysql-0') "
+            "ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP",
+            f"SELECT COUNT(*) INTO @juju_queue_position FROM {QUEUE_TABLE} "
+            "WHERE task = 'unit-teardown' "
+            "AND updated_at >= CURRENT_TIMESTAMP - INTERVAL 900 SECOND AND ticket < "
+            f"(SELECT ticket FROM {QUEUE_TABLE} "
+            "WHERE task = 'unit-teardown' AND executor = 'mysql-0')",
+            "INSERT IGNORE INTO `mysql`.`juju_units_operations` (task, executor, status) "
+            "VALUES ('unit-teardown', '', 'not-started')",
+            "START TRANSACTION",
+            "SELECT COUNT(*) INTO @juju_held_slots FROM `mysql`.`juju_units_operations` "
+            "WHERE task IN ('unit-teardown') AND executor = 'mysql-0'",
             "UPDATE `mysql`.`juju_units_operations` "
             "SET status = 'in-progress', executor = 'mysql-0' "
-            "WHERE task = 'unit-teardown' AND executor = ''"
-        )
+            "WHERE task IN ('unit-teardown') "
+            f"AND (executor = '' OR task IN ({EXPIRED_LEASES_QUERY.format(column='task')}) "
+            f"OR task NOT IN (SELECT task FROM {LEASE_TABLE})) "
+            "AND @juju_held_slots = 0 AND @juju_queue_position < 1 "
+            "ORDER BY task LIMIT 1",
+            f"INSERT INTO {LEASE_TABLE} (task, executor) "
+            "SELECT slots.task, slots.executor FROM `mysql`.`juju_units_operations` AS slots "
+            "WHERE task IN ('unit-teardown') AND slots.executor = 'mysql-0' "
+            "ON DUPLICATE KEY UPDATE "
+            f"    acquired_at = IF({LEASE_TABLE}.executor = slots.executor, "
+            f"{LEASE_TABLE}.acquired_at, CURRENT_TIMESTAMP), "
+            f"    {LEASE_TABLE}.executor = slots.executor, "
+            "    renewed_at = CURRENT_TIMESTAMP",
+            "COMMIT",
+            "SELECT task, executor FROM `mysql`.`juju_units_operations` "
+            "WHERE task IN ('unit-teardown') AND status = 'in-progress'",
+        ]
 
-        self.mock_executor.execute_sql.return_value = [{"executor": "mysql-0"}]
+        self.mock_executor.execute_sql_batch.return_value = [
+            *([] for _ in range(9)),
+            [{"task": "unit-teardown", "executor": "mysql-0"}],
+        ]
 
         acquired_lock = self.mysql._acquire_lock(self.mock_executor, "mysql-0", "unit-teardown")
-        self.mock_executor.execute_sql.assert_has_calls([call(query)])
+        self.mock_executor.execute_sql_batch.assert_called_once_with(queries)
         self.assertTrue(acquired_lock)
 
-    def test_issue_with_acquire_lock(self):
-        """Test an issue while executing _acquire_lock()."""
-        query = (
-            "UPDATE `mysql`.`juju_units_operations` "
-            "SET status = 'in-progress', executor = 'mysql-0' "
-            "WHERE task = 'unit-teardown' AND executor = ''"
+    def test_acquire_lock_creates_missing_tables(self):
+        """Test the queue and lease tables are created when first missing."""
+        self.mock_executor.execute_sql_batch.side_effect = [
+            ExecutionError("Table 'mysql.juju_units_operations_queue' doesn't exist"),
+            [*([] for _ in range(11)), [{"task": "unit-teardown", "executor": "mysql-0"}]],
+        ]
+
+        self.assertTrue(self.mysql._acquire_lock(self.mock_executor, "mysql-0", "unit-teardown"))
+        first_queries, queries = (
+            call.args[0] for call in self.mock_executor.execute_sql_batch.call_args_list
         )
+        self.assertEqual(queries, [*SUPPORT_TABLES_QUERIES, *first_queries])
 
-        self.mock_executor.execute_sql.side_effect = ExecutionError
+        # other failures are not retried
+        self.mock_executor.execute_sql_batch.reset_mock()
+        self.mock_executor.execute_sql_batch.side_effect = ExecutionError
+        self.assertFalse(self.mysql._acquire_lock(self.mock_executor, "mysql-0", "unit-teardown"))
+        self.mock_executor.execute_sql_batch.assert_called_once()
+
+    def test_issue_with_acquire_lock(self):
+        """Test an issue while executing _acquire_lock()."""
+        self.mock_executor.execute_sql_batch.side_effect = ExecutionError
 
         acquired_lock = self.mysql._acquire_lock(self.mock_executor, "mysql-0", "unit-teardown")
-        self.mock_executor.execute_sql.assert_called_once_with(query)
+        self.mock_executor.execute_sql_batch.assert_called_once()
         self.assertFalse(acquired_lock)
 
     def test_release_lock(self):
-        """Test a successful execution of _acquire_lock()."""
-        query = (
+        """Test a successful execution of _release_lock()."""
+        queries = [
             "UPDATE `mysql`.`juju_units_operations` "
             "SET status = 'not-started', executor = '' "
-            "WHERE task = 'unit-teardown' AND executor = 'mysql-0'"
-        )
+            "WHERE task IN ('unit-teardown') AND executor = 'mysql-0'",
+            f"DELETE FROM {LEASE_TABLE} WHERE task IN ('unit-teardown') AND executor = 'mysql-0'",
+            f"DELETE FROM {QUEUE_TABLE} WHERE task = 'unit-teardown' AND executor = 'mysql-0'",
+        ]
 
         self.mysql._release_lock(self.mock_executor, "mysql-0", "unit-teardown")
-        self.mock_executor.execute_sql.assert_called_once_with(query)
+        self.mock_executor.execute_sql_batch.assert_called_once_with(queries)
+
+    def test_acquire_join_slot(self):
+        """Test acquiring one of several instance addition slots."""
+        condition = "task IN ('unit-add', 'unit-add-2', 'unit-add-3')"
+        acquire_query = (
+            "UPDATE `mysql`.`juju_units_operations` "
+            "SET status = 'in-progress', executor = 'mysql-2' "
+            f"WHERE {condition} "
+            f"AND (executor = '' OR task IN ({EXPIRED_LEASES_QUERY.format(column='task')}) "
+            f"OR task NOT IN (SELECT task FROM {LEASE_TABLE})) "
+            "AND @juju_held_slots = 0 AND @juju_queue_position < 3 "
+            "ORDER BY task LIMIT 1"
+        )
+
+        self.mock_executor.execute_sql_batch.return_value = [
+            *([] for _ in range(9)),
+            [
+                {"task": "unit-add", "executor": "mysql-1"},
+                {"task": "unit-add-2", "executor": "mysql-2"},
+            ],
+        ]
+        self.assertEqual(self.mysql._acquire_join_slot(self.mock_executor, "mysql-2", 3), 1)
+        queries = self.mock_executor.execute_sql_batch.call_args.args[0]
+        self.assertEqual(queries[6], acquire_query)
+        self.assertIn("('unit-add-3', '', 'not-started')", queries[3])
+
+        self.mock_executor.execute_sql_batch.return_value[9] = [
+            {"task": "unit-add", "executor": "mysql-1"}
+        ]
+        self.assertIsNone(self.mysql._acquire_join_slot(self.mock_executor, "mysql-2", 3))
+
+        self.mysql._release_join_slot(self.mock_executor, "mysql-2", 3)
+        self.assertEqual(
+            self.mock_executor.execute_sql_batch.call_args.args[0][0],
+            "UPDATE `mysql`.`juju_units_operations` SET status = 'not-started', executor = '' "
+            f"WHERE {condition} AND executor = 'mysql-2'",
+        )
+
+    @patch("charms.mysql.v0.mysql.LOCK_LEASE_RENEWAL_INTERVAL", 0.01)
+    def test_renewing_lease(self):
+        """Test leases are renewed in the background while in context."""
+        renewed = threading.Event()
+        self.mock_executor.execute_sql_batch.side_effect = lambda _: renewed.set() or [[], []]
+
+        with self.mysql._renewing_lease("1.1.1.1", "mysql-3", "unit-add", 2):
+            self.assertTrue(renewed.wait(5))
+
+        self.mock_executor.execute_sql_batch.assert_called_with([
+            f"UPDATE {LEASE_TABLE} SET renewed_at = CURRENT_TIMESTAMP "
+            "WHERE task IN ('unit-add', 'unit-add-2') AND executor = 'mysql-3'",
+            f"UPDATE {QUEUE_TABLE} SET updated_at = CURRENT_TIMESTAMP "
+            "WHERE task = 'unit-add' AND executor = 'mysql-3'",
+        ])
+
+        # no renewal once out of context
+        calls = self.mock_executor.execute_sql_batch.call_count
+        time.sleep(0.05)
+        self.assertEqual(self.mock_executor.execute_sql_batch.call_count, calls)
+
+    def test_get_lock_holders(self):
+        """Test fetching the lock holders with their lease."""
+        holders = [{"task": "unit-add", "executor": "mysql-3", "lease_age": 30}]
+        self.mock_executor.execute_sql.return_value = holders
+
+        self.assertEqual(self.mysql.get_lock_holders(), holders)
+        query = self.mock_executor.execute_sql.call_args.args[0]
+        self.assertIn(f"LEFT JOIN {LEASE_TABLE} AS leases", query)
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError(
+            "Table 'mysql.juju_units_operations_leases' doesn't exist"
+        )
+        self.assertEqual(self.mysql.get_lock_holders(), [])
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        with self.assertRaises(MySQLGetLockHoldersError):
+            self.mysql.get_lock_holders()
+
+    def test_get_lock_queue_position(self):
+        """Test taking a ticket in the lock queue."""
+        self.mock_executor.execute_sql_batch.return_value = [
+            *([] for _ in range(3)),
+            [{"position": 2}],
+        ]
+
+        position = self.mysql.get_lock_queue_position("1.1.1.1", "unit-add", "mysql-3")
+
+        self.assertEqual(position, 2)
+        queries = self.mock_executor.execute_sql_batch.call_args.args[0]
+        self.assertTrue(queries[1].startswith(f"INSERT INTO {QUEUE_TABLE}"))
+        self.assertEqual(queries[3], "SELECT @juju_queue_position AS position")
+
+        self.mock_executor.execute_sql_batch.side_effect = ExecutionError
+        self.assertIsNone(self.mysql.get_lock_queue_position("1.1.1.1", "unit-add", "mysql-3"))
+
+    @patch("charms.mysql.v0.mysql.MySQLBase._tuned_clone")
+    @patch("charms.mysql.v0.mysql.MySQLBase._release_join_slot")
+    @patch("charms.mysql.v0.mysql.MySQLBase._acquire_join_slot", return_value=1)
+    def test_add_instance_to_cluster_clone_donor(
+        self, _acquire_join_slot, _release_join_slot, _tuned_clone
+    ):
+        """Test clone-based instance additions use the donor of their slot rank."""
+        on_clone_donor = MagicMock()
+        self.mock_executor.execute_sql.return_value = [
+            {"member_host": "1.1.1.3", "member_port": 3306},
+            {"member_host": "1.1.1.2", "member_port": 3306},
+        ]
+
+        self.mysql.add_instance_to_cluster(
+            instance_address="127.0.0.2",
+            instance_unit_label="mysql-4",
+            method="clone",
+            join_slots=3,
+            on_clone_donor=on_clone_donor,
+        )
+
+        query = self.mock_executor.execute_sql.call_args.args[0]
+        self.assertIn("performance_schema.replication_group_member_stats", query)
+        self.assertIn("members.member_role = 'SECONDARY'", query)
+        self.assertIn(
+            "'cloneDonor': '1.1.1.2:3306'", self.mock_executor.execute_py.call_args.args[0]
+        )
+        on_clone_donor.assert_called_once_with("1.1.1.2:3306")
+        _tuned_clone.assert_called_once_with("1.1.1.2:3306", "127.0.0.2", "mysql-4", {})
+        _release_join_slot.assert_called_once_with(ANY, "mysql-4", 3)
+
+        # without secondaries the donor is left to MySQL Shell
+        self.mock_executor.execute_sql.return_value = []
+        self.mysql.add_instance_to_cluster(
+            instance_address="127.0.0.2", instance_unit_label="mysql-4", method="clone"
+        )
+        self.assertNotIn("cloneDonor", self.mock_executor.execute_py.call_args.args[0])
+
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_cluster_topology")
+    def test_tuned_clone(self, _get_cluster_topology):
+        """Test joins clone with the lowest limits of the donor and the recipient."""
+        _get_cluster_topology.return_value = {"mysql-1": {"address": "1.1.1.2:3306"}}
+        donor_values = {
+            "clone_max_concurrency": 8,
+            "clone_buffer_size": 8388608,
+            "clone_max_data_bandwidth": 0,
+            "clone_max_network_bandwidth": 89,
+            "clone_enable_compression": 1,
+        }
+        recipient_values = {
+            "clone_max_concurrency": 2,
+            "clone_buffer_size": 4194304,
+            "clone_max_data_bandwidth": 100,
+            "clone_max_network_bandwidth": 0,
+            "clone_enable_compression": 0,
+        }
+        self.mock_executor.execute_sql.side_effect = [[donor_values], [recipient_values]] + [
+            []
+        ] * 4
+
+        with self.mysql._tuned_clone("1.1.1.2:3306", "127.0.0.2", "mysql-4", {}):
+            tuning = (
+                "SET GLOBAL clone_max_concurrency = 2, clone_buffer_size = 4194304, "
+                "clone_max_data_bandwidth = 100, clone_max_network_bandwidth = 89, "
+                "clone_enable_compression = 0"
+            )
+            self.assertEqual(self.mock_executor.execute_sql.call_args_list[2:], [call(tuning)] * 2)
+
+        # previous values are restored on each instance
+        restored = [args.args[0] for args in self.mock_executor.execute_sql.call_args_list[4:]]
+        self.assertIn("clone_max_concurrency = 8", restored[0])
+        self.assertIn("clone_max_concurrency = 2", restored[1])
+
+        # rendered variables are restored, the donor being possibly tuned by another join
+        rendered = {
+            "mysql-1": {**donor_values, "clone_enable_compression": "ON"},
+            "mysql-4": dict.fromkeys(donor_values, "DEFAULT"),
+        }
+        self.mock_executor.execute_sql.reset_mock()
+        self.mock_executor.execute_sql.side_effect = None
+        with self.mysql._tuned_clone("1.1.1.2:3306", "127.0.0.2", "mysql-4", rendered):
+            pass
+        queries = [args.args[0] for args in self.mock_executor.execute_sql.call_args_list]
+        self.assertEqual(len(queries), 4)
+        self.assertIn("clone_max_concurrency = 8,", queries[0])
+        self.assertIn("clone_enable_compression = DEFAULT", queries[0])
+        self.assertIn("clone_max_concurrency = 8,", queries[2])
+        self.assertIn("clone_enable_compression = ON", queries[2])
+        self.assertIn("clone_max_concurrency = DEFAULT", queries[3])
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        with self.mysql._tuned_clone("1.1.1.2:3306", "127.0.0.2", "mysql-4", {}):
+            pass
+
+    def test_get_thread_parameters(self):
+        """Test thread parameters for typical machine shapes."""
+        shapes = {
+            # cpus: read/write I/O, parallel read, purge, applier, table cache instances
+            1: (4, 4, 1, 4, 1),
+            2: (4, 4, 1, 4, 2),
+            4: (4, 4, 1, 4, 4),
+            8: (4, 4, 2, 8, 8),
+            16: (8, 8, 4, 16, 16),
+            32: (16, 16, 8, 32, 16),
+            64: (32, 32, 16, 64, 16),
+            256: (64, 128, 32, 64, 16),
+        }
+
+        for cpus, (io, parallel_read, purge, applier, table_cache) in shapes.items():
+            with self.subTest(cpus=cpus):
+                self.assertEqual(
+                    self.mysql.get_thread_parameters(cpus),
+                    {
+                        "innodb_read_io_threads": io,
+                        "innodb_write_io_threads": io,
+                        "innodb_parallel_read_threads": parallel_read,
+                        "innodb_purge_threads": purge,
+                        "replica_parallel_workers": applier,
+                        "loose-binlog_transaction_dependency_tracking": "WRITESET",
+                        "table_open_cache_instances": table_cache,
+                    },
+                )
+
+    def test_get_redo_log_capacity(self):
+        """Test the redo log is sized from the buffer pool, write rate and checkpoint age."""
+        self.assertEqual(self.mysql.get_redo_log_capacity(128 * BYTES_1MiB), 100 * BYTES_1MiB)
+        self.assertEqual(self.mysql.get_redo_log_capacity(8 * BYTES_1GiB), 2 * BYTES_1GiB)
+        # 30 minutes of writes
+        self.assertEqual(
+            self.mysql.get_redo_log_capacity(8 * BYTES_1GiB, 4 * BYTES_1MiB), 7200 * BYTES_1MiB
+        )
+        self.assertEqual(
+            self.mysql.get_redo_log_capacity(8 * BYTES_1GiB, 0, 3 * BYTES_1GiB), 6 * BYTES_1GiB
+        )
+        self.assertEqual(
+            self.mysql.get_redo_log_capacity(8 * BYTES_1GiB, 100 * BYTES_1MiB), 32 * BYTES_1GiB
+        )
+
+    def test_get_redo_log_status(self):
+        """Test the redo log status is read, None on MySQL versions without it."""
+        self.mock_executor.execute_sql.return_value = [
+            {
+                "capacity": 104857600,
+                "buffer_pool_size": 134217728,
+                "current_lsn": "52428800",
+                "checkpoint_lsn": "20971520",
+                "resize_status": "OK",
+            }
+        ]
+        status = self.mysql.get_redo_log_status()
+        self.assertEqual(status, RedoLogStatus(104857600, 134217728, 52428800, 20971520, "OK"))
+        self.assertEqual(status.checkpoint_age, 31457280)
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        self.assertIsNone(self.mysql.get_redo_log_status())
+
+    def test_get_io_parameters(self):
+        """Test flushing parameters for typical volumes."""
+        volumes = {
+            # iops, fsync latency, throughput: io capacity, max, flush neighbors, log writers
+            "hdd": (StorageProbe(150, 0.008, 150 * BYTES_1MB), (200, 400, 1, "OFF")),
+            "cloud": (StorageProbe(3000, 0.002, 125 * BYTES_1MB), (1500, 3000, 0, "OFF")),
+            "ssd": (StorageProbe(20000, 0.0005, 500 * BYTES_1MB), (10000, 20000, 0, "ON")),
+            "nvme": (StorageProbe(200000, 0.00005, 3000 * BYTES_1MB), (20000, 40000, 0, "ON")),
+        }
+
+        for volume, (storage_probe, expected) in volumes.items():
+            with self.subTest(volume=volume):
+                self.assertEqual(
+                    tuple(self.mysql.get_io_parameters(storage_probe, 8).values()), expected
+                )
+
+        # log writer threads are left out on small instances
+        self.assertEqual(
+            self.mysql.get_io_parameters(volumes["nvme"][0], 2)["innodb_log_writer_threads"],
+            "OFF",
+        )
+
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_link_speed", return_value=1000)
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_available_cpus", return_value=32)
+    def test_get_clone_parameters(self, _get_available_cpus, _get_link_speed):
+        """Test clone parameters follow the instance resources, unless overridden."""
+        self.assertEqual(
+            self.mysql.get_clone_parameters(8 * 1024**3),
+            {
+                "clone_max_concurrency": 16,
+                "clone_buffer_size": 8388608,
+                "clone_max_data_bandwidth": 0,
+                "clone_max_network_bandwidth": 89,
+                "clone_enable_compression": "ON",
+            },
+        )
+        self.assertEqual(
+            self.mysql.get_clone_parameters(
+                128 * 1024**3, max_concurrency=4, max_bandwidth=50, compression="off"
+            ),
+            {
+                "clone_max_concurrency": 4,
+                "clone_buffer_size": 67108864,
+                "clone_max_data_bandwidth": 50,
+                "clone_max_network_bandwidth": 50,
+                "clone_enable_compression": "OFF",
+            },
+        )
+
+        # unknown links are neither limited nor compressed
+        _get_link_speed.return_value = None
+        parameters = self.mysql.get_clone_parameters(1024**3)
+        self.assertEqual(parameters["clone_max_network_bandwidth"], 0)
+        self.assertEqual(parameters["clone_enable_compression"], "OFF")
+        self.assertEqual(parameters["clone_buffer_size"], 1048576)
 
     def test_get_cluster_primary_address(self):
         """Test a successful execution of _get_cluster_primary_address()."""
@@ -713,6 +1262,7 @@ class TestMySQLBase(unittest.TestCase):
         primary_address = self.mysql.get_cluster_primary_address()
         self.assertEqual(primary_address, "1.1.1.1")
 
+        self.mysql._cluster_status_snapshot.invalidate()
         self.mock_executor.execute_py.return_value = (
             '{"defaultReplicaSet": {"status": "NO_QUORUM", "primary": "1.1.1.1:3306"}}'
         )
@@ -728,6 +1278,7 @@ class TestMySQLBase(unittest.TestCase):
         )
         self.assertTrue(self.mysql.is_instance_in_cluster("mysql-0"))
 
+        self.mysql._cluster_status_snapshot.invalidate()
         self.mock_executor.execute_py.return_value = (
             '{"defaultReplicaSet": {"topology": {"mysql-0": {"status": "NOT_A_MEMBER"}}}}'
         )
@@ -755,6 +1306,134 @@ class TestMySQLBase(unittest.TestCase):
             timeout=30,
         )
 
+    def test_executor_calls_instrumentation(self):
+        """Test executor calls are recorded per operation."""
+        EXECUTOR_CALLS.reset()
+        self.mock_executor.connection_details = ConnectionDetails(
+            username="clusteradmin", password="password", host="127.0.0.1", port="3306"
+        )
+        self.mock_executor.execute_py.return_value = (
+            '{"defaultReplicaSet": {"status": "OK", "primary": "1.1.1.1:3306"}}'
+        )
+
+        self.mysql.get_cluster_primary_address()
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        with self.assertRaises(MySQLUnableToGetMemberStateError):
+            self.mysql.get_member_state.retry_with(wait=tenacity.wait_none())(self.mysql)
+
+        summary = EXECUTOR_CALLS.summary()
+        self.assertEqual(summary["calls"], 4)
+        self.assertEqual(summary["errors"], 3)
+        self.assertEqual(summary["retries"], 2)
+
+        operation = summary["operations"]["get_cluster_primary_address"]
+        self.assertEqual(operation["calls"], 1)
+        self.assertEqual(operation["hosts"], ["127.0.0.1:3306"])
+        self.assertEqual(sum(operation["histogram"].values()), 1)
+
+        operation = summary["operations"]["get_member_state"]
+        self.assertEqual((operation["calls"], operation["errors"]), (3, 3))
+
+    def test_host_circuit_breaker(self):
+        """Test calls to a host that could not be connected to fail fast."""
+        HOST_CIRCUIT_BREAKER.reset()
+        EXECUTOR_CALLS.reset()
+        self.mock_executor.connection_details = ConnectionDetails(
+            username="serverconfig", password="password", host="10.1.1.1", port="33062"
+        )
+        self.mock_executor.execute_py.return_value = (
+            '{"defaultReplicaSet": {"status": "OK", "primary": "10.1.1.1:3306"}}'
+        )
+        connect_error = "MySQL Error 2003 (HY000): Can't connect to MySQL server on '10.1.1.1'"
+
+        def execute_sql(script, **_):
+            if script.startswith("CREATE DATABASE"):
+                raise ExecutionError(connect_error)
+            return []
+
+        self.mock_executor.execute_sql.side_effect = execute_sql
+
+        with self.assertRaises(MySQLCreateApplicationDatabaseError) as e:
+            self.mysql.create_database("test_database")
+
+        # the second attempt failed without calling the host, and stopped the retries
+        self.assertIsInstance(e.exception.__cause__, MySQLUnreachableHostError)
+        create_calls = [
+            c for c in self.mock_executor.execute_sql.call_args_list if "CREATE" in c.args[0]
+        ]
+        self.assertEqual(len(create_calls), 1)
+        self.assertEqual(EXECUTOR_CALLS.summary()["retries"], 1)
+        self.assertEqual(HOST_CIRCUIT_BREAKER.tripped_hosts, {"10.1.1.1": connect_error})
+
+        # the local instance is never tripped
+        self.assertEqual(self.mysql.get_non_system_databases(), set())
+
+        HOST_CIRCUIT_BREAKER.reset()
+
+    def test_get_cluster_status_snapshot(self):
+        """Test cluster status reads reuse the snapshot until a topology change."""
+        self.mock_executor.execute_py.return_value = (
+            '{"defaultReplicaSet": {"status": "OK", "primary": "1.1.1.1:3306", '
+            '"topology": {"mysql-0": {"memberRole": "PRIMARY", "status": "ONLINE"}}}}'
+        )
+
+        self.assertEqual(self.mysql.get_primary_label(), "mysql-0")
+        self.assertEqual(self.mysql.get_cluster_primary_address(), "1.1.1.1")
+        self.assertEqual(self.mysql.get_cluster_topology()["mysql-0"]["status"], "ONLINE")
+        self.mock_executor.execute_py.assert_called_once()
+
+        # snapshots are keyed by source instance and extended flag
+        self.mysql.get_cluster_status(from_instance="2.2.2.2")
+        self.mysql.get_cluster_status(extended=True)
+        self.assertEqual(self.mock_executor.execute_py.call_count, 3)
+
+        # returned statuses are copies
+        self.mysql.get_cluster_status()["defaultReplicaSet"]["status"] = "NO_QUORUM"
+        self.assertEqual(self.mysql.get_cluster_primary_address(), "1.1.1.1")
+        self.assertEqual(self.mock_executor.execute_py.call_count, 3)
+
+        self.mysql.set_cluster_primary("1.1.1.1")
+        self.mysql.get_cluster_status()
+        self.assertEqual(self.mock_executor.execute_py.call_count, 5)
+
+    def test_cluster_status_snapshot_invalidated_by_topology_changes(self):
+        """Test every operation changing the topology discards the cluster status snapshot."""
+        operations = (
+            lambda: self.mysql.create_cluster("mysql-0"),
+            self.mysql.create_cluster_set,
+            lambda: self.mysql.create_replica_cluster("1.1.1.1", "replica", "mysql-0"),
+            lambda: self.mysql.promote_cluster_to_primary("replica"),
+            lambda: self.mysql.rejoin_cluster("replica"),
+            lambda: self.mysql.remove_replica_cluster("replica"),
+            self.mysql.stop_group_replication,
+            self.mysql.start_group_replication,
+            self.mysql.force_quorum_from_instance,
+            self.mysql.reboot_from_complete_outage,
+            lambda: self.mysql.set_instance_offline_mode(True),
+            lambda: self.mysql.set_instance_option("label", "mysql-0"),
+            self.mysql.rescan_cluster,
+        )
+
+        for operation in operations:
+            with patch.object(self.mysql._cluster_status_snapshot, "invalidate") as invalidate:
+                operation()
+                invalidate.assert_called()
+
+    @patch("time.monotonic")
+    def test_get_cluster_status_snapshot_expiry(self, _monotonic):
+        """Test cluster status snapshots expire."""
+        self.mock_executor.execute_py.return_value = '{"status": "ONLINE"}'
+
+        _monotonic.return_value = 100
+        self.mysql.get_cluster_status()
+        _monotonic.return_value = 104
+        self.mysql.get_cluster_status()
+        self.mock_executor.execute_py.assert_called_once()
+
+        _monotonic.return_value = 106
+        self.mysql.get_cluster_status()
+        self.assertEqual(self.mock_executor.execute_py.call_count, 2)
+
     @patch("json.loads")
     def test_get_cluster_status_failure(self, _json_loads):
         """Test an exception executing get_cluster_status() method."""
@@ -823,6 +1502,46 @@ class TestMySQLBase(unittest.TestCase):
         with self.assertRaises(MySQLUnableToGetMemberStateError):
             self.mysql.get_member_state()
 
+    def test_get_member_health(self):
+        """Test execution of get_member_health()."""
+        self.mock_executor.execute_sql.return_value = [
+            {
+                "is_self": 1,
+                "member_host": "1.1.1.2",
+                "member_role": "SECONDARY",
+                "member_state": "ONLINE",
+            },
+            {
+                "is_self": 0,
+                "member_host": "1.1.1.1",
+                "member_role": "PRIMARY",
+                "member_state": "ONLINE",
+            },
+            {
+                "is_self": 0,
+                "member_host": "1.1.1.3",
+                "member_role": "",
+                "member_state": "UNREACHABLE",
+            },
+        ]
+        health = self.mysql.get_member_health()
+
+        self.assertEqual(health, ("SECONDARY", "ONLINE", "1.1.1.1", 3, 2))
+        self.assertIn(
+            "FROM performance_schema.replication_group_members",
+            self.mock_executor.execute_sql.call_args.args[0],
+        )
+
+        self.mock_executor.execute_sql.return_value = [
+            {"is_self": 1, "member_host": "1.1.1.2", "member_role": "", "member_state": "OFFLINE"},
+        ]
+        health = self.mysql.get_member_health()
+        self.assertEqual(health, ("UNKNOWN", "OFFLINE", None, 1, 0))
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        with self.assertRaises(MySQLUnableToGetMemberStateError):
+            self.mysql.get_member_health.retry_with(wait=tenacity.wait_none())(self.mysql)
+
     def test_rescan_cluster_failure(self):
         """Test an exception executing rescan_cluster()."""
         self.mock_executor.execute_py.side_effect = ExecutionError
@@ -909,6 +1628,20 @@ class TestMySQLBase(unittest.TestCase):
         self.mysql.update_user_password("test_user", "test_password")
         self.mock_executor.execute_sql.assert_called_once_with(query)
 
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_cluster_global_primary_address")
+    def test_update_user_max_connections(self, _get_cluster_global_primary_address):
+        """Test the successful execution of update_user_max_connections."""
+        _get_cluster_global_primary_address.return_value = "1.1.1.1"
+
+        query = "ALTER USER 'monitoring'@'%' WITH MAX_USER_CONNECTIONS 4"
+
+        self.mysql.update_user_max_connections("monitoring", 4)
+        self.mock_executor.execute_sql.assert_called_once_with(query)
+
+        self.mock_executor.execute_sql.side_effect = ExecutionError
+        with self.assertRaises(MySQLUpdateUserMaxConnectionsError):
+            self.mysql.update_user_max_connections("monitoring", 4)
+
     def test_cluster_metadata_exists(self):
         """Test cluster_metadata_exists method."""
         query = "SELECT cluster_name FROM mysql_innodb_cluster_metadata.clusters"
@@ -976,7 +1709,7 @@ class TestMySQLBase(unittest.TestCase):
             available_memory
         )
         self.assertEqual(11408506880, pool_size)
-        self.assertEqual(1426063360, chunk_size)
+        self.assertEqual(16777216, chunk_size)
         self.assertEqual(None, gr_message_cache)
 
         available_memory = 3221000000
@@ -984,7 +1717,7 @@ class TestMySQLBase(unittest.TestCase):
             available_memory
         )
         self.assertEqual(1342177280, pool_size)
-        self.assertEqual(167772160, chunk_size)
+        self.assertEqual(16777216, chunk_size)
         self.assertEqual(None, gr_message_cache)
 
         available_memory = 1073741825
@@ -995,6 +1728,14 @@ class TestMySQLBase(unittest.TestCase):
         self.assertIsNone(chunk_size)
         self.assertEqual(134217728, gr_message_cache)
 
+        # chunks double past 1000 of them, the pool being a multiple of 8 chunks
+        available_memory = 68719476736
+        pool_size, chunk_size, gr_message_cache = self.mysql.get_innodb_buffer_pool_parameters(
+            available_memory
+        )
+        self.assertEqual(50465865728, pool_size)
+        self.assertEqual(67108864, chunk_size)
+
     def test_get_innodb_buffer_pool_parameters_exception(self):
         """Test a failure in execution of get_innodb_buffer_pool_parameters()."""
         with self.assertRaises(MySQLGetAutoTuningParametersError):
@@ -1315,6 +2056,7 @@ class TestMySQLBase(unittest.TestCase):
 
         _execute_commands.side_effect = [
             MySQLExecError("failure"),
+            MySQLExecError("failure"),
         ]
 
         with self.assertRaises(MySQLRetrieveBackupWithXBCloudError):
@@ -1542,7 +2284,7 @@ class TestMySQLBase(unittest.TestCase):
         ]
 
         self.mysql.tls_setup("ca_path", "key_path", "cert_path", True)
-        self.mock_executor.execute_sql.assert_has_calls([call(query) for query in queries])
+        self.mock_executor.execute_sql_batch.assert_called_once_with(queries)
 
     def test_tls_restore_default(self):
         """Test the successful execution of tls_set_custom."""
@@ -1555,7 +2297,7 @@ class TestMySQLBase(unittest.TestCase):
         ]
 
         self.mysql.tls_setup()
-        self.mock_executor.execute_sql.assert_has_calls([call(query) for query in queries])
+        self.mock_executor.execute_sql_batch.assert_called_once_with(queries)
 
     def test_kill_client_sessions(self):
         """Test kill_client_sessions."""
@@ -1588,6 +2330,10 @@ class TestMySQLBase(unittest.TestCase):
         assert self.mysql.are_locks_acquired("0.0.0.0", UNIT_ADD_LOCKNAME) is False
         self.mock_executor.execute_sql.assert_called_with(query)
 
+        self.mock_executor.execute_sql.return_value = [{"task": "unit-add", "executor": "mysql-1"}]
+        assert self.mysql.are_locks_acquired("0.0.0.0", UNIT_ADD_LOCKNAME) is True
+        assert self.mysql.are_locks_acquired("0.0.0.0", UNIT_ADD_LOCKNAME, 2) is False
+
     def test_get_mysql_user_for_unit(self):
         """Test get_mysql_user_for_unit."""
         query = (
@@ -1656,6 +2402,41 @@ class TestMySQLBase(unittest.TestCase):
         with self.assertRaises(MySQLSetVariableError):
             self.mysql.set_dynamic_variable(variable="variable", value="value")
 
+    @patch("time.sleep")
+    def test_resize_buffer_pool(self, _sleep):
+        """Test the buffer pool resize is followed until completed."""
+
+        def resize_status(message, code):
+            return [
+                {"name": "innodb_buffer_pool_resize_status", "value": message},
+                {"name": "innodb_buffer_pool_resize_status_code", "value": code},
+                {"name": "innodb_buffer_pool_resize_status_progress", "value": "50"},
+            ]
+
+        self.mock_executor.execute_sql.side_effect = [
+            None,
+            resize_status("Requested to resize buffer pool.", "0"),
+            resize_status("Resizing also other hash tables.", "5"),
+            resize_status("Completed resizing buffer pool at 251016 10:00:00.", "0"),
+        ]
+        self.mysql.resize_buffer_pool(2147483648)
+        self.mock_executor.execute_sql.assert_any_call(
+            "SET @@GLOBAL.`innodb_buffer_pool_size` = 2147483648"
+        )
+        self.assertEqual(_sleep.call_count, 2)
+
+        self.mock_executor.execute_sql.side_effect = [
+            None,
+            resize_status("Resizing buffer pool failed, out of memory.", "0"),
+        ]
+        with self.assertRaises(MySQLSetVariableError):
+            self.mysql.resize_buffer_pool(2147483648)
+
+        self.mock_executor.execute_sql.side_effect = None
+        self.mock_executor.execute_sql.return_value = resize_status("Resizing.", "1")
+        with self.assertRaises(MySQLSetVariableError):
+            self.mysql.resize_buffer_pool(2147483648, timeout=0)
+
     def test_set_cluster_primary(self):
         """Test set_cluster_primary."""
         commands = [
@@ -1679,13 +2460,50 @@ class TestMySQLBase(unittest.TestCase):
         self.assertEqual(self.mysql.get_primary_label(), "mysql-k8s-1")
 
     @patch("charms.mysql.v0.mysql.RECOVERY_CHECK_TIME", 0.1)
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_recovery_progress")
     @patch("charms.mysql.v0.mysql.MySQLBase.get_member_state")
-    def test_hold_if_recovering(self, mock_get_member_state):
+    def test_hold_if_recovering(self, mock_get_member_state, mock_get_recovery_progress):
         """Test hold_if_recovering."""
         mock_get_member_state.return_value = "ONLINE"
-        self.mysql.hold_if_recovering()
+        self.assertEqual(self.mysql.hold_if_recovering(), "ONLINE")
         self.assertEqual(mock_get_member_state.call_count, 1)
 
+        # progress is reported until ONLINE, with the incremental recovery throughput
+        mock_get_member_state.reset_mock()
+        mock_get_member_state.side_effect = ["RECOVERING", "RECOVERING", "ONLINE"]
+        mock_get_recovery_progress.side_effect = [
+            RecoveryProgress("incremental", 100, 1000),
+            RecoveryProgress("incremental", 200, 1000),
+        ]
+        on_progress = MagicMock()
+
+        self.mysql.hold_if_recovering(on_progress=on_progress)
+
+        self.assertEqual(mock_get_member_state.call_count, 3)
+        self.assertIsNone(on_progress.call_args_list[0].args[0].speed)
+        self.assertGreater(on_progress.call_args_list[1].args[0].speed, 0)
+
+    def test_get_recovery_progress(self):
+        """Test the recovery progress is read from the clone or the recovery channel."""
+        self.mock_executor.execute_sql.side_effect = [
+            [{"stage": "FILE_COPY", "estimate": 1000, "data": 430, "data_speed": 10}]
+        ]
+        progress = self.mysql.get_recovery_progress()
+        self.assertEqual(progress, RecoveryProgress("file copy", 430, 1000, 10.0))
+        self.assertEqual(progress.eta, 57)
+
+        # without clone plugin nor clone running, the recovery channel is read
+        self.mock_executor.execute_sql.side_effect = [
+            ExecutionError,
+            [{"received": "a:1-100", "backlog": "a:61-100"}],
+        ]
+        self.assertEqual(
+            self.mysql.get_recovery_progress(), RecoveryProgress("incremental", 60, 100)
+        )
+
+        self.mock_executor.execute_sql.side_effect = [[], []]
+        self.assertIsNone(self.mysql.get_recovery_progress())
+
     def test_set_instance_offline_mode(self):
         """Test execution of set_instance_offline_mode()."""
         self.mysql.set_instance_offline_mode(True)
@@ -1699,8 +2517,9 @@ class TestMySQLBase(unittest.TestCase):
         with self.assertRaises(MySQLSetInstanceOfflineModeError):
             self.mysql.set_instance_offline_mode(True)
 
+    @patch("charms.mysql.v0.mysql.MySQLBase.get_available_cpus", return_value=8)
     @patch("charms.mysql.v0.mysql.MySQLBase.get_available_memory")
-    def test_render_mysqld_configuration(self, _get_available_memory):
+    def test_render_mysqld_configuration(self, _get_available_memory, _get_available_cpus):
         """Test render_mysqld_configuration."""
         # 32GB of memory, production profile
         _get_available_memory.return_value = 32341442560
@@ -1710,8 +2529,8 @@ class TestMySQLBase(unittest.TestCase):
             "mysqlx_bind_address": "0.0.0.0",
             "admin_address": "127.0.0.1",
             "report_host": "127.0.0.1",
-            "max_connections": "724",
-            "innodb_buffer_pool_size": "23219666944",
+            "max_connections": "735",
+            "innodb_buffer_pool_size": "23085449216",
             "log_error_services": "log_filter_internal;log_sink_internal",
             "log_error": "/var/log/mysql/error.log",
             "general_log": "OFF",
@@ -1723,11 +2542,25 @@ class TestMySQLBase(unittest.TestCase):
             "loose-audit_log_strategy": "ASYNCHRONOUS",
             "loose-audit_log_file": "/var/log/mysql/audit.log",
             "loose-group_replication_paxos_single_leader": "ON",
-            "innodb_buffer_pool_chunk_size": "2902458368",
+            "innodb_buffer_pool_chunk_size": "33554432",
+            "innodb_redo_log_capacity": "5771362304",
             "gtid_mode": "ON",
             "enforce_gtid_consistency": "ON",
             "activate_all_roles_on_login": "ON",
             "max_connect_errors": "10000",
+            "innodb_read_io_threads": "4",
+            "innodb_write_io_threads": "4",
+            "innodb_parallel_read_threads": "4",
+            "innodb_purge_threads": "2",
+            "replica_parallel_workers": "8",
+            "loose-binlog_transaction_dependency_tracking": "WRITESET",
+            "table_open_cache_instances": "8",
+            "loose-clone_max_concurrency": "8",
+            # a 1024th of the memory left after the buffer pool and message cache
+            "loose-clone_buffer_size": "8388608",
+            "loose-clone_max_data_bandwidth": "0",
+            "loose-clone_max_network_bandwidth": "0",
+            "loose-clone_enable_compression": "OFF",
         }
         self.maxDiff = None
 
@@ -1747,6 +2580,8 @@ class TestMySQLBase(unittest.TestCase):
         del expected_config["innodb_buffer_pool_chunk_size"]
         expected_config["performance-schema-instrument"] = "'memory/%=OFF'"
         expected_config["max_connections"] = "127"
+        expected_config["loose-clone_buffer_size"] = "1048576"
+        expected_config["innodb_redo_log_capacity"] = "134217728"
 
         _, rendered_config = self.mysql.render_mysqld_configuration(
             profile="production",
@@ -1763,6 +2598,11 @@ class TestMySQLBase(unittest.TestCase):
         expected_config["innodb_buffer_pool_chunk_size"] = "1048576"
         expected_config["loose-group_replication_message_cache_size"] = "134217728"
         expected_config["max_connections"] = "100"
+        del expected_config["innodb_redo_log_capacity"]
+        for name in CLONE_VARIABLES:
+            del expected_config[f"loose-{name}"]
+        for name in self.mysql.get_thread_parameters(8):
+            del expected_config[name]
 
         _, rendered_config = self.mysql.render_mysqld_configuration(
             profile="testing",
@@ -1801,6 +2641,19 @@ class TestMySQLBase(unittest.TestCase):
 
         self.assertEqual(rendered_config["max_connections"], "800")
 
+        # redo log sized for the observed write rate
+        _, rendered_config = self.mysql.render_mysqld_configuration(
+            profile="production",
+            binlog_retention_days=7,
+            audit_log_enabled=True,
+            audit_log_strategy="async",
+            audit_log_policy="LOGINS",
+            memory_limit=memory_limit,
+            redo_log_write_rate=10 * BYTES_1MB,
+        )
+
+        self.assertEqual(rendered_config["innodb_redo_log_capacity"], "17999855616")
+
     def test_create_replica_cluster(self):
         """Test create_replica_cluster."""
         endpoint = "address:3306"
@@ -1949,34 +2802,100 @@ class TestMySQLBase(unittest.TestCase):
 
         self.assertEqual(self.mysql.get_cluster_set_name(), self.mysql.cluster_set_name)
 
-    @patch("charms.mysql.v0.mysql.MySQLBase._plugin_file_exists", return_value=True)
+    @patch("charms.mysql.v0.mysql.MySQLBase._file_exists", return_value=True)
     @patch("charms.mysql.v0.mysql.MySQLBase._read_only_disabled")
-    def test_install_plugin(self, _read_only_disabled, _plugin_file_exists):
+    def test_install_plugin(self, _read_only_disabled, _file_exists):
         """Test install_plugin."""
+        lookup_queries = [
+            "SELECT @@GLOBAL.`plugin_dir` AS `plugin_dir`",
+            "SELECT name FROM mysql.plugin",
+        ]
+        plugin_dir = [{"plugin_dir": "/plugins"}]
+
         # ensure no install if already installed
-        self.mock_executor.execute_sql.return_value = [{"name": "plugin1"}]
+        self.mock_executor.execute_sql_batch.return_value = [plugin_dir, [{"name": "plugin1"}]]
         self.mysql.install_plugins(["plugin1"])
-        self.mock_executor.execute_sql.assert_has_calls([
-            call("SELECT name FROM mysql.plugin WHERE name LIKE '%'"),
-        ])
-        self.mock_executor.execute_sql.reset_mock()
+        self.mock_executor.execute_sql_batch.assert_called_once_with(lookup_queries)
+        self.mock_executor.execute_sql_batch.reset_mock()
 
         # ensure not installed if unsupported
-        self.mock_executor.execute_sql.return_value = []
+        self.mock_executor.execute_sql_batch.return_value = [plugin_dir, []]
         self.mysql.install_plugins(["plugin1"])
-        self.mock_executor.execute_sql.assert_has_calls([
-            call("SELECT name FROM mysql.plugin WHERE name LIKE '%'"),
+        self.mock_executor.execute_sql_batch.assert_called_once_with(lookup_queries)
+        self.mock_executor.execute_sql_batch.reset_mock()
+
+        # ensure installed, looking up the plugin directory once
+        self.mock_executor.execute_sql_batch.side_effect = [[plugin_dir, []], [[], []]]
+        self.mysql.install_plugins(["audit_log", "binlog_utils_udf"])
+        self.mock_executor.execute_sql_batch.assert_has_calls([
+            call(lookup_queries),
+            call([
+                "INSTALL PLUGIN `audit_log` SONAME 'audit_log.so'",
+                "INSTALL PLUGIN `binlog_utils_udf` SONAME 'binlog_utils_udf.so'",
+            ]),
         ])
-        self.mock_executor.execute_sql.reset_mock()
-
-        # ensure installed
-        self.mock_executor.execute_sql.return_value = []
-        self.mysql.install_plugins(["audit_log"])
-        self.mock_executor.execute_sql.assert_has_calls([
-            call("SELECT name FROM mysql.plugin WHERE name LIKE '%'"),
-            call("INSTALL PLUGIN `audit_log` SONAME 'audit_log.so'"),
+        _file_exists.assert_has_calls([
+            call("/plugins/audit_log.so"),
+            call("/plugins/binlog_utils_udf.so"),
         ])
 
+    def test_read_only_disabled(self):
+        """Test super_read_only is disabled in a single call, and restored afterwards."""
+        self.mock_executor.execute_sql_batch.return_value = [[{"super_read_only": 1}], []]
+
+        with self.mysql._read_only_disabled():
+            self.mock_executor.execute_sql_batch.assert_called_once_with([
+                "SELECT @@GLOBAL.`super_read_only` AS `super_read_only`",
+                "SET @@GLOBAL.`super_read_only` = 'OFF'",
+            ])
+            self.mock_executor.execute_sql.assert_not_called()
+
+        self.mock_executor.execute_sql.assert_called_once_with(
+            "SET @@GLOBAL.`super_read_only` = 1"
+        )
+
+    def test_sql_batch_without_executor_support(self):
+        """Test SQL batches run from MySQL Shell when not supported by the executor."""
+        executor = MagicMock(spec=["execute_py"])
+        executor.execute_py.return_value = '[[{"value": 1}], []]'
+
+        with self.mysql._sql_batch(executor) as batch:
+            index = batch.add("SELECT 1 AS value")
+            batch.add("SET @a = 1")
+
+        self.assertEqual(batch.result(index), [{"value": 1}])
+        self.assertIn("['SELECT 1 AS value', 'SET @a = 1']", executor.execute_py.call_args.args[0])
+
+    def test_probe_instances(self):
+        """Test probing instances concurrently."""
+        release = threading.Event()
+
+        def probe(address):
+            if address == "unreachable":
+                # Left running once the answer is known
+                release.wait(timeout=10)
+            if address == "failing":
+                raise MySQLClusterMetadataExistsError()
+            return address == "found"
+
+        results = self.mysql.probe_instances(
+            probe,
+            ["unreachable", "failing", "missing", "found"],
+            stop_when=bool,
+            ignore=(MySQLClusterMetadataExistsError,),
+        )
+        release.set()
+
+        self.assertTrue(results["found"])
+        self.assertNotIn("unreachable", results)
+        self.assertNotIn("failing", results)
+
+        results = self.mysql.probe_instances(probe, ["missing", "found"])
+        self.assertEqual(results, {"missing": False, "found": True})
+
+        with self.assertRaises(MySQLClusterMetadataExistsError):
+            self.mysql.probe_instances(probe, ["failing"])
+
     @patch("charms.mysql.v0.mysql.MySQLBase._read_only_disabled")
     def test_uninstall_plugin(self, _read_only_disabled):
         """Test uninstall_plugin."""
@@ -0,0 +1,273 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+import stat
+import sys
+import textwrap
+from decimal import Decimal
+from unittest.mock import MagicMock, PropertyMock, call, patch
+
+import mysql.connector
+import pytest
+from charms.mysql.v0.mysql import (
+    HostCircuitBreaker,
+    InstrumentedExecutor,
+    MySQLUnreachableHostError,
+)
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from mysql_shell_executors import HybridExecutor, PersistentExecutor, split_sql_statements
+
+# Minimal stand-in for the MySQL Shell, exposing the objects used by the executor
+FAKE_SHELL = textwrap.dedent(
+    """\
+    #!{python}
+    import json
+    import sys
+
+    host = next((arg[7:] for arg in sys.argv if arg.startswith("--host=")), "localhost")
+
+    class Result:
+        def __init__(self, statement, host):
+            self.statement = statement
+            self.host = host
+
+        def has_data(self):
+            return self.statement.startswith("SELECT")
+
+        def get_columns(self):
+            return [type("Column", (), {{"column_label": "value"}})()]
+
+        def fetch_all(self):
+            if "fail" in self.statement:
+                error = Exception("Lost connection to MySQL server")
+                error.code = 2013
+                raise error
+            if self.statement == "SELECT @@hostname":
+                return [[self.host]]
+            return [[self.statement.split()[-1]]]
+
+    class Session:
+        def __init__(self, host):
+            self.host = host
+            self.open = True
+
+        def is_open(self):
+            return self.open
+
+        def run_sql(self, statement):
+            return Result(statement, self.host)
+
+    class Options:
+        def set(self, *args):
+            pass
+
+    class Shell:
+        options = Options()
+        session = None if host == "unreachable" else Session(host)
+
+        def get_session(self):
+            return self.session
+
+        def set_session(self, session):
+            self.session = session
+
+        def connect_to_primary(self):
+            self.session.open = False
+            self.session = Session("primary")
+
+    password = sys.stdin.readline().strip()
+    if password != "password":
+        sys.exit(1)
+    if not Shell.session:
+        # reported as by the MySQL Shell with JSON output, before reading any command
+        message = "Can't connect to MySQL server on '" + host + ":3306' (111)"
+        print(json.dumps({{"error": {{"code": 2003, "message": message}}}}), flush=True)
+
+    namespace = {{"shell": Shell()}}
+    for line in sys.stdin:
+        exec(line, namespace)
+    """
+)
+
+
+@pytest.fixture
+def executor(tmp_path):
+    shell_path = tmp_path / "mysqlsh"
+    shell_path.write_text(FAKE_SHELL.format(python=sys.executable))
+    shell_path.chmod(shell_path.stat().st_mode | stat.S_IEXEC)
+
+    details = ConnectionDetails(
+        username="user", password="password", host="127.0.0.1", port="3306"
+    )
+    yield PersistentExecutor(details, str(shell_path))
+    PersistentExecutor.close_sessions()
+
+
+def test_split_sql_statements():
+    """Test splitting SQL scripts."""
+    assert split_sql_statements("SELECT 1; SELECT 2;") == ["SELECT 1", "SELECT 2"]
+    assert split_sql_statements("SELECT 'a;b'; SELECT `c;d`") == ["SELECT 'a;b'", "SELECT `c;d`"]
+    assert split_sql_statements("SELECT 'it\\'s;'") == ["SELECT 'it\\'s;'"]
+    assert split_sql_statements("SELECT 1 -- x;y\n; /* ; */") == ["SELECT 1"]
+    assert split_sql_statements(" ; ") == []
+
+
+def test_execute_sql(executor):
+    """Test executing SQL statements through a persistent session."""
+    assert executor.execute_sql("SELECT 1; SET x = 1") == [{"value": "1"}]
+    assert executor.execute_sql("SELECT 2") == [{"value": "2"}]
+    assert executor.execute_sql("SET x = 1") == []
+    assert len(PersistentExecutor._sessions) == 1
+
+
+def test_execute_sql_batch(executor):
+    """Test executing batches of SQL statements through a persistent session."""
+    results = executor.execute_sql_batch(["SELECT 1", "SET x = 1", "SELECT 'a;b'"])
+    assert results == [[{"value": "1"}], [], [{"value": "'a;b'"}]]
+
+
+def test_execute_py(executor):
+    """Test executing Python scripts through a persistent session."""
+    assert executor.execute_py("print('first')\nprint('{\"a\": 1}')") == '{"a": 1}'
+    assert executor.execute_py("x = 1") == "{}"
+
+    with pytest.raises(ExecutionError) as e:
+        executor.execute_py("raise ValueError('failure')")
+
+    assert str(e.value) == "failure"
+
+
+def test_session_respawned_after_connection_loss(executor):
+    """Test sessions are discarded after losing their connection."""
+    executor.execute_sql("SELECT 1")
+    pid = next(iter(PersistentExecutor._sessions.values()))._process.pid
+
+    with pytest.raises(ExecutionError):
+        executor.execute_sql("SELECT fail")
+
+    assert not PersistentExecutor._sessions
+    assert executor.execute_sql("SELECT 3") == [{"value": "3"}]
+    assert next(iter(PersistentExecutor._sessions.values()))._process.pid != pid
+
+
+def test_session_restored_after_reconnecting_script(executor):
+    """Test scripts connecting to other instances leave the session on the original host."""
+    executor.execute_py("shell.set_session(type(shell.get_session())('primary'))")
+    pid = next(iter(PersistentExecutor._sessions.values()))._process.pid
+    assert executor.execute_sql("SELECT @@hostname") == [{"value": "127.0.0.1"}]
+    assert next(iter(PersistentExecutor._sessions.values()))._process.pid == pid
+
+    # the original session is closed by the reconnection
+    executor.execute_py("shell.connect_to_primary()")
+    assert not PersistentExecutor._sessions
+    assert executor.execute_sql("SELECT @@hostname") == [{"value": "127.0.0.1"}]
+    assert next(iter(PersistentExecutor._sessions.values()))._process.pid != pid
+
+
+def test_execute_timeout(executor):
+    """Test timed out requests terminate the session."""
+    with pytest.raises(ExecutionError):
+        executor.execute_py("import time\ntime.sleep(5)", timeout=1)
+
+    assert not PersistentExecutor._sessions
+
+
+def test_connection_failure(executor):
+    """Test failures to start the session."""
+    executor._conn_details.password = "wrong"
+
+    with pytest.raises(ExecutionError):
+        executor.check_connection()
+
+    assert not PersistentExecutor._sessions
+    assert os.path.exists(executor._shell_path)
+
+
+def test_connection_failure_reported(executor):
+    """Test failures to connect report the shell error, opening the host circuit."""
+    executor._conn_details.host = "unreachable"
+    circuit_breaker = HostCircuitBreaker()
+    instrumented = InstrumentedExecutor(executor, circuit_breaker)
+
+    with pytest.raises(ExecutionError) as e:
+        instrumented.execute_py("print('{}')")
+
+    assert str(e.value) == "Can't connect to MySQL server on 'unreachable:3306' (111)"
+    assert "unreachable" in circuit_breaker.tripped_hosts
+
+    with pytest.raises(MySQLUnreachableHostError):
+        instrumented.execute_py("print('{}')")
+
+
+@pytest.fixture
+def connection():
+    cursor = MagicMock()
+    cursor.with_rows = True
+    cursor.column_names = ("value",)
+
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+
+    with patch("mysql.connector.connect", return_value=connection) as connect:
+        yield connect
+    HybridExecutor.close_connections()
+
+
+def test_hybrid_execute_sql(executor, connection):
+    """Test plain SQL is sent through a shared MySQL protocol connection."""
+    cursor = connection.return_value.cursor.return_value
+    cursor.fetchall.return_value = [(Decimal("3"),), (bytearray(b"text"),)]
+
+    hybrid_executor = HybridExecutor(executor.connection_details, executor._shell_path)
+    rows = hybrid_executor.execute_sql("SELECT 'a;b'; SELECT 2")
+
+    assert rows == [{"value": 3}, {"value": "text"}]
+    assert cursor.execute.call_args_list == [call("SELECT 'a;b'"), call("SELECT 2")]
+
+    HybridExecutor(executor.connection_details, executor._shell_path).execute_sql("SELECT 1")
+    connection.assert_called_once_with(
+        user="user",
+        password="password",
+        autocommit=True,
+        connection_timeout=30,
+        host="127.0.0.1",
+        port=3306,
+    )
+    assert not PersistentExecutor._sessions
+
+
+def test_hybrid_execute_sql_batch(executor, connection):
+    """Test SQL batches are demultiplexed per statement."""
+    cursor = connection.return_value.cursor.return_value
+    type(cursor).with_rows = PropertyMock(side_effect=[True, False])
+    cursor.fetchall.return_value = [(1,)]
+
+    hybrid_executor = HybridExecutor(executor.connection_details, executor._shell_path)
+    results = hybrid_executor.execute_sql_batch(["SELECT 1", "SET x = 1"])
+
+    assert results == [[{"value": 1}], []]
+
+
+def test_hybrid_execute_sql_connection_lost(executor, connection):
+    """Test connections are discarded after being lost."""
+    cursor = connection.return_value.cursor.return_value
+    cursor.execute.side_effect = mysql.connector.Error(msg="Lost connection", errno=2013)
+
+    hybrid_executor = HybridExecutor(executor.connection_details, executor._shell_path)
+    with pytest.raises(ExecutionError) as e:
+        hybrid_executor.execute_sql("SELECT 1")
+
+    assert str(e.value) == "Lost connection"
+    assert not HybridExecutor._connections
+    connection.return_value.rollback.assert_called_once()
+
+
+def test_hybrid_execute_py(executor, connection):
+    """Test Python scripts keep running on the MySQL Shell."""
+    hybrid_executor = HybridExecutor(executor.connection_details, executor._shell_path)
+
+    assert hybrid_executor.execute_py("print('{}')") == "{}"
+    connection.assert_not_called()
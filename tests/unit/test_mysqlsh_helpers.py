@@ -3,8 +3,11 @@
 
 """Unit tests for MySQL class."""
 
+import json
 import os
+import pathlib
 import subprocess
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call, mock_open, patch
 
@@ -14,6 +17,7 @@ from charms.mysql.v0.mysql import (
     MySQLGetAvailableMemoryError,
     MySQLStartMySQLDError,
     MySQLStopMySQLDError,
+    StorageProbe,
 )
 
 from constants import (
@@ -29,6 +33,8 @@ from mysql_vm_helpers import (
     MySQLResetRootPasswordAndStartMySQLDError,
     MySQLServiceNotRunningError,
     SnapServiceOperationError,
+    cgroup_files,
+    measure_storage,
     snap_service_operation,
 )
 
@@ -39,6 +45,9 @@ class StubConfig:
         self.profile = "production"
         self.profile_limit_memory = None
         self.experimental_max_connections = None
+        self.experimental_clone_max_concurrency = None
+        self.experimental_clone_max_bandwidth = 100
+        self.experimental_clone_compression = "auto"
         self.plugin_audit_strategy = "async"
         self.binlog_retention_days = 7
         self.logs_audit_policy = "logins"
@@ -47,6 +56,7 @@ class StubConfig:
 class StubCharm:
     def __init__(self):
         self.config = StubConfig()
+        self.unit_peer_data = {}
 
 
 class TestMySQL(unittest.TestCase):
@@ -75,6 +85,21 @@ class TestMySQL(unittest.TestCase):
         with self.assertRaises(MySQLServiceNotRunningError):
             self.mysql.wait_until_mysql_connection()
 
+    @patch("mysql_vm_helpers.MySQL.check_mysqlsh_connection")
+    @patch("socket.create_connection")
+    @patch("os.path.exists", return_value=True)
+    def test_wait_until_mysql_connection_admin_port(
+        self, _exists, _create_connection, _check_mysqlsh_connection
+    ):
+        """Test mysqlsh is only spawned once the admin port accepts connections."""
+        _create_connection.side_effect = [ConnectionRefusedError, MagicMock()]
+
+        with patch("time.sleep"):
+            self.mysql.wait_until_mysql_connection()
+
+        _create_connection.assert_called_with(("127.0.0.1", 33062), timeout=1)
+        _check_mysqlsh_connection.assert_called_once()
+
     @patch("tempfile.NamedTemporaryFile")
     @patch("subprocess.check_output")
     @patch("mysql_vm_helpers.snap_service_operation")
@@ -200,6 +225,8 @@ class TestMySQL(unittest.TestCase):
 
     @patch("shutil.chown")
     @patch("os.chmod")
+    @patch("mysql_vm_helpers.MySQL.get_link_speed", return_value=None)
+    @patch("mysql_vm_helpers.MySQL.get_available_cpus", return_value=4)
     @patch("mysql_vm_helpers.MySQL.get_available_memory", return_value=16475447296)
     @patch(
         "mysql_vm_helpers.MySQL.get_innodb_buffer_pool_parameters",
@@ -215,6 +242,8 @@ class TestMySQL(unittest.TestCase):
         _get_innodb_buffer_pool_parameters,
         _get_max_connections,
         _get_available_memory,
+        _get_available_cpus,
+        _get_link_speed,
         _chmod,
         _chown,
     ):
@@ -251,7 +280,20 @@ class TestMySQL(unittest.TestCase):
             "max_connect_errors = 10000",
             "loose-audit_log_format = JSON",
             "loose-audit_log_strategy = ASYNCHRONOUS",
+            "innodb_redo_log_capacity = 104857600",
             "innodb_buffer_pool_chunk_size = 5678",
+            "innodb_read_io_threads = 4",
+            "innodb_write_io_threads = 4",
+            "innodb_parallel_read_threads = 4",
+            "innodb_purge_threads = 1",
+            "replica_parallel_workers = 4",
+            "loose-binlog_transaction_dependency_tracking = WRITESET",
+            "table_open_cache_instances = 4",
+            "loose-clone_max_concurrency = 4",
+            "loose-clone_buffer_size = 15728640",
+            "loose-clone_max_data_bandwidth = 100",
+            "loose-clone_max_network_bandwidth = 100",
+            "loose-clone_enable_compression = OFF",
             "\n",
         ))
 
@@ -262,6 +304,16 @@ class TestMySQL(unittest.TestCase):
         _get_available_memory.assert_called_once()
 
         assert call().write(config) in _open_mock.mock_calls
+        self.assertEqual(
+            json.loads(self.mysql.charm.unit_peer_data["clone-variables"]),
+            {
+                "clone_max_concurrency": "4",
+                "clone_buffer_size": "15728640",
+                "clone_max_data_bandwidth": "100",
+                "clone_max_network_bandwidth": "100",
+                "clone_enable_compression": "OFF",
+            },
+        )
 
         # Test `testing` profile
         self.mysql.charm.config.profile = "testing"
@@ -272,6 +324,10 @@ class TestMySQL(unittest.TestCase):
             call(f"{MYSQLD_CONFIG_DIRECTORY}/z-custom-mysqld.cnf", "w", encoding="utf-8")
             in _open_mock.mock_calls
         )
+        self.assertEqual(
+            set(json.loads(self.mysql.charm.unit_peer_data["clone-variables"]).values()),
+            {"DEFAULT"},
+        )
 
     @patch(
         "mysql_vm_helpers.MySQL.get_innodb_buffer_pool_parameters",
@@ -440,6 +496,22 @@ class TestMySQL(unittest.TestCase):
         _mysql_snap.alias.assert_any_call("xtrabackup")
         _mysql_snap.alias.assert_any_call("mysqlbinlog")
 
+    @patch("pathlib.Path.read_text", return_value="1000\n")
+    @patch("subprocess.check_output")
+    def test_get_link_speed(self, _check_output, _read_text):
+        """Test the link speed is read for the interface holding the instance address."""
+        _check_output.return_value = json.dumps([
+            {"ifname": "lo", "addr_info": [{"local": "127.0.0.2"}]},
+            {"ifname": "eth0", "addr_info": [{"local": "127.0.0.1"}]},
+        ])
+        self.assertEqual(self.mysql.get_link_speed(), 1000)
+
+        _read_text.side_effect = OSError
+        self.assertIsNone(self.mysql.get_link_speed())
+
+        _check_output.return_value = "[]"
+        self.assertIsNone(self.mysql.get_link_speed())
+
     def test_get_available_memory(self):
         meminfo = (
             "MemTotal:       16089488 kB"
@@ -451,7 +523,10 @@ class TestMySQL(unittest.TestCase):
             "Active:         11890336 kB"
         )
 
-        with patch("builtins.open", mock_open(read_data=meminfo)):
+        with (
+            patch("builtins.open", mock_open(read_data=meminfo)),
+            patch("mysql_vm_helpers.cgroup_files", return_value=[]),
+        ):
             self.assertEqual(self.mysql.get_available_memory(), 16475635712)
 
         with (
@@ -460,6 +535,76 @@ class TestMySQL(unittest.TestCase):
         ):
             self.mysql.get_available_memory()
 
+    def test_cgroup_limits(self):
+        """Test memory and CPUs are limited by the cgroups of the process, v1 or v2."""
+        with tempfile.TemporaryDirectory() as mount:
+            container = pathlib.Path(mount, "lxc.payload")
+            container.mkdir()
+            (container / "memory.max").write_text("4294967296\n")
+            (container / "cpu.max").write_text("150000 100000\n")
+            (pathlib.Path(mount) / "memory.max").write_text("max\n")
+            v1 = pathlib.Path(mount, "cpu,cpuacct", "lxc.payload")
+            v1.mkdir(parents=True)
+            (v1 / "cpu.cfs_quota_us").write_text("-1\n")
+            (v1 / "cpu.cfs_period_us").write_text("100000\n")
+
+            cgroups = "0::/lxc.payload\n4:cpu,cpuacct:/lxc.payload\n"
+            read_text = pathlib.Path.read_text
+            with (
+                patch("mysql_vm_helpers.CGROUP_MOUNT", mount),
+                patch("pathlib.Path.read_text", autospec=True) as _read_text,
+            ):
+                _read_text.side_effect = lambda path: (
+                    cgroups if str(path) == "/proc/self/cgroup" else read_text(path)
+                )
+                self.assertEqual(
+                    cgroup_files("memory", "memory.max", "memory.limit_in_bytes"),
+                    [container / "memory.max", pathlib.Path(mount, "memory.max")],
+                )
+
+                with patch("builtins.open", mock_open(read_data="MemTotal: 16089488 kB")):
+                    self.assertEqual(self.mysql.get_available_memory(), 4294967296)
+                with patch("os.sched_getaffinity", return_value=set(range(8))):
+                    self.assertEqual(self.mysql.get_available_cpus(), 2)
+
+    @patch("mysql_vm_helpers.STORAGE_PROBE_DURATION", 0.05)
+    def test_measure_storage(self):
+        """Test the storage benchmark is bounded and leaves no file behind."""
+        with tempfile.TemporaryDirectory() as directory:
+            storage_probe = measure_storage(directory)
+
+            self.assertEqual(os.listdir(directory), [])
+
+        self.assertGreater(storage_probe.random_write_iops, 0)
+        self.assertGreater(storage_probe.fsync_latency, 0)
+        self.assertGreater(storage_probe.sequential_throughput, 0)
+
+    @patch("mysql_vm_helpers.STORAGE_PROBE_DURATION", 0)
+    def test_measure_storage_slow(self):
+        """Test each storage measurement makes at least one write, however slow."""
+        with tempfile.TemporaryDirectory() as directory:
+            storage_probe = measure_storage(directory)
+
+        self.assertGreater(storage_probe.random_write_iops, 0)
+        self.assertGreater(storage_probe.sequential_throughput, 0)
+
+    @patch("mysql_vm_helpers.measure_storage")
+    def test_probe_storage(self, _measure_storage):
+        """Test the storage is probed once, the results being cached in the peer data."""
+        _measure_storage.return_value = StorageProbe(3000, 0.002, 125000000)
+
+        self.mysql.probe_storage()
+        self.mysql.probe_storage()
+
+        _measure_storage.assert_called_once()
+        self.assertEqual(self.mysql.get_storage_probe(), StorageProbe(3000, 0.002, 125000000))
+
+        # defaults are kept when the storage cannot be probed
+        self.mysql.charm.unit_peer_data.clear()
+        _measure_storage.side_effect = OSError
+        self.mysql.probe_storage()
+        self.assertIsNone(self.mysql.get_storage_probe())
+
     @patch("shutil.rmtree")
     @patch("os.makedirs")
     @patch("shutil.chown")